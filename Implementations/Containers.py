@@ -0,0 +1,155 @@
+"""
+Created on Tue Oct 20 00:41:36 2026
+
+Streaming construction and bulk export shared by the Queue and Stack implementations.
+
+"""
+from array import array
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from .Features import add_feature, register_feature, remove_feature
+
+OVERFLOW_POLICIES = ("raise", "truncate", "block")
+
+# Marks the end of an iterator.
+_EXHAUSTED = object()
+
+
+def bounded(vals: Iterable, capacity: int, kind: str) -> Iterator:
+    """Yield the elements of vals, raising an AssertionError once more than capacity elements are consumed."""
+    for count, val in enumerate(vals):
+        assert count < capacity, f"Cannot create {kind} with more than {capacity} elements."
+        yield val
+
+
+def _feeding_class(cls: type) -> type:
+    """Return a subclass of cls that pulls a new element from its source whenever an element is removed."""
+    remove = getattr(cls, cls._remove)
+
+    def take(self) -> Any:
+        element = remove(self)
+        self._feed()
+        return element
+
+    def delete(self) -> None:
+        cls.delete(self)
+        self._stop_feeding()
+
+    namespace = {cls._remove: take, "delete": delete}
+    for name, method in namespace.items():
+        method.__name__ = name
+        method.__doc__ = getattr(cls, name).__doc__
+    namespace["__module__"] = cls.__module__
+    return type(f"Feeding{cls.__name__}", (cls,), namespace)
+
+
+register_feature("feeding", _feeding_class)
+
+
+class ContainerMixin:
+    """Methods shared by queues and stacks, written against the name of their add and remove methods.
+
+    Subclasses set `_kind` to the name used in error messages, and `_add` and `_remove` to the names of the methods adding and removing a single element, e.g. "enqueue" and "dequeue".
+    """
+
+    _kind = "container"
+    _add = None
+    _remove = None
+
+    @classmethod
+    def from_iter(cls, iterable: Iterable, capacity: int = None, on_overflow: str = "raise", **kwargs):
+        """Create an instance from any iterable, consuming it lazily and enforcing the capacity while it's consumed.
+
+        Parameters
+        ----------
+        iterable: iterable
+            The elements, e.g. a generator reading a file.
+
+        capacity: int
+            Determine the maximum amount of elements the instance can carry. If unspecified, its capacity will be limitless.
+            default = None
+
+        on_overflow: str
+            What to do when the iterable has more elements than the capacity:
+            "raise" raises an AssertionError, "truncate" ignores the remaining elements without consuming them, and "block" keeps the remaining elements in the iterable and pulls the next one every time an element is removed with dequeue() or pop(), until the iterable is exhausted or delete() is called.
+            A stack pushes the pulled elements on top of the others, so with "block" the elements that were there first stay buried until the iterable is exhausted.
+            default = "raise"
+
+        kwargs:
+            Other parameters of the class, e.g. `pool` or `memory_limit`.
+
+        Returns
+        -------
+        instance: Queue or Stack
+        """
+
+        if on_overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"on_overflow must be one of {OVERFLOW_POLICIES}.")
+        if not hasattr(iterable, "__iter__"):
+            raise TypeError("iterable is not iterable")
+
+        struct = cls(capacity, **kwargs)
+        add = getattr(struct, cls._add)
+        iterator = iter(iterable)
+        for element in iterator if capacity is None else islice(iterator, capacity):
+            add(element)
+
+        if capacity is not None and struct.full():
+            if on_overflow == "raise":
+                assert (
+                    next(iterator, _EXHAUSTED) is _EXHAUSTED
+                ), f"Cannot create {cls._kind} with more than {capacity} elements."
+            elif on_overflow == "block":
+                struct._source = iterator
+                add_feature(struct, "feeding")
+        return struct
+
+    def _feed(self) -> None:
+        """Pull elements from the source iterator until the structure is full again."""
+        source = self._source
+        add = getattr(self, self._add)
+        while source is not None and not self.full():
+            element = next(source, _EXHAUSTED)
+            if element is _EXHAUSTED:
+                self._stop_feeding()
+                return
+            add(element)
+
+    def _stop_feeding(self) -> None:
+        """Drop the source iterator and go back to the class without feeding."""
+        self._source = None
+        remove_feature(self, "feeding")
+
+    def _drain_count(self, n: int) -> int:
+        """Validate the n parameter of drain(), and return the amount of elements to remove."""
+        if n is None:
+            return len(self)
+        if not isinstance(n, int):
+            raise TypeError("n must be of type 'int'.")
+        if n < 0:
+            raise ValueError("n must be a non-negative int.")
+        return min(n, len(self))
+
+    def to_array(self, typecode: str = "d") -> array:
+        """Export numeric elements to a typed array, which exposes a buffer to memoryview() and numpy.frombuffer() without another copy.
+
+        Parameters
+        ----------
+        typecode: str
+            The type of the array items, see the array module.
+            default = "d"
+
+        Returns
+        -------
+        elements: array
+            The elements, in the order of to_list().
+        """
+
+        return array(typecode, self.to_list())
+
+    def __array__(self, dtype=None, copy=None):
+        # Only NumPy calls this, so it's already imported.
+        import numpy
+
+        return numpy.array(self.to_list(), dtype=dtype)
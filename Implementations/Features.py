@@ -0,0 +1,64 @@
+"""
+Created on Mon Oct 19 23:02:17 2026
+
+Opt-in features of the data structures, turned on and off by swapping the class of a structure for a generated subclass.
+
+"""
+from typing import Any, Callable, Dict, FrozenSet, Tuple
+
+# Factories building the subclass of a feature from the class it wraps, in registration order.
+_FACTORIES: Dict[str, Callable[[type], type]] = {}
+
+# Generated classes, by the plain class and the set of features they have, and the other way around.
+_CLASSES: Dict[Tuple[type, FrozenSet[str]], type] = {}
+_KEYS: Dict[type, Tuple[type, FrozenSet[str]]] = {}
+
+
+def register_feature(name: str, factory: Callable[[type], type]) -> None:
+    """Declare a feature, factory(cls) returns a subclass of cls adding the feature on top of it.
+
+    The subclass must reach the wrapped methods through cls, never through a hard-coded class, so features can be stacked in any combination.
+    """
+
+    if name in _FACTORIES:
+        raise ValueError(f"Feature '{name}' is already registered.")
+    _FACTORIES[name] = factory
+
+
+def _class_for(plain: type, features: FrozenSet[str]) -> type:
+    """Return the class of plain with features, created once per combination.
+
+    Features are always stacked in registration order, so the same combination gives the same class whatever order the features were turned on in.
+    """
+
+    if not features:
+        return plain
+
+    key = (plain, features)
+    if key not in _CLASSES:
+        outermost = [name for name in _FACTORIES if name in features][-1]
+        cls = _FACTORIES[outermost](_class_for(plain, features - {outermost}))
+        _CLASSES[key] = cls
+        _KEYS[cls] = key
+    return _CLASSES[key]
+
+
+def plain_class(cls: type) -> type:
+    """Return the class a generated class was derived from, or cls itself."""
+    return _KEYS[cls][0] if cls in _KEYS else cls
+
+
+def features(struct: Any) -> FrozenSet[str]:
+    """Return the names of the features turned on for struct."""
+    cls = type(struct)
+    return _KEYS[cls][1] if cls in _KEYS else frozenset()
+
+
+def add_feature(struct: Any, name: str) -> None:
+    """Swap the class of struct for one that also has the feature name."""
+    struct.__class__ = _class_for(plain_class(type(struct)), features(struct) | {name})
+
+
+def remove_feature(struct: Any, name: str) -> None:
+    """Swap the class of struct for one with the same features except name, which may be turned on in any order."""
+    struct.__class__ = _class_for(plain_class(type(struct)), features(struct) - {name})
@@ -0,0 +1,460 @@
+"""
+Created on Mon Oct 19 21:24:09 2026
+
+Bloom filters used as an opt-in front of the membership tests of the data structures, so most misses are answered without scanning the elements.
+
+"""
+import math
+from typing import Any, Dict, Iterable
+
+from .Features import add_feature, register_feature, remove_feature
+
+_MASK = (1 << 64) - 1
+
+# Largest value of a counter of a CountingBloomFilter, a saturated counter is never decremented again.
+_SATURATED = 255
+
+
+class BloomFilter:
+    """Approximate set membership in constant time and a few bits per element.
+
+    might_contain() never answers False for an added element, and answers True for a missing element with a probability close to `fp_rate` as long as at most `capacity` elements were added.
+    Elements are located by their hash(), so elements that compare equal must have equal hashes, which holds for all hashable builtins. Unhashable elements are counted, and while one is present every probe answers True.
+    Elements can't be removed: discard() only forgets their count, their bits stay set.
+
+    Parameters
+    ----------
+    capacity: int
+        The amount of elements the filter is sized for.
+
+    fp_rate: float
+        The target false positive rate, between 0 and 1.
+        default = 0.01
+
+    Methods
+    -------
+    add(element) -> None:
+        Add an element to the filter.
+
+    discard(element) -> None:
+        Record an element being removed.
+
+    might_contain(element) -> bool:
+        Check if the element may have been added.
+
+    clear() -> None:
+        Remove all elements.
+
+    stats() -> dict:
+        Return the size and usage of the filter.
+    """
+
+    def __init__(self, capacity: int, fp_rate: float = 0.01) -> None:
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("capacity must be a positive int.")
+        if not 0 < fp_rate < 1:
+            raise ValueError("fp_rate must be between 0 and 1.")
+
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        # Optimal amount of bits and hash functions for the capacity and false positive rate.
+        self._size = max(8, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._allocate()
+        self.count = 0
+        self.unhashable = 0
+        self.rejected = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _allocate(self) -> None:
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _positions(self, element: Any) -> Iterable[int]:
+        """The positions of an element in the filter, from two mixed halves of its hash (double hashing)."""
+        h = (hash(element) & _MASK) * 0x9E3779B97F4A7C15 & _MASK
+        h ^= h >> 31
+        first = h & 0xFFFFFFFF
+        step = h >> 32 | 1
+        size = self._size
+        return ((first + i * step) % size for i in range(self._hashes))
+
+    def add(self, element: Any) -> None:
+        """Add an element to the filter."""
+        self.count += 1
+        try:
+            positions = self._positions(element)
+        except TypeError:
+            self.unhashable += 1
+            return
+
+        bits = self._bits
+        for position in positions:
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def discard(self, element: Any) -> None:
+        """Record an element being removed, its bits stay set."""
+        self.count -= 1
+        try:
+            hash(element)
+        except TypeError:
+            self.unhashable -= 1
+
+    def might_contain(self, element: Any) -> bool:
+        """Check if the element may have been added, False means it surely wasn't."""
+        if self.unhashable:
+            return True
+        try:
+            positions = self._positions(element)
+        except TypeError:
+            return True
+
+        bits = self._bits
+        for position in positions:
+            if not bits[position >> 3] & 1 << (position & 7):
+                self.rejected += 1
+                return False
+        return True
+
+    def clear(self) -> None:
+        """Remove all elements."""
+        self._allocate()
+        self.count = 0
+        self.unhashable = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the size and usage of the filter.
+
+        Returns
+        -------
+        stats: dict
+            "capacity", "count" (elements currently added), "fp_rate" (the target rate), "hashes", "bytes" (the filter storage) and "rejected" (probes answered False).
+        """
+
+        return {
+            "capacity": self.capacity,
+            "count": self.count,
+            "fp_rate": self.fp_rate,
+            "hashes": self._hashes,
+            "bytes": len(self._bits),
+            "rejected": self.rejected,
+        }
+
+
+class CountingBloomFilter(BloomFilter):
+    """Bloom filter that supports removals, each position is a one byte counter instead of a bit.
+
+    Removing an element decrements its counters, so the false positive rate doesn't grow as elements come and go. Counters that reach 255 stay there.
+
+    Parameters
+    ----------
+    capacity: int
+        The amount of elements the filter is sized for.
+
+    fp_rate: float
+        The target false positive rate, between 0 and 1.
+        default = 0.01
+
+    Methods
+    -------
+    add(element) -> None:
+        Add an element to the filter.
+
+    discard(element) -> None:
+        Remove an added element from the filter.
+
+    might_contain(element) -> bool:
+        Check if the element may have been added.
+
+    clear() -> None:
+        Remove all elements.
+
+    stats() -> dict:
+        Return the size and usage of the filter.
+    """
+
+    def _allocate(self) -> None:
+        self._bits = bytearray(self._size)
+
+    def add(self, element: Any) -> None:
+        """Add an element to the filter."""
+        self.count += 1
+        try:
+            positions = self._positions(element)
+        except TypeError:
+            self.unhashable += 1
+            return
+
+        counters = self._bits
+        for position in positions:
+            if counters[position] < _SATURATED:
+                counters[position] += 1
+
+    def discard(self, element: Any) -> None:
+        """Remove an added element from the filter, elements that weren't added must not be discarded."""
+        self.count -= 1
+        try:
+            positions = self._positions(element)
+        except TypeError:
+            self.unhashable -= 1
+            return
+
+        counters = self._bits
+        for position in positions:
+            if 0 < counters[position] < _SATURATED:
+                counters[position] -= 1
+
+    def might_contain(self, element: Any) -> bool:
+        """Check if the element may have been added, False means it surely wasn't."""
+        if self.unhashable:
+            return True
+        try:
+            positions = self._positions(element)
+        except TypeError:
+            return True
+
+        counters = self._bits
+        for position in positions:
+            if not counters[position]:
+                self.rejected += 1
+                return False
+        return True
+
+
+def _struct_values(struct: Any) -> Iterable[Any]:
+    """Iterate over the elements of a linked list, a queue or a stack."""
+    if hasattr(struct, "_values"):
+        return struct._values()
+    return (node.data for node in struct._nodes())
+
+
+def _rebuild(struct: Any) -> None:
+    """Replace the filter of a structure with one sized for twice its current length."""
+    old = struct._filter
+    new = type(old)(max(old.capacity, 2 * len(struct)), old.fp_rate)
+    for element in _struct_values(struct):
+        new.add(element)
+    new.rejected = old.rejected
+    struct._filter = new
+
+
+def _added(struct: Any, element: Any) -> None:
+    filter_ = struct._filter
+    filter_.add(element)
+    if filter_.count > filter_.capacity:
+        _rebuild(struct)
+
+
+_FILTERED_CURSORS = {}
+
+
+def _filtered_cursor_class(cls: type) -> type:
+    """Return a subclass of a Cursor class that keeps the filter of its list up to date, created once per class."""
+    if cls not in _FILTERED_CURSORS:
+
+        def insert_before(self, val):
+            cls.insert_before(self, val)
+            _added(self._list, val)
+            return self
+
+        def insert_after(self, val):
+            cls.insert_after(self, val)
+            _added(self._list, val)
+            return self
+
+        def remove_current(self):
+            val = cls.remove_current(self)
+            self._list._filter.discard(val)
+            return val
+
+        def replace(self, val):
+            old = self.value
+            cls.replace(self, val)
+            self._list._filter.discard(old)
+            _added(self._list, val)
+            return self
+
+        namespace = {
+            "insert_before": insert_before,
+            "insert_after": insert_after,
+            "remove_current": remove_current,
+            "replace": replace,
+        }
+        for method in namespace.values():
+            method.__doc__ = getattr(cls, method.__name__).__doc__
+        namespace["__module__"] = cls.__module__
+        _FILTERED_CURSORS[cls] = type(f"Filtered{cls.__name__}", (cls,), namespace)
+
+    return _FILTERED_CURSORS[cls]
+
+
+def _filtered_class(cls: type) -> type:
+    """Return a subclass of a linked list, queue or stack class that keeps a Bloom filter of its elements in front of __contains__.
+
+    Every method adding elements updates the filter, so it never misses an element. Removals that can't be tracked cheaply only leave stale entries behind, which cost false positives but no wrong answers.
+    """
+
+    namespace = {}
+
+    def __contains__(self, element, **kwargs) -> bool:
+        # A key lookup compares element with key(value), so the filter of the values can't answer it.
+        if kwargs.get("key") is None and not self._filter.might_contain(element):
+            return False
+        return cls.__contains__(self, element, **kwargs)
+
+    namespace["__contains__"] = __contains__
+
+    # DoublyLL.insert() and insert_node() both go through _insert(), so only the latter is wrapped.
+    for name in ("_insert", "insert", "enqueue", "push"):
+        if hasattr(cls, name):
+
+            def add(self, element, *args, _method=getattr(cls, name), **kwargs):
+                result = _method(self, element, *args, **kwargs)
+                _added(self, element)
+                return result
+
+            namespace[name] = add
+            break
+
+    # Removals returning the removed element.
+    for name in ("dequeue", "remove_node"):
+        if hasattr(cls, name):
+
+            def take(self, *args, _method=getattr(cls, name), **kwargs):
+                element = _method(self, *args, **kwargs)
+                self._filter.discard(element)
+                return element
+
+            namespace[name] = take
+
+    if hasattr(cls, "_nodes"):
+        # Linked lists: pop() returns the list, so the value is read before.
+
+        def pop(self, index: int = None):
+            if self.head is None:
+                return cls.pop(self, index)
+
+            position = self._length - 1 if index is None else index
+            self._validate_index(position)
+            if position in (-1, self._length - 1):
+                element = self.tail.data
+            else:
+                element = self[position].data
+            cls.pop(self, index)
+            self._filter.discard(element)
+            return self
+
+        def remove(self, val, *, key=None, identity=False):
+            if key is None:
+                cls.remove(self, val, identity=identity)
+                # The removed element is val or equal to it, so they have the same hash.
+                self._filter.discard(val)
+                return self
+
+            # Only key(element) is known to equal val, so the element is found first.
+            element = next((node.data for node in self._nodes() if key(node.data) == val), None)
+            cls.remove(self, val, key=key, identity=identity)
+            self._filter.discard(element)
+            return self
+
+        def insert_many(self, items):
+            items = list(items)
+            cls.insert_many(self, items)
+            filter_ = self._filter
+            for _, val in items:
+                filter_.add(val)
+            if filter_.count > filter_.capacity:
+                _rebuild(self)
+            return self
+
+        def pop_many(self, indices):
+            vals = cls.pop_many(self, indices)
+            for val in vals:
+                self._filter.discard(val)
+            return vals
+
+        def filter_inplace(self, pred):
+            cls.filter_inplace(self, pred)
+            _rebuild(self)
+            return self
+
+        def cursor(self, at: int = 0):
+            cursor = cls.cursor(self, at)
+            cursor.__class__ = _filtered_cursor_class(type(cursor))
+            return cursor
+
+        namespace.update(
+            pop=pop,
+            remove=remove,
+            insert_many=insert_many,
+            pop_many=pop_many,
+            filter_inplace=filter_inplace,
+            cursor=cursor,
+        )
+
+    elif hasattr(cls, "pop"):
+
+        def pop(self):
+            element = cls.pop(self)
+            self._filter.discard(element)
+            return element
+
+        namespace["pop"] = pop
+
+    def delete(self) -> None:
+        cls.delete(self)
+        self._filter.clear()
+
+    namespace["delete"] = delete
+
+    for name, method in namespace.items():
+        method.__name__ = name
+        method.__doc__ = getattr(cls, name).__doc__
+    namespace["__module__"] = cls.__module__
+    return type(f"Filtered{cls.__name__}", (cls,), namespace)
+
+
+register_feature("filter", _filtered_class)
+
+
+def enable_filter(struct: Any, fp_rate: float = 0.01, counting: bool = True) -> BloomFilter:
+    """Put a Bloom filter in front of the membership tests of a linked list, queue or stack, and return it.
+
+    The structure class is swapped for a filtered subclass, so structures without a filter run the original methods without any extra work.
+    The filter grows, rebuilding itself from the elements, whenever it holds more elements than it was sized for.
+
+    Parameters
+    ----------
+    struct: LinkedList, Queue or Stack
+        The structure, it keeps the filter until disable_filter() is called.
+
+    fp_rate: float
+        The target false positive rate, between 0 and 1.
+        default = 0.01
+
+    counting: bool
+        Whether to use a CountingBloomFilter, which stays accurate as elements are removed, or a BloomFilter, which takes 8 times less memory but whose false positive rate grows with removals until it's rebuilt.
+        default = True
+
+    Returns
+    -------
+    filter: BloomFilter
+    """
+
+    if not hasattr(struct, "_filter"):
+        cls = CountingBloomFilter if counting else BloomFilter
+        filter_ = cls(max(64, 2 * len(struct)), fp_rate)
+        for element in _struct_values(struct):
+            filter_.add(element)
+        struct._filter = filter_
+        add_feature(struct, "filter")
+    return struct._filter
+
+
+def disable_filter(struct: Any) -> BloomFilter:
+    """Remove the Bloom filter of a structure and return it, None if it had none."""
+    filter_ = struct.__dict__.pop("_filter", None)
+    if filter_ is not None:
+        remove_feature(struct, "filter")
+    return filter_
@@ -4,13 +4,27 @@ Author: Ahmad Elkholi
 Created on Fri Feb 25 16:58:57 2022
 
 """
+import time
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from .Features import add_feature, plain_class, register_feature, remove_feature
+from .Filters import BloomFilter, disable_filter, enable_filter
+from .Memory import payload_size, shallow_size, with_total
+
+# Marks a missing argument where None is a valid value.
+_MISSING = object()
+
+# Operations recorded by an instrumented linked list.
+INSTRUMENTED_OPERATIONS = ("insert", "pop", "remove", "__getitem__", "__contains__")
 
 
 class Node:
     """Create a linked list node"""
 
+    # The list a node handle belongs to, only set on nodes returned by DoublyLL.insert_node().
+    owner = None
+
     def __init__(self, data: Any = None) -> None:
         self.data = data
         self.next = None
@@ -23,14 +37,261 @@ class Node:
         return self.data == __o.data if isinstance(__o, Node) else False
 
 
+class NodePool:
+    """Bounded pool of detached nodes, reused by linked lists instead of allocating new ones.
+
+    A pool can be shared by several SinglyLL and DoublyLL instances. Released nodes have their data and links cleared, so the pool never keeps payloads alive.
+    Nodes of a list that uses a pool are recycled once they are popped or removed, so references to them must not be kept. Node handles returned by DoublyLL.insert_node() are the exception, they're never recycled.
+
+    Parameters
+    ----------
+    max_size: int
+        The maximum amount of idle nodes kept in the pool, extra released nodes are left to the garbage collector.
+        default = 1024
+
+    Methods
+    -------
+    acquire(data) -> Node:
+        Return a node containing data, reusing an idle node if possible.
+
+    release(node) -> None:
+        Clear a detached node and keep it for reuse.
+
+    stats() -> dict:
+        Return the pool statistics.
+
+    clear() -> None:
+        Drop all idle nodes.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        if not isinstance(max_size, int):
+            raise TypeError("max_size must be of type 'int'.")
+        if max_size < 0:
+            raise ValueError("max_size must be a non-negative int.")
+
+        self.max_size = max_size
+        self._nodes: List[Node] = []
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def acquire(self, data: Any = None) -> Node:
+        """Return a node containing data, reusing an idle node if possible."""
+        if self._nodes:
+            self.hits += 1
+            node = self._nodes.pop()
+            node.data = data
+            return node
+
+        self.misses += 1
+        return Node(data)
+
+    def release(self, node: Node) -> None:
+        """Clear a detached node and keep it for reuse."""
+        node.data = node.next = node.prev = None
+        if len(self._nodes) < self.max_size:
+            self._nodes.append(node)
+            self.released += 1
+        else:
+            self.dropped += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return the pool statistics."""
+        return {
+            "size": len(self._nodes),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "released": self.released,
+            "dropped": self.dropped,
+        }
+
+    def clear(self) -> None:
+        """Drop all idle nodes."""
+        self._nodes = []
+
+
+def _discard_node(node: Node, pool: NodePool) -> None:
+    """Detach a node removed from a list and give it back to the pool.
+
+    A node handed out by DoublyLL.insert_node() is never reused, since its caller may still hold it: it's only invalidated and left to the garbage collector.
+    """
+
+    if node.owner is not None:
+        node.owner = None
+        node.next = node.prev = None
+    elif pool is not None:
+        pool.release(node)
+    else:
+        node.next = node.prev = None
+
+
+class Instrumentation:
+    """Per-operation statistics of an instrumented linked list.
+
+    For every operation, it counts the calls, the nodes walked and the time spent, and keeps power-of-two histograms of both the nodes walked and the latency (in microseconds) per call.
+
+    Parameters
+    ----------
+    callback: callable
+        Called after every recorded operation with (operation, nodes_walked, seconds). If unspecified, statistics are only accumulated.
+        default = None
+
+    Methods
+    -------
+    snapshot() -> dict:
+        Return a copy of the statistics of every operation.
+
+    reset() -> None:
+        Clear all statistics.
+    """
+
+    def __init__(self, callback: Callable[[str, int, float], Any] = None) -> None:
+        self.callback = callback
+        self.walked = 0
+        self._depth = 0
+        self._stats: Dict[str, dict] = {}
+        self.reset()
+
+    @staticmethod
+    def _bucket(value: int) -> str:
+        """Label of the power-of-two histogram bucket containing value."""
+        if value < 2:
+            return str(value)
+        low = 1 << (value.bit_length() - 1)
+        return f"{low}-{2 * low - 1}"
+
+    def record(self, operation: str, walked: int, seconds: float) -> None:
+        """Add a single call of an operation to the statistics."""
+        stats = self._stats[operation]
+        stats["calls"] += 1
+        stats["nodes_walked"] += walked
+        stats["total_seconds"] += seconds
+        stats["max_seconds"] = max(stats["max_seconds"], seconds)
+
+        walk_bucket = self._bucket(walked)
+        stats["walk_histogram"][walk_bucket] = stats["walk_histogram"].get(walk_bucket, 0) + 1
+        latency_bucket = self._bucket(int(seconds * 1e6))
+        stats["latency_histogram_us"][latency_bucket] = (
+            stats["latency_histogram_us"].get(latency_bucket, 0) + 1
+        )
+
+        if self.callback is not None:
+            self.callback(operation, walked, seconds)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Return a copy of the statistics of every operation."""
+        return {
+            operation: dict(
+                stats,
+                walk_histogram=dict(stats["walk_histogram"]),
+                latency_histogram_us=dict(stats["latency_histogram_us"]),
+            )
+            for operation, stats in self._stats.items()
+        }
+
+    def reset(self) -> None:
+        """Clear all statistics."""
+        self._stats = {
+            operation: {
+                "calls": 0,
+                "nodes_walked": 0,
+                "total_seconds": 0.0,
+                "max_seconds": 0.0,
+                "walk_histogram": {},
+                "latency_histogram_us": {},
+            }
+            for operation in INSTRUMENTED_OPERATIONS
+        }
+
+
+def _instrumented_operation(operation: str, method: Callable) -> Callable:
+    """Wrap a linked list method to record its calls on the list instrumentation.
+
+    Operations called by other operations (e.g. insert calling __getitem__) are counted as part of the outer call only.
+    """
+
+    def wrapper(self, *args, **kwargs):
+        instrumentation = self._instrumentation
+        if instrumentation._depth:
+            return method(self, *args, **kwargs)
+
+        instrumentation._depth = 1
+        instrumentation.walked = 0
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            instrumentation._depth = 0
+            instrumentation.record(operation, instrumentation.walked, seconds)
+
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+def _instrumented_class(cls: type) -> type:
+    """Return a subclass of cls that records its operations."""
+
+    def __getitem__(self, index: int) -> Node:
+        node = cls.__getitem__(self, index)
+        self._instrumentation.walked += index if index >= 0 else max(0, self._length + index)
+        return node
+
+    def __next__(self) -> Node:
+        node = cls.__next__(self)
+        self._instrumentation.walked += 1
+        return node
+
+    namespace = {
+        operation: _instrumented_operation(operation, getattr(cls, operation))
+        for operation in INSTRUMENTED_OPERATIONS
+    }
+    namespace["__getitem__"] = _instrumented_operation("__getitem__", __getitem__)
+    namespace["__next__"] = __next__
+    namespace["__module__"] = cls.__module__
+    return type(f"Instrumented{cls.__name__}", (cls,), namespace)
+
+
+register_feature("instrumentation", _instrumented_class)
+
+
+def _matcher(val: Any, key: Callable[[Any], Any] = None, identity: bool = False) -> Callable[[Any], bool]:
+    """Return the predicate telling whether the value of a node matches val.
+
+    Values are compared with == by default, with `identity` only the object val itself matches, and with `key` val is compared with key(value).
+    """
+    if key is not None:
+        if identity:
+            raise ValueError("key and identity can't be used together.")
+        if not callable(key):
+            raise TypeError("key must be callable.")
+        return lambda data: key(data) == val
+    if identity:
+        return lambda data: data is val
+    return lambda data: data == val
+
+
 class LinkedList(ABC):
     """Base Class for linked lists implementations"""
 
-    def __init__(self, vals: List[Any] = None, *, circular: bool = False) -> None:
+    # Whether the nodes are linked backwards through their prev attribute.
+    _doubly = False
+
+    def __init__(
+        self, vals: List[Any] = None, *, circular: bool = False, pool: NodePool = None
+    ) -> None:
         self.head: Node = None
         self.tail: Node = None
         self._length: int = 0
         self.circular = circular
+        self._pool = pool
 
         if vals:
             for val in vals:
@@ -48,7 +309,7 @@ class LinkedList(ABC):
             raise StopIteration
 
         node = self.__node
-        if self.circular and self.__node == self.tail:
+        if self.circular and self.__node is self.tail:
             self.__node = None
         else:
             self.__node = self.__node.next
@@ -64,12 +325,51 @@ class LinkedList(ABC):
             node = node.next
         return node
 
-    def __contains__(self, val) -> bool:
+    def __contains__(self, val, *, key: Callable[[Any], Any] = None, identity: bool = False) -> bool:
+        if key is None and not identity:
+            for node in self:
+                if node.data == val:
+                    return True
+            return False
+
+        match = _matcher(val, key, identity)
         for node in self:
-            if node.data == val:
+            if match(node.data):
                 return True
         return False
 
+    def index(self, val, *, key: Callable[[Any], Any] = None, identity: bool = False) -> int:
+        """Return the index of the first node whose value matches val.
+
+        Parameters
+        ----------
+        val: Any
+            The value to look for.
+
+        key: callable
+            If specified, val is compared with key(value) instead of the value itself, so heavy values are looked up by a cheap field. Must be specified as a keyword argument.
+            default = None
+
+        identity: bool
+            Whether to match the object val itself instead of an equal value. Must be specified as a keyword argument.
+            default = False
+
+        Returns
+        -------
+        index: int
+        """
+
+        match = _matcher(val, key, identity)
+        for index, node in enumerate(self._nodes()):
+            if match(node.data):
+                return index
+        raise ValueError(f"'{val}' does not exists in the list.")
+
+    def count(self, val, *, key: Callable[[Any], Any] = None, identity: bool = False) -> int:
+        """Return the amount of nodes whose value matches val, key and identity work as in index()."""
+        match = _matcher(val, key, identity)
+        return sum(1 for node in self._nodes() if match(node.data))
+
     def _validate_index(self, index: int) -> None:
         """Validate index value."""
         assert self._length > 0, "List is empty"
@@ -91,6 +391,462 @@ class LinkedList(ABC):
         self.head = self.tail = None
         self._length = 0
 
+    def instrument(self, callback: Callable[[str, int, float], Any] = None) -> Instrumentation:
+        """Start recording per-operation statistics of the list.
+
+        The list class is swapped for an instrumented subclass, so a list that isn't instrumented runs the original methods without any extra work.
+
+        Parameters
+        ----------
+        callback: callable
+            Called after every recorded operation with (operation, nodes_walked, seconds).
+            default = None
+
+        Returns
+        -------
+        instrumentation: Instrumentation
+            The recorded statistics, use its snapshot() method to export them.
+        """
+
+        if not hasattr(self, "_instrumentation"):
+            self._instrumentation = Instrumentation(callback)
+            add_feature(self, "instrumentation")
+        elif callback is not None:
+            self._instrumentation.callback = callback
+        return self._instrumentation
+
+    def uninstrument(self) -> Instrumentation:
+        """Stop recording statistics and return the recorded ones."""
+        instrumentation = self.__dict__.pop("_instrumentation", None)
+        if instrumentation is not None:
+            remove_feature(self, "instrumentation")
+        return instrumentation
+
+    def memory_usage(self, deep: bool = False) -> dict:
+        """Report the memory held by the linked list, in bytes.
+
+        Parameters
+        ----------
+        deep: bool
+            Whether to include the elements, and the objects they refer to, as the "payload" component. Objects referenced several times are counted once.
+            default = False
+
+        Returns
+        -------
+        breakdown: dict
+            Bytes used by each component: "container" for the list object and "nodes" for all nodes, and their "total".
+        """
+
+        # All nodes share the same layout, so the nodes are sized without walking the list.
+        breakdown = {
+            "container": shallow_size(self),
+            "nodes": shallow_size(self.head) * self._length if self.head is not None else 0,
+        }
+        if deep:
+            breakdown["payload"] = payload_size(node.data for node in self)
+        return with_total(breakdown)
+
+    def _nodes(self) -> Iterator[Node]:
+        """Iterate over the nodes without touching the state used by __iter__."""
+        node = self.head
+        for _ in range(self._length):
+            yield node
+            node = node.next
+
+    def _new_list(self, vals: Iterable[Any] = ()) -> "LinkedList":
+        """Create a list of the same kind holding vals, linking each new node directly after the tail."""
+        # The new list starts without the features of this one.
+        new_list = plain_class(type(self))(circular=self.circular, pool=self._pool)
+        pool = self._pool
+        doubly = self._doubly
+        tail = None
+        length = 0
+        for val in vals:
+            node = Node(val) if pool is None else pool.acquire(val)
+            if tail is None:
+                new_list.head = node
+            else:
+                tail.next = node
+                if doubly:
+                    node.prev = tail
+            tail = node
+            length += 1
+
+        new_list.tail = tail
+        new_list._length = length
+        if tail is not None and self.circular:
+            tail.next = new_list.head
+            if doubly:
+                new_list.head.prev = tail
+        return new_list
+
+    def map(self, func: Callable[[Any], Any]) -> "LinkedList":
+        """Return a new list of the same kind holding func(val) for every value, in a single pass."""
+        return self._new_list(func(node.data) for node in self._nodes())
+
+    def filter(self, pred: Callable[[Any], bool]) -> "LinkedList":
+        """Return a new list of the same kind holding the values for which pred(val) is true, in a single pass."""
+        return self._new_list(node.data for node in self._nodes() if pred(node.data))
+
+    def reduce(self, func: Callable[[Any, Any], Any], initial: Any = _MISSING) -> Any:
+        """Combine the values from head to tail with func(accumulated, val), like functools.reduce."""
+        nodes = self._nodes()
+        if initial is _MISSING:
+            if not self._length:
+                raise TypeError("reduce() of empty list with no initial value")
+            accumulated = next(nodes).data
+        else:
+            accumulated = initial
+
+        for node in nodes:
+            accumulated = func(accumulated, node.data)
+        return accumulated
+
+    def take_while(self, pred: Callable[[Any], bool]) -> "LinkedList":
+        """Return a new list of the same kind holding the leading values for which pred(val) is true."""
+        def leading():
+            for node in self._nodes():
+                if not pred(node.data):
+                    return
+                yield node.data
+
+        return self._new_list(leading())
+
+    def chunk(self, size: int) -> Iterator["LinkedList"]:
+        """Lazily split the values into consecutive lists of the same kind holding `size` values each, the last one may be shorter."""
+        if not isinstance(size, int):
+            raise TypeError(f"Invalid type {type(size)}. size must be int")
+        if size <= 0:
+            raise ValueError("size must be greater than zero.")
+
+        nodes = self._nodes()
+        remaining = self._length
+        while remaining > 0:
+            count = min(size, remaining)
+            yield self._new_list(next(nodes).data for _ in range(count))
+            remaining -= count
+
+    def partition(self, pred: Callable[[Any], bool]) -> Tuple["LinkedList", "LinkedList"]:
+        """Split the values into two new lists of the same kind, those for which pred(val) is true and the rest, in a single pass."""
+        matching = self._new_list()
+        rest = self._new_list()
+        pool = self._pool
+        doubly = self._doubly
+
+        for node in self._nodes():
+            target = matching if pred(node.data) else rest
+            new_node = Node(node.data) if pool is None else pool.acquire(node.data)
+            if target.tail is None:
+                target.head = new_node
+            else:
+                target.tail.next = new_node
+                if doubly:
+                    new_node.prev = target.tail
+            target.tail = new_node
+            target._length += 1
+
+        for target in (matching, rest):
+            if target.tail is not None and self.circular:
+                target.tail.next = target.head
+                if doubly:
+                    target.head.prev = target.tail
+        return matching, rest
+
+    def rotate(self, k: int = 1) -> "LinkedList":
+        """Rotate the list k steps to the right, the last k nodes move to the beginning (a negative k rotates to the left).
+
+        No node is created or moved, only the head and tail change: the ends are linked to each other, and the list is cut again before the new head.
+        The new head is found by walking forward from the head, or backward from the tail in a DoublyLL, whichever is shorter, so rotate(-1) is O(1) and rotate(1) is O(1) only in a DoublyLL.
+
+        Parameters
+        ----------
+        k: int
+            The amount of steps.
+            default = 1
+
+        Returns
+        -------
+        self
+        """
+
+        if not isinstance(k, int):
+            raise TypeError(f"Invalid type {type(k)}. k must be int")
+
+        length = self._length
+        if length < 2 or not k % length:
+            return self
+
+        k %= length
+        # Index of the new head.
+        start = length - k
+        if self._doubly and k < start:
+            new_head = self.tail
+            for _ in range(k - 1):
+                new_head = new_head.prev
+            new_tail = new_head.prev
+        else:
+            new_tail = self.head
+            for _ in range(start - 1):
+                new_tail = new_tail.next
+            new_head = new_tail.next
+
+        self.tail.next = self.head
+        if self._doubly:
+            self.head.prev = self.tail
+        self.head, self.tail = new_head, new_tail
+        if not self.circular:
+            new_tail.next = None
+            if self._doubly:
+                new_head.prev = None
+        return self
+
+    def reverse(self) -> "LinkedList":
+        """Reverse the list in place by relinking its nodes, without creating any node.
+
+        Returns
+        -------
+        self
+        """
+
+        doubly = self._doubly
+        previous_node = None
+        node = self.head
+        for _ in range(self._length):
+            next_node = node.next
+            node.next = previous_node
+            if doubly:
+                node.prev = next_node
+            previous_node = node
+            node = next_node
+
+        self.head, self.tail = self.tail, self.head
+        if self.head is not None:
+            self.tail.next = self.head if self.circular else None
+            if doubly:
+                self.head.prev = self.tail if self.circular else None
+        return self
+
+    def insert_many(self, items: Iterable[Tuple[int, Any]]) -> "LinkedList":
+        """Insert several values in a single walk over the list, instead of walking from the head for each of them.
+
+        Indices refer to the list before any insertion: every value is inserted before the node that was at its index, or at the end for an index equal to the length.
+        Values with the same index keep their order in items. All indices are validated first, so an invalid index leaves the list unchanged.
+        It takes O(n + k log k) time for k values.
+
+        Parameters
+        ----------
+        items: iterable
+            (index, val) pairs.
+
+        Returns
+        -------
+        self
+        """
+
+        items = list(items)
+        length = self._length
+        for item in items:
+            if not isinstance(item, tuple) or len(item) != 2:
+                raise TypeError(f"Invalid item {item!r}. Items must be (index, val) pairs")
+            if not isinstance(item[0], int):
+                raise TypeError(f"Invalid type {type(item[0])}. Index must be int")
+            if item[0] not in range(length + 1):
+                raise IndexError(
+                    f"index out of bound, please specify an index between 0 and {length}"
+                )
+        if not items:
+            return self
+
+        pool = self._pool
+        doubly = self._doubly
+        # The node before the current position, and the node at it.
+        previous_node = None
+        node = self.head
+        position = 0
+        for index, val in sorted(items, key=lambda item: item[0]):
+            while position < index:
+                previous_node = node
+                position += 1
+                node = node.next if position < length else None
+
+            new_node = Node(val) if pool is None else pool.acquire(val)
+            new_node.next = node
+            if previous_node is None:
+                self.head = new_node
+            else:
+                previous_node.next = new_node
+            if doubly:
+                new_node.prev = previous_node
+                if node is not None:
+                    node.prev = new_node
+            # Values with the same index go after this one.
+            previous_node = new_node
+
+        if node is None:
+            # Values were inserted at the end of the list.
+            self.tail = previous_node
+        self._length += len(items)
+        self.tail.next = self.head if self.circular else None
+        if doubly:
+            self.head.prev = self.tail if self.circular else None
+        return self
+
+    def pop_many(self, indices: Iterable[int]) -> List[Any]:
+        """Remove the nodes at several indices in a single walk over the list, and return their values.
+
+        Indices refer to the list before any removal, negative indices count from the end. All indices are validated first, so an invalid or repeated index leaves the list unchanged.
+        It takes O(n + k log k) time for k indices.
+
+        Parameters
+        ----------
+        indices: iterable
+            The indices of the removed nodes.
+
+        Returns
+        -------
+        vals: list
+            The values of the removed nodes, in the order of indices.
+        """
+
+        indices = list(indices)
+        length = self._length
+        positions = []
+        for index in indices:
+            if not isinstance(index, int):
+                raise TypeError(f"Invalid type {type(index)}. Index must be int")
+            if index not in range(-length, length):
+                raise IndexError(
+                    f"Index out of bound, please specify an index between {-length} and {length - 1}"
+                )
+            positions.append(index % length)
+        if len(set(positions)) != len(positions):
+            raise ValueError("Indices must refer to different nodes.")
+        if not positions:
+            return []
+
+        pool = self._pool
+        doubly = self._doubly
+        removed = {}
+        previous_node = None
+        node = self.head
+        position = 0
+        for target in sorted(positions):
+            while position < target:
+                previous_node = node
+                position += 1
+                node = node.next
+
+            removed[target] = node.data
+            position += 1
+            next_node = node.next if position < length else None
+            if previous_node is None:
+                self.head = next_node
+            else:
+                previous_node.next = next_node
+            if doubly and next_node is not None:
+                next_node.prev = previous_node
+
+            _discard_node(node, pool)
+            node = next_node
+
+        if node is None:
+            # The last node was removed.
+            self.tail = previous_node
+        self._length -= len(positions)
+        if not self._length:
+            self.head = self.tail = None
+        else:
+            self.tail.next = self.head if self.circular else None
+            if doubly:
+                self.head.prev = self.tail if self.circular else None
+        return [removed[position] for position in positions]
+
+    def filter_inplace(self, pred: Callable[[Any], bool]) -> "LinkedList":
+        """Unlink the nodes for which pred(val) is false, without creating new nodes.
+
+        If pred raises an exception, the nodes already rejected stay removed and the list is left consistent.
+
+        Returns
+        -------
+        self
+        """
+
+        pool = self._pool
+        doubly = self._doubly
+        node = self.head
+        remaining = self._length
+        kept_head = kept_tail = None
+        kept = 0
+
+        try:
+            while remaining:
+                next_node = node.next
+                if pred(node.data):
+                    if kept_tail is None:
+                        kept_head = node
+                    else:
+                        kept_tail.next = node
+                        if doubly:
+                            node.prev = kept_tail
+                    kept_tail = node
+                    kept += 1
+                else:
+                    _discard_node(node, pool)
+                remaining -= 1
+                node = next_node
+        finally:
+            if remaining:
+                # pred raised: keep the nodes that weren't checked yet.
+                if kept_tail is None:
+                    kept_head = node
+                else:
+                    kept_tail.next = node
+                    if doubly:
+                        node.prev = kept_tail
+                kept_tail = self.tail
+                kept += remaining
+
+            self.head, self.tail, self._length = kept_head, kept_tail, kept
+            if kept_tail is not None:
+                kept_tail.next = kept_head if self.circular else None
+                if doubly:
+                    kept_head.prev = kept_tail if self.circular else None
+
+        return self
+
+    def parallel_map(
+        self, func: Callable[[Any], Any], workers: int = None, chunk_size: int = 1024
+    ) -> "LinkedList":
+        """Return a new list of the same kind holding func(val) for every value, computed by a pool of processes.
+
+        See Parallel.parallel_map().
+        """
+        from .Parallel import parallel_map
+
+        return parallel_map(self, func, workers, chunk_size)
+
+    def enable_filter(self, fp_rate: float = 0.01, counting: bool = True) -> BloomFilter:
+        """Put a Bloom filter in front of the `in` operator, so most misses are answered without walking the list.
+
+        See Filters.enable_filter().
+        """
+        return enable_filter(self, fp_rate, counting)
+
+    def disable_filter(self) -> BloomFilter:
+        """Remove the Bloom filter of the list and return it."""
+        return disable_filter(self)
+
+    def cursor(self, at: int = 0) -> "Cursor":
+        """Return a cursor pointing at the node with the specified index, see Cursor.
+
+        Parameters
+        ----------
+        at: int
+            The index of the node, `len(self)` places the cursor past the end of the list.
+            default = 0
+        """
+        return Cursor(self, at)
+
     @abstractmethod
     def insert(self, val) -> "LinkedList":
         pass
@@ -100,7 +856,7 @@ class LinkedList(ABC):
         pass
 
     @abstractmethod
-    def remove(self, val) -> "LinkedList":
+    def remove(self, val, *, key: Callable[[Any], Any] = None, identity: bool = False) -> "LinkedList":
         pass
 
 
@@ -116,6 +872,10 @@ class SinglyLL(LinkedList):
     circular: bool
         Whether the list is circular or not. Must be specified as a keyword argument if you want to set it to True.
         default = False
+
+    pool: NodePool
+        A pool that provides the nodes of the list and receives them back once they are popped or removed. Must be specified as a keyword argument.
+        default = None
     
     Methods
     -------
@@ -125,11 +885,65 @@ class SinglyLL(LinkedList):
     def pop(index: int = None)
         Remove the node with the specified index from the Linked List.
 
-    def remove(val):
-        Remove the node with the specified value from the Linked List.
+    def remove(val, key=None, identity=False):
+        Remove the first node whose value matches val from the Linked List.
+
+    index(val, key=None, identity=False) -> int:
+        Return the index of the first node whose value matches val.
+
+    count(val, key=None, identity=False) -> int:
+        Return the amount of nodes whose value matches val.
 
     delete():
         Delete all elements of a linked list.
+
+    instrument(callback=None) -> Instrumentation:
+        Start recording per-operation statistics of the list.
+
+    uninstrument() -> Instrumentation:
+        Stop recording statistics and return the recorded ones.
+
+    memory_usage(deep=False) -> dict:
+        Report the memory held by the linked list, in bytes.
+
+    cursor(at: int = 0) -> Cursor:
+        Return a cursor to traverse and edit the list in place.
+
+    map(func), filter(pred), take_while(pred) -> LinkedList:
+        Build a new list of the same kind in a single pass.
+
+    reduce(func, initial) -> Any:
+        Combine the values from head to tail.
+
+    chunk(size) -> iterator:
+        Lazily split the values into lists of `size` values.
+
+    partition(pred) -> (LinkedList, LinkedList):
+        Split the values into two new lists in a single pass.
+
+    filter_inplace(pred) -> self:
+        Unlink the nodes whose value doesn't satisfy pred.
+
+    rotate(k=1) -> self:
+        Rotate the list k steps to the right by relinking its ends.
+
+    reverse() -> self:
+        Reverse the list in place.
+
+    insert_many(items) -> self:
+        Insert several (index, val) pairs in a single walk.
+
+    pop_many(indices) -> list:
+        Remove the nodes at several indices in a single walk, and return their values.
+
+    parallel_map(func, workers=None, chunk_size=1024) -> LinkedList:
+        Build a new list of func(val) with a pool of processes.
+
+    enable_filter(fp_rate=0.01, counting=True) -> BloomFilter:
+        Answer most `in` misses without walking the list.
+
+    disable_filter() -> BloomFilter:
+        Remove the Bloom filter of the list.
     """
 
     def __repr__(self) -> str:
@@ -152,7 +966,7 @@ class SinglyLL(LinkedList):
         self
         """
 
-        if index == None:
+        if index is None:
             index = self._length
 
         if not isinstance(index, int):
@@ -163,7 +977,7 @@ class SinglyLL(LinkedList):
                 f"index out of bound, please specify an index between 0 and {self._length}"
             )
 
-        new_node = Node(val)
+        new_node = Node(val) if self._pool is None else self._pool.acquire(val)
 
         if self.head is None:
             # If list has no nodes, assign node as both head and tail.
@@ -208,13 +1022,14 @@ class SinglyLL(LinkedList):
         if self.head is None:
             return self
 
-        if index == None:
+        if index is None:
             index = self._length - 1
 
         self._validate_index(index)
 
         if index == 0:
-            if self.head == self.tail:
+            removed_node = self.head
+            if self.head is self.tail:
                 # If the linked list has only one node.
                 self.head = self.tail = None
             else:
@@ -224,22 +1039,32 @@ class SinglyLL(LinkedList):
         else:
             # Find the node that is directly before the deleted node.
             previous_node = self[index - 1]
+            removed_node = previous_node.next
             previous_node.next = previous_node.next.next
 
             # If the deleted node is the last node then assign previous_node to the tail.
-            if previous_node.next in [None, self.head]:
+            if previous_node.next is None or previous_node.next is self.head:
                 self.tail = previous_node
 
         self._length -= 1
+        _discard_node(removed_node, self._pool)
         return self
 
-    def remove(self, val) -> LinkedList:
-        """Remove the node with the specified value from the Linked List.
+    def remove(self, val, *, key: Callable[[Any], Any] = None, identity: bool = False) -> LinkedList:
+        """Remove the first node whose value matches val from the Linked List.
         
         Parameters
         ----------
         val: int
             The val of the deleted node in the linked list.
+
+        key: callable
+            If specified, val is compared with key(value) instead of the value itself. Must be specified as a keyword argument.
+            default = None
+
+        identity: bool
+            Whether to match the object val itself instead of an equal value. Must be specified as a keyword argument.
+            default = False
             
         Returns
         -------
@@ -250,8 +1075,10 @@ class SinglyLL(LinkedList):
         if self.head is None:
             return self
 
-        if self.head.data == val:
-            if self.head == self.tail:
+        match = _matcher(val, key, identity)
+        if match(self.head.data):
+            removed_node = self.head
+            if self.head is self.tail:
                 # If the linked list has only one node.
                 self.head = self.tail = None
             else:
@@ -262,7 +1089,8 @@ class SinglyLL(LinkedList):
             previous_node = self.head
             # Find the node that is directly before the deleted node.
             for node in self:
-                if node.data == val:
+                if match(node.data):
+                    removed_node = node
                     previous_node.next = node.next
                     break
                 previous_node = node
@@ -271,10 +1099,11 @@ class SinglyLL(LinkedList):
                 raise ValueError(f"'{val}' does not exists in the list.")
 
             # If the deleted node is the last node then assign previous_node to the tail.
-            if previous_node.next in [None, self.head]:
+            if previous_node.next is None or previous_node.next is self.head:
                 self.tail = previous_node
 
         self._length -= 1
+        _discard_node(removed_node, self._pool)
         return self
 
 
@@ -290,6 +1119,10 @@ class DoublyLL(LinkedList):
     circular: bool
         Whether the list is circular or not. Must be specified as a keyword argument if you want to set it to True.
         default = False
+
+    pool: NodePool
+        A pool that provides the nodes of the list and receives them back once they are popped or removed. Must be specified as a keyword argument.
+        default = None
     
     Methods
     -------
@@ -299,13 +1132,84 @@ class DoublyLL(LinkedList):
     def pop(index: int = None)
         Remove the node with the specified index from the Linked List.
 
-    def remove(val):
-        Remove the node with the specified value from the Linked List.
+    def remove(val, key=None, identity=False):
+        Remove the first node whose value matches val from the Linked List.
+
+    index(val, key=None, identity=False) -> int:
+        Return the index of the first node whose value matches val.
+
+    count(val, key=None, identity=False) -> int:
+        Return the amount of nodes whose value matches val.
 
     delete():
         Delete all elements of a linked list.
+
+    instrument(callback=None) -> Instrumentation:
+        Start recording per-operation statistics of the list.
+
+    uninstrument() -> Instrumentation:
+        Stop recording statistics and return the recorded ones.
+
+    memory_usage(deep=False) -> dict:
+        Report the memory held by the linked list, in bytes.
+
+    cursor(at: int = 0) -> Cursor:
+        Return a cursor to traverse and edit the list in place.
+
+    map(func), filter(pred), take_while(pred) -> LinkedList:
+        Build a new list of the same kind in a single pass.
+
+    reduce(func, initial) -> Any:
+        Combine the values from head to tail.
+
+    chunk(size) -> iterator:
+        Lazily split the values into lists of `size` values.
+
+    partition(pred) -> (LinkedList, LinkedList):
+        Split the values into two new lists in a single pass.
+
+    filter_inplace(pred) -> self:
+        Unlink the nodes whose value doesn't satisfy pred.
+
+    rotate(k=1) -> self:
+        Rotate the list k steps to the right by relinking its ends.
+
+    reverse() -> self:
+        Reverse the list in place.
+
+    insert_many(items) -> self:
+        Insert several (index, val) pairs in a single walk.
+
+    pop_many(indices) -> list:
+        Remove the nodes at several indices in a single walk, and return their values.
+
+    reversed(lst) -> iterator:
+        Iterate over the nodes from tail to head, without changing the list.
+
+    parallel_map(func, workers=None, chunk_size=1024) -> LinkedList:
+        Build a new list of func(val) with a pool of processes.
+
+    enable_filter(fp_rate=0.01, counting=True) -> BloomFilter:
+        Answer most `in` misses without walking the list.
+
+    disable_filter() -> BloomFilter:
+        Remove the Bloom filter of the list.
+
+    insert_node(val, index: int = None) -> Node:
+        Insert a node containing the given value in the specified index, and return the node as a handle.
+
+    remove_node(node) -> Any:
+        Remove a node handle from the list in constant time.
+
+    move_to_front(node) -> self:
+        Move a node handle to the beginning of the list in constant time.
+
+    move_to_back(node) -> self:
+        Move a node handle to the end of the list in constant time.
     """
 
+    _doubly = True
+
     def __repr__(self) -> str:
         return "<->".join([str(node.data) for node in self])
 
@@ -326,7 +1230,46 @@ class DoublyLL(LinkedList):
         self
         """
 
-        if index == None:
+        self._insert(val, index)
+        return self
+
+    def __reversed__(self) -> Iterator[Node]:
+        """Iterate over the nodes from tail to head through their prev links, the list itself isn't changed."""
+        node = self.tail
+        for _ in range(self._length):
+            yield node
+            node = node.prev
+
+    def insert_node(self, val, index: int = None) -> Node:
+        """Insert a node containing the given value to the linked list in the specified index, and return the node.
+
+        The node is a handle that can be passed to remove_node(), move_to_front() and move_to_back(). If the list uses a NodePool, the node isn't recycled once it's removed, so a stale handle is always rejected.
+        
+        Parameters
+        ----------
+        val:
+            The value contained in the added node
+            
+        index: int
+            The index of the added node in the linked list. if unspecified, the node will be added at the end of the list
+            default = None
+            
+        Returns
+        -------
+        node: Node
+        """
+
+        node = self._insert(val, index)
+        node.owner = self
+        return node
+
+    def _insert(self, val, index: int = None) -> Node:
+        """Insert a node containing val in the specified index and return it, shared by insert() and insert_node().
+
+        Only insert_node() marks the node as a handle, so nodes added by insert() go back to the pool once they're removed.
+        """
+
+        if index is None:
             index = self._length
 
         if not isinstance(index, int):
@@ -337,7 +1280,7 @@ class DoublyLL(LinkedList):
                 f"index out of bound, please specify an index between 0 and {self._length}"
             )
 
-        new_node = Node(val)
+        new_node = Node(val) if self._pool is None else self._pool.acquire(val)
 
         if self.head is None:
             # If list has no nodes, assign node as both head and tail.
@@ -369,7 +1312,7 @@ class DoublyLL(LinkedList):
             self.head.prev = self.tail
 
         self._length += 1
-        return self
+        return new_node
 
     def pop(self, index: int = None) -> LinkedList:
         """Remove the node with the specified index from the Linked List.
@@ -389,48 +1332,62 @@ class DoublyLL(LinkedList):
         if self.head is None:
             return self
 
-        if index == None:
+        if index is None:
             index = self._length - 1
 
         self._validate_index(index)
 
         if index == 0:
-            if self.head == self.tail:
+            removed_node = self.head
+            if self.head is self.tail:
                 # If the linked list has only one node.
                 self.head = self.tail = None
             else:
                 self.head = self.head.next
 
         elif index == self._length - 1:
+            removed_node = self.tail
             self.tail = self.tail.prev
         else:
             # Find the node that is directly before the deleted node.
             previous_node = self[index - 1]
+            removed_node = previous_node.next
 
             previous_node.next = previous_node.next.next
             previous_node.next.prev = previous_node
 
             # If the deleted node is the last node then assign previous_node to the tail.
-            if previous_node.next in [None, self.head]:
+            if previous_node.next is None or previous_node.next is self.head:
                 self.tail = previous_node
 
-        if self.circular:
-            self.tail.next = self.head
-            self.head.prev = self.tail
-        else:
-            self.tail.next = None
-            self.head.prev = None
+        # Relink the ends, unless the removed node was the only one.
+        if self.head is not None:
+            if self.circular:
+                self.tail.next = self.head
+                self.head.prev = self.tail
+            else:
+                self.tail.next = None
+                self.head.prev = None
 
         self._length -= 1
+        _discard_node(removed_node, self._pool)
         return self
 
-    def remove(self, val) -> LinkedList:
-        """Remove the node with the specified value from the Linked List.
+    def remove(self, val, *, key: Callable[[Any], Any] = None, identity: bool = False) -> LinkedList:
+        """Remove the first node whose value matches val from the Linked List.
         
         Parameters
         ----------
         val: int
             The val of the deleted node in the linked list.
+
+        key: callable
+            If specified, val is compared with key(value) instead of the value itself. Must be specified as a keyword argument.
+            default = None
+
+        identity: bool
+            Whether to match the object val itself instead of an equal value. Must be specified as a keyword argument.
+            default = False
             
         Returns
         -------
@@ -441,22 +1398,23 @@ class DoublyLL(LinkedList):
         if self.head is None:
             return self
 
-        if self.head.data == val:
-            if self.head == self.tail:
+        match = _matcher(val, key, identity)
+        if match(self.head.data):
+            removed_node = self.head
+            if self.head is self.tail:
                 # If the linked list has only one node.
                 self.head = self.tail = None
             else:
                 self.head = self.head.next
-
-        elif self.tail.data == val:
-            self.tail = self.tail.prev
         else:
             previous_node = self.head
             # Find the node that is directly before the deleted node.
             for node in self:
-                if node.data == val:
+                if match(node.data):
+                    removed_node = node
                     previous_node.next = node.next
-                    node.next.prev = previous_node
+                    if node.next is not None:
+                        node.next.prev = previous_node
                     break
                 previous_node = node
             else:
@@ -464,19 +1422,33 @@ class DoublyLL(LinkedList):
                 raise ValueError(f"'{val}' does not exists in the list.")
 
             # If the deleted node is the last node then assign previous_node to the tail.
-            if previous_node.next in [None, self.head]:
+            if previous_node.next is None or previous_node.next is self.head:
                 self.tail = previous_node
 
-        if self.circular:
-            self.tail.next = self.head
-            self.head.prev = self.tail
-        else:
-            self.tail.next = None
-            self.head.prev = None
+        # Relink the ends, unless the removed node was the only one.
+        if self.head is not None:
+            if self.circular:
+                self.tail.next = self.head
+                self.head.prev = self.tail
+            else:
+                self.tail.next = None
+                self.head.prev = None
 
         self._length -= 1
+        _discard_node(removed_node, self._pool)
         return self
 
+    def cursor(self, at: int = 0) -> "DoublyCursor":
+        """Return a cursor pointing at the node with the specified index, see DoublyCursor.
+
+        Parameters
+        ----------
+        at: int
+            The index of the node, `len(self)` places the cursor past the end of the list.
+            default = 0
+        """
+        return DoublyCursor(self, at)
+
     def delete(self) -> None:
         """Delete all elements of the linked list.
 
@@ -484,10 +1456,365 @@ class DoublyLL(LinkedList):
         """
 
         node = self.head
-        while node != None:
+        for _ in range(self._length):
             next_node = node.next
-            node.next = None
+            node.next = node.prev = None
+            if node.owner is not None:
+                node.owner = None
             node = next_node
 
         self.head = self.tail = None
         self._length = 0
+
+    def _assert_owned(self, node: Node) -> None:
+        if not isinstance(node, Node) or node.owner is not self:
+            raise ValueError(f"{node!r} is not a node handle of this list, or it was already removed.")
+
+    def _unlink(self, node: Node) -> None:
+        """Detach a node of the list from its neighbours, without changing the length."""
+        if node is self.head and node is self.tail:
+            self.head = self.tail = None
+        elif node is self.head:
+            self.head = node.next
+        elif node is self.tail:
+            self.tail = node.prev
+        else:
+            node.prev.next = node.next
+            node.next.prev = node.prev
+
+        node.next = node.prev = None
+        self._relink_ends()
+
+    def _relink_ends(self) -> None:
+        """Connect the head and the tail to each other in a circular list, or to None otherwise."""
+        if self.head is not None:
+            if self.circular:
+                self.tail.next = self.head
+                self.head.prev = self.tail
+            else:
+                self.tail.next = None
+                self.head.prev = None
+
+    def remove_node(self, node: Node) -> Any:
+        """Remove a node returned by insert_node() from the list in constant time.
+        
+        Parameters
+        ----------
+        node: Node
+            The node handle returned by insert_node().
+            
+        Returns
+        -------
+        val: Any
+            The value of the removed node.
+        """
+
+        self._assert_owned(node)
+        val = node.data
+        self._unlink(node)
+        self._length -= 1
+        _discard_node(node, self._pool)
+        return val
+
+    def move_to_front(self, node: Node) -> LinkedList:
+        """Move a node returned by insert_node() to the beginning of the list in constant time.
+        
+        Returns
+        -------
+        self
+        """
+
+        self._assert_owned(node)
+        if node is not self.head:
+            self._unlink(node)
+            node.next = self.head
+            self.head.prev = node
+            self.head = node
+            self._relink_ends()
+        return self
+
+    def move_to_back(self, node: Node) -> LinkedList:
+        """Move a node returned by insert_node() to the end of the list in constant time.
+        
+        Returns
+        -------
+        self
+        """
+
+        self._assert_owned(node)
+        if node is not self.tail:
+            self._unlink(node)
+            node.prev = self.tail
+            self.tail.next = node
+            self.tail = node
+            self._relink_ends()
+        return self
+
+
+class Cursor:
+    """A position inside a linked list, that allows editing the list around it in constant time.
+
+    The cursor points at a node of the list, or past its end once it advances beyond the tail of a non-circular list. On a circular list, advancing from the tail moves the cursor back to the head.
+    The cursor is invalidated if the list is modified through anything other than the cursor itself.
+
+    Parameters
+    ----------
+    lst: LinkedList
+        The list to traverse.
+
+    at: int
+        The index of the initial node, `len(lst)` places the cursor past the end of the list.
+        default = 0
+
+    Methods
+    -------
+    advance() -> self:
+        Move the cursor to the next node.
+
+    insert_before(val) -> self:
+        Insert a node before the current one, the cursor doesn't move.
+
+    insert_after(val) -> self:
+        Insert a node after the current one, the cursor doesn't move.
+
+    remove_current() -> Any:
+        Remove the current node and move the cursor to the next one.
+
+    replace(val) -> self:
+        Replace the value of the current node.
+    """
+
+    def __init__(self, lst: LinkedList, at: int = 0) -> None:
+        if not isinstance(at, int):
+            raise TypeError(f"Invalid type {type(at)}. Index must be int")
+
+        if at not in range(lst._length + 1):
+            raise IndexError(
+                f"index out of bound, please specify an index between 0 and {lst._length}"
+            )
+
+        self._list = lst
+        self._doubly = isinstance(lst, DoublyLL)
+        # The node before the current one, None while the cursor is at the head.
+        self._prev: Node = None
+        self._node: Node = lst.head
+        self.index = 0
+
+        if at == lst._length and lst.circular and lst._length:
+            # There is no end to move past in a circular list.
+            at = 0
+
+        for _ in range(at):
+            self._prev = self._node
+            self._node = self._node.next if self._node is not lst.tail else None
+            self.index += 1
+
+    def __repr__(self) -> str:
+        return f"Cursor(index={self.index}, node={self._node})"
+
+    @property
+    def node(self) -> Node:
+        """The current node, None if the cursor is past the end of the list."""
+        return self._node
+
+    @property
+    def value(self) -> Any:
+        """The value of the current node."""
+        self._assert_on_node()
+        return self._node.data
+
+    def _assert_on_node(self) -> None:
+        if self._node is None:
+            raise IndexError("Cursor is past the end of the list.")
+
+    def _new_node(self, val) -> Node:
+        pool = self._list._pool
+        return Node(val) if pool is None else pool.acquire(val)
+
+    def advance(self) -> "Cursor":
+        """Move the cursor to the next node.
+
+        Returns
+        -------
+        self
+        """
+
+        self._assert_on_node()
+        lst = self._list
+
+        if self._node is lst.tail:
+            if lst.circular:
+                self._prev, self._node, self.index = None, lst.head, 0
+                return self
+            self._prev, self._node = self._node, None
+        else:
+            self._prev, self._node = self._node, self._node.next
+
+        self.index += 1
+        return self
+
+    def insert_before(self, val) -> "Cursor":
+        """Insert a node containing val before the current node, the cursor keeps pointing at the current node.
+
+        If the cursor is past the end of the list, the node is added to the end of the list.
+
+        Returns
+        -------
+        self
+        """
+
+        lst = self._list
+        new_node = self._new_node(val)
+
+        if self._prev is None:
+            # The new node becomes the head (of a possibly empty list).
+            new_node.next = lst.head
+            if self._doubly and lst.head is not None:
+                lst.head.prev = new_node
+            lst.head = new_node
+            if lst.tail is None:
+                lst.tail = new_node
+            if lst.circular:
+                lst.tail.next = lst.head
+                if self._doubly:
+                    lst.head.prev = lst.tail
+        else:
+            new_node.next = self._node
+            self._prev.next = new_node
+            if self._doubly:
+                new_node.prev = self._prev
+                if self._node is not None:
+                    self._node.prev = new_node
+
+            if self._node is None:
+                # Appended past the end of the list.
+                lst.tail = new_node
+                if lst.circular:
+                    lst.tail.next = lst.head
+                    if self._doubly:
+                        lst.head.prev = lst.tail
+
+        self._prev = new_node
+        self.index += 1
+        lst._length += 1
+        return self
+
+    def insert_after(self, val) -> "Cursor":
+        """Insert a node containing val after the current node, the cursor keeps pointing at the current node.
+
+        Returns
+        -------
+        self
+        """
+
+        self._assert_on_node()
+        lst = self._list
+        new_node = self._new_node(val)
+
+        new_node.next = self._node.next
+        self._node.next = new_node
+        if self._doubly:
+            new_node.prev = self._node
+            if new_node.next is not None:
+                new_node.next.prev = new_node
+
+        if self._node is lst.tail:
+            lst.tail = new_node
+
+        lst._length += 1
+        return self
+
+    def remove_current(self) -> Any:
+        """Remove the current node and move the cursor to the next node.
+
+        Returns
+        -------
+        val: Any
+            The value of the removed node.
+        """
+
+        self._assert_on_node()
+        lst = self._list
+        node = self._node
+        val = node.data
+
+        if lst.head is lst.tail:
+            # The only node of the list.
+            lst.head = lst.tail = None
+            self._node = None
+        elif self._prev is None:
+            lst.head = node.next
+            if lst.circular:
+                lst.tail.next = lst.head
+            if self._doubly:
+                lst.head.prev = lst.tail if lst.circular else None
+            self._node = lst.head
+        else:
+            self._prev.next = node.next
+            if node is lst.tail:
+                lst.tail = self._prev
+                if lst.circular:
+                    if self._doubly:
+                        lst.head.prev = lst.tail
+                    self._prev, self._node, self.index = None, lst.head, 0
+                else:
+                    self._node = None
+            else:
+                if self._doubly:
+                    node.next.prev = self._prev
+                self._node = node.next
+
+        lst._length -= 1
+        _discard_node(node, lst._pool)
+        return val
+
+    def replace(self, val) -> "Cursor":
+        """Replace the value of the current node.
+
+        Returns
+        -------
+        self
+        """
+
+        self._assert_on_node()
+        self._node.data = val
+        return self
+
+
+class DoublyCursor(Cursor):
+    """A position inside a doubly linked list, that allows editing the list around it in constant time.
+
+    Has all the methods of Cursor, and can also move backwards.
+
+    Methods
+    -------
+    retreat() -> self:
+        Move the cursor to the previous node.
+    """
+
+    def retreat(self) -> "DoublyCursor":
+        """Move the cursor to the previous node.
+
+        Returns
+        -------
+        self
+        """
+
+        lst = self._list
+
+        if self._node is None:
+            if lst.tail is None:
+                raise IndexError("Cursor is at the beginning of the list.")
+            self._node = lst.tail
+            self.index -= 1
+        elif self._prev is None:
+            if not lst.circular:
+                raise IndexError("Cursor is at the beginning of the list.")
+            self._node = lst.tail
+            self.index = lst._length - 1
+        else:
+            self._node = self._prev
+            self.index -= 1
+
+        self._prev = self._node.prev if self._node is not lst.head else None
+        return self
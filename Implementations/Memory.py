@@ -0,0 +1,155 @@
+"""
+Created on Mon Oct 19 15:10:52 2026
+
+Memory footprint helpers used by the memory_usage() methods of the data structures, and a footprint estimator that doesn't need a full sized structure.
+
+"""
+import math
+import sys
+from typing import Any, Dict, Iterable
+
+# Containers whose items are counted as part of a deep payload size.
+_CONTAINERS = (list, tuple, set, frozenset)
+
+
+def shallow_size(obj: Any) -> int:
+    """Size of an object in bytes, including its instance dictionary but not the objects it refers to."""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def payload_size(values: Iterable[Any], seen: set = None) -> int:
+    """Total size in bytes of values and of every object they refer to through builtin containers or instance dictionaries.
+
+    Objects are counted once, no matter how many times they are referenced. Pass the same `seen` set to several calls to de-duplicate objects across them.
+    """
+
+    if seen is None:
+        seen = set()
+
+    total = 0
+    for value in values:
+        pending = [value]
+        while pending:
+            obj = pending.pop()
+            if id(obj) in seen:
+                continue
+
+            seen.add(id(obj))
+            total += sys.getsizeof(obj)
+            if isinstance(obj, _CONTAINERS):
+                pending.extend(obj)
+            elif isinstance(obj, dict):
+                pending.extend(obj.keys())
+                pending.extend(obj.values())
+            if hasattr(obj, "__dict__") and not isinstance(obj, type):
+                pending.append(obj.__dict__)
+
+    return total
+
+
+def sequence_usage(owner: Any, elements: Any, deep: bool = False) -> Dict[str, int]:
+    """Memory breakdown of a structure that stores its elements in a list or in a linked list.
+
+    Components are "container" (the structure objects), "storage" (the list holding the element references) or "nodes" (the linked list nodes), and "payload" (the elements, only if deep).
+    """
+
+    if hasattr(elements, "memory_usage"):
+        breakdown = elements.memory_usage(deep)
+        breakdown.pop("total")
+        breakdown["container"] += shallow_size(owner)
+        return with_total(breakdown)
+
+    breakdown = {"container": shallow_size(owner), "storage": sys.getsizeof(elements)}
+    if deep:
+        breakdown["payload"] = payload_size(elements)
+    return with_total(breakdown)
+
+
+def with_total(breakdown: Dict[str, int]) -> Dict[str, int]:
+    """Add the "total" of all components to a memory breakdown, components starting with "disk" are excluded."""
+    breakdown["total"] = sum(
+        size for component, size in breakdown.items() if not component.startswith("disk")
+    )
+    return breakdown
+
+
+def _sample(cls: type, n: int, kwargs: Dict[str, Any]) -> Any:
+    """Build a structure of class cls holding n small integers, passing kwargs to its constructor."""
+    from .Queues import QueueCirc, QueueTTL
+    from .Stacks import StackCirc
+
+    if issubclass(cls, QueueTTL):
+        # The ttl doesn't change the footprint, the sample elements just must not expire while they're measured.
+        kwargs = {"ttl": math.inf, **kwargs}
+
+    ring = issubclass(cls, (QueueCirc, StackCirc))
+    try:
+        struct = cls(n, **kwargs) if ring else cls(vals=range(n), **kwargs)
+    except TypeError as error:
+        raise ValueError(
+            f"Cannot build a sample {cls.__name__}, pass its other constructor parameters to estimate_memory(): {error}"
+        ) from None
+
+    if issubclass(cls, QueueCirc):
+        for i in range(n):
+            struct.enqueue(i)
+    elif ring:
+        for i in range(n):
+            struct.push(i)
+    return struct
+
+
+def estimate_memory(
+    cls: type, n: int, payload_bytes: int = 0, sample: int = 256, **kwargs
+) -> Dict[str, int]:
+    """Estimate the memory footprint of a structure holding n elements, without building it.
+
+    Two small structures of `sample` and `2 * sample` elements are measured, and every component of memory_usage() except the "container" is extrapolated linearly to n elements.
+    Over-allocation of list-based structures makes the estimate approximate.
+
+    Parameters
+    ----------
+    cls: type
+        The structure class, e.g. DoublyLL or QueueCirc.
+
+    n: int
+        The amount of elements.
+
+    payload_bytes: int
+        The average size of a single element, added to the estimate as the "payload" component.
+        default = 0
+
+    sample: int
+        The amount of elements in the smallest measured structure.
+        default = 256
+
+    kwargs:
+        Other constructor parameters of cls, e.g. `memory_limit`. QueueTTL samples default to a ttl that never expires.
+
+    Returns
+    -------
+    breakdown: dict
+        Estimated bytes per component, like memory_usage().
+    """
+
+    if not isinstance(n, int) or n < 0:
+        raise ValueError("n must be a non-negative int.")
+    if not hasattr(cls, "memory_usage"):
+        raise ValueError(f"{cls.__name__} doesn't report its memory usage.")
+
+    small = _sample(cls, sample, kwargs).memory_usage()
+    large = _sample(cls, 2 * sample, kwargs).memory_usage()
+    small.pop("total")
+    large.pop("total")
+
+    # The structure objects themselves don't grow with the elements.
+    estimate = {"container": large.pop("container")}
+    for component, size in large.items():
+        per_element = (size - small[component]) / sample
+        estimate[component] = max(0, int(round(size + per_element * (n - 2 * sample))))
+    if payload_bytes:
+        estimate["payload"] = n * payload_bytes
+    return with_total(estimate)
@@ -0,0 +1,227 @@
+"""
+Created on Mon Oct 19 14:05:31 2026
+
+Constant-memory helpers used to collect queue metrics: a ring of enqueue timestamps, streaming quantile estimates and the per-queue counters.
+
+"""
+import math
+import time
+from array import array
+from typing import Dict
+
+
+class TimestampRing:
+    """FIFO ring of float timestamps stored in a compact `array`.
+
+    The ring doubles its storage when it's full, so it always holds exactly one timestamp per queued element.
+
+    Parameters
+    ----------
+    capacity: int
+        The initial amount of timestamps the ring can hold.
+        default = 16
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        self._times = array("d", bytes(8 * max(1, capacity)))
+        self._first = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float) -> None:
+        """Add a timestamp to the end of the ring."""
+        capacity = len(self._times)
+        if self._size == capacity:
+            # Unroll the ring into a storage twice as big.
+            times = self._times[self._first :] + self._times[: self._first]
+            times.extend(array("d", bytes(8 * capacity)))
+            self._times = times
+            self._first = 0
+            capacity *= 2
+
+        self._times[(self._first + self._size) % capacity] = timestamp
+        self._size += 1
+
+    def popleft(self) -> float:
+        """Remove and return the oldest timestamp."""
+        assert self._size, "Timestamp ring is empty."
+
+        timestamp = self._times[self._first]
+        self._first = (self._first + 1) % len(self._times)
+        self._size -= 1
+        return timestamp
+
+    def clear(self) -> None:
+        """Remove all timestamps."""
+        self._first = 0
+        self._size = 0
+
+
+class StreamingQuantiles:
+    """Estimate quantiles of a stream of positive values in constant memory.
+
+    Values are counted in logarithmic buckets, each one `growth` times wider than the previous, so every estimate is within a relative error of (growth - 1) / 2.
+
+    Parameters
+    ----------
+    min_value: float
+        Values at or below min_value are counted in the first bucket.
+        default = 1e-7
+
+    max_value: float
+        Values at or above max_value are counted in the last bucket.
+        default = 1e5
+
+    growth: float
+        The ratio between the bounds of consecutive buckets.
+        default = 1.05
+    """
+
+    def __init__(
+        self, min_value: float = 1e-7, max_value: float = 1e5, growth: float = 1.05
+    ) -> None:
+        if not 0 < min_value < max_value:
+            raise ValueError("min_value must be positive and smaller than max_value.")
+        if growth <= 1:
+            raise ValueError("growth must be greater than one.")
+
+        self._min = min_value
+        self._log_growth = math.log(growth)
+        buckets = int(math.log(max_value / min_value) / self._log_growth) + 2
+        self._buckets = array("Q", bytes(8 * buckets))
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        """Add a value to the stream."""
+        if value <= self._min:
+            index = 0
+        else:
+            index = min(
+                int(math.log(value / self._min) / self._log_growth) + 1, len(self._buckets) - 1
+            )
+        self._buckets[index] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile of the values, q is between 0 and 1."""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1.")
+        if not self.count:
+            return 0.0
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for index, count in enumerate(self._buckets):
+            seen += count
+            if seen > rank:
+                break
+
+        if index == 0:
+            return min(self._min, self.max)
+        # Geometric middle of the bucket, never above the largest value seen.
+        return min(self._min * math.exp((index - 0.5) * self._log_growth), self.max)
+
+    def clear(self) -> None:
+        """Forget all values."""
+        for index in range(len(self._buckets)):
+            self._buckets[index] = 0
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class QueueMetrics:
+    """Throughput, occupancy and sojourn time metrics of a queue.
+
+    Parameters
+    ----------
+    capacity: int
+        The capacity of the measured queue, None if it's limitless.
+
+    size: int
+        The amount of elements already in the queue when the metrics start, they are treated as if they were enqueued right now.
+        default = 0
+
+    Methods
+    -------
+    stats() -> dict:
+        Return the current metrics.
+
+    reset() -> None:
+        Clear all metrics, keeping the timestamps of queued elements.
+    """
+
+    def __init__(self, capacity: int = None, size: int = 0) -> None:
+        self.capacity = capacity
+        self.timestamps = TimestampRing(capacity or 16)
+        self.sojourn = StreamingQuantiles()
+        now = time.perf_counter()
+        for _ in range(size):
+            self.timestamps.append(now)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all metrics, keeping the timestamps of queued elements."""
+        self.started = time.perf_counter()
+        self.enqueued = 0
+        self.dequeued = 0
+        self.expired = 0
+        self.full_rejections = 0
+        self.empty_rejections = 0
+        self.high_water_mark = len(self.timestamps)
+        self.sojourn.clear()
+
+    def on_enqueue(self, size: int) -> None:
+        """Record an element added to the queue, size is the queue length after the insertion."""
+        self.timestamps.append(time.perf_counter())
+        self.enqueued += 1
+        if size > self.high_water_mark:
+            self.high_water_mark = size
+
+    def on_dequeue(self) -> None:
+        """Record the oldest element leaving the queue."""
+        self.sojourn.add(time.perf_counter() - self.timestamps.popleft())
+        self.dequeued += 1
+
+    def on_expire(self, count: int) -> None:
+        """Record the count oldest elements expiring, they don't count as dequeued."""
+        for _ in range(count):
+            self.timestamps.popleft()
+        self.expired += count
+
+    def on_delete(self) -> None:
+        """Record all elements being removed from the queue, they don't count as dequeued."""
+        self.timestamps.clear()
+
+    def stats(self) -> Dict:
+        """Return the current metrics.
+
+        Rates are in elements per second since the metrics started, and sojourn times are in seconds.
+        """
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        sojourn = self.sojourn
+        return {
+            "enqueued": self.enqueued,
+            "dequeued": self.dequeued,
+            "expired": self.expired,
+            "enqueue_rate": self.enqueued / elapsed,
+            "dequeue_rate": self.dequeued / elapsed,
+            "full_rejections": self.full_rejections,
+            "empty_rejections": self.empty_rejections,
+            "size": len(self.timestamps),
+            "capacity": self.capacity,
+            "high_water_mark": self.high_water_mark,
+            "sojourn": {
+                "count": sojourn.count,
+                "mean": sojourn.total / sojourn.count if sojourn.count else 0.0,
+                "max": sojourn.max,
+                "p50": sojourn.quantile(0.5),
+                "p99": sojourn.quantile(0.99),
+            },
+        }
@@ -0,0 +1,113 @@
+"""
+Created on Mon Oct 19 18:01:37 2026
+
+Apply a function to every element of a structure with a pool of worker processes.
+
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterator, List
+
+
+def _apply(func: Callable[[Any], Any], chunk: List[Any]) -> List[Any]:
+    """Apply func to every element of a chunk, runs in the worker processes."""
+    return [func(val) for val in chunk]
+
+
+def _chunks(values: Iterator[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Lazily split values into lists of chunk_size elements."""
+    while True:
+        chunk = list(islice(values, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parallel_imap(
+    values: Iterator[Any],
+    func: Callable[[Any], Any],
+    workers: int = None,
+    chunk_size: int = 1024,
+) -> Iterator[Any]:
+    """Lazily yield func(val) for every value, in order, computed by a pool of processes.
+
+    Only `2 * workers` chunks are in flight at any time, so values are read from the source as the results are consumed.
+
+    Parameters
+    ----------
+    values: iterable
+        The input values.
+
+    func: callable
+        The function to apply, it must be picklable (e.g. defined at the top level of a module).
+
+    workers: int
+        The amount of worker processes. If unspecified, the amount of CPUs is used.
+        default = None
+
+    chunk_size: int
+        The amount of values sent to a worker at once.
+        default = 1024
+    """
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or workers <= 0:
+        raise ValueError("workers must be a positive int.")
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive int.")
+
+    chunks = _chunks(iter(values), chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in islice(chunks, 2 * workers):
+            pending.append(executor.submit(_apply, func, chunk))
+
+        while pending:
+            results = pending.popleft().result()
+            # Keep the workers busy while the results are consumed.
+            for chunk in islice(chunks, 1):
+                pending.append(executor.submit(_apply, func, chunk))
+            yield from results
+
+
+def parallel_map(struct: Any, func: Callable[[Any], Any], workers: int = None, chunk_size: int = 1024) -> Any:
+    """Return a new structure of the same kind holding func(val) for every element of struct, computed by a pool of processes.
+
+    The elements are read in chunks while the workers run, so the structure is never copied as a whole, and the results are added to the new structure in their original order.
+    The structure must not be modified until parallel_map returns.
+
+    Parameters
+    ----------
+    struct: LinkedList, Queue or Stack
+        The source structure.
+
+    func: callable
+        The function to apply, it must be picklable (e.g. defined at the top level of a module).
+
+    workers: int
+        The amount of worker processes. If unspecified, the amount of CPUs is used.
+        default = None
+
+    chunk_size: int
+        The amount of elements sent to a worker at once.
+        default = 1024
+
+    Returns
+    -------
+    result: LinkedList, Queue or Stack
+        A structure of the same kind (and capacity) as struct.
+    """
+
+    if hasattr(struct, "_new_list"):
+        # Linked lists link the results directly after their tail.
+        values = (node.data for node in struct._nodes())
+        return struct._new_list(parallel_imap(values, func, workers, chunk_size))
+
+    result = struct._empty_like()
+    add = result.enqueue if hasattr(result, "enqueue") else result.push
+    for val in parallel_imap(struct._values(), func, workers, chunk_size):
+        add(val)
+    return result
@@ -6,15 +6,68 @@ Created on Wed Mar 02 23:54:12 2022
 Queue data structure implementations using lists and linked lists, and Circular Queue implementation.
 
 """
-from typing import Any
-
-from LinkedLists import SinglyLL
+import sys
+import time
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from itertools import chain
+from typing import Any, Callable, Iterable, Iterator
+
+from .Containers import ContainerMixin, bounded
+from .Features import add_feature, plain_class, register_feature, remove_feature
+from .Filters import BloomFilter, disable_filter, enable_filter
+from .LinkedLists import NodePool, SinglyLL
+from .Memory import payload_size, sequence_usage, shallow_size, with_total
+from .Metrics import QueueMetrics
+from .Parallel import parallel_map
+from .Spill import SpillFile, assert_spill_params
 
 FULL_QUEUE_ERROR_MSG = "Maximum queue capacity reached, unable to store more elements."
 EMPTY_QUEUE_ERROR_MSG = "Queue is empty."
 
 
-class Queue:
+def _metered_class(cls: type) -> type:
+    """Return a subclass of cls that records queue metrics."""
+
+    def enqueue(self, element: Any):
+        if self.full():
+            self._metrics.full_rejections += 1
+        cls.enqueue(self, element)
+        self._metrics.on_enqueue(self._size)
+        return self
+
+    def dequeue(self) -> Any:
+        if self.empty():
+            self._metrics.empty_rejections += 1
+        element = cls.dequeue(self)
+        self._metrics.on_dequeue()
+        return element
+
+    def delete(self) -> None:
+        cls.delete(self)
+        self._metrics.on_delete()
+
+    namespace = {"enqueue": enqueue, "dequeue": dequeue, "delete": delete}
+    if hasattr(cls, "expire"):
+
+        def expire(self, now: float = None) -> int:
+            count = cls.expire(self, now)
+            if count:
+                self._metrics.on_expire(count)
+            return count
+
+        namespace["expire"] = expire
+    for method in namespace.values():
+        method.__doc__ = getattr(cls, method.__name__).__doc__
+    namespace["__module__"] = cls.__module__
+    return type(f"Metered{cls.__name__}", (cls,), namespace)
+
+
+register_feature("metrics", _metered_class)
+
+
+class Queue(ContainerMixin):
     """List-based implementation of Queue data structure.
     
     Parameters
@@ -24,7 +77,7 @@ class Queue:
         default = None
 
     vals: iterable
-        a group of elements that are added to the Queue during its construction. If unspecified, an empty Queue is created. If the number of elements in vals exceeds the specified capacity, An assertion error is raised.
+        a group of elements that are added to the Queue during its construction. If unspecified, an empty Queue is created. If the number of elements in vals exceeds the specified capacity, An assertion error is raised. Iterables without a length, like generators, are consumed lazily and the capacity is checked while they're consumed.
         default = None
 
     Methods
@@ -46,10 +99,44 @@ class Queue:
 
     delete() -> None:
         Remove all elements from the Queue.
+
+    enable_metrics() -> QueueMetrics:
+        Start recording throughput, occupancy and sojourn time metrics.
+
+    disable_metrics() -> QueueMetrics:
+        Stop recording metrics and return the recorded ones.
+
+    stats() -> dict:
+        Return the recorded metrics.
+
+    memory_usage(deep=False) -> dict:
+        Report the memory held by the queue, in bytes.
+
+    from_iter(iterable, capacity=None, on_overflow="raise") -> Queue:
+        Create a queue from any iterable, consuming it lazily.
+
+    to_list() -> list:
+        Return the elements, from the first to the last one.
+
+    drain(n=None) -> list:
+        Remove the n first elements, or all of them, and return them.
+
+    to_array(typecode="d") -> array:
+        Export numeric elements to a typed array, for memoryview() and NumPy.
+
+    enable_filter(fp_rate=0.01, counting=True) -> BloomFilter:
+        Answer most `in` misses without scanning the queue.
+
+    disable_filter() -> BloomFilter:
+        Remove the Bloom filter of the queue.
     """
 
+    _kind = "queue"
+    _add = "enqueue"
+    _remove = "dequeue"
+
     def __init__(self, capacity: int = None, vals: list = None) -> None:
-        self._assert_params(capacity, vals)
+        vals = self._assert_params(capacity, vals)
         self._capacity = capacity
         self._elements = list(vals) if vals else []
         self._size = len(self._elements)
@@ -70,7 +157,12 @@ class Queue:
     def __contains__(self, element) -> bool:
         return element in self._elements
 
-    def _assert_params(self, capacity, vals) -> None:
+    def _assert_params(self, capacity, vals) -> Iterable:
+        """Validate the constructor parameters, and return vals.
+
+        If vals has no length (e.g. a generator), it's wrapped to enforce the capacity while it's consumed, so it doesn't need to be materialized first.
+        """
+
         if capacity is not None:
             if not isinstance(capacity, int):
                 raise TypeError("capacity must be of type 'int'.")
@@ -81,9 +173,13 @@ class Queue:
             if not hasattr(vals, "__iter__"):
                 raise TypeError("vals is not iterable")
             if capacity is not None:
-                assert (
-                    len(vals) <= capacity
-                ), f"Cannot create queue with {len(vals)} elements and max capacity of {capacity}."
+                if hasattr(vals, "__len__"):
+                    assert (
+                        len(vals) <= capacity
+                    ), f"Cannot create queue with {len(vals)} elements and max capacity of {capacity}."
+                else:
+                    vals = bounded(vals, capacity, "queue")
+        return vals
 
     def empty(self) -> bool:
         """Check if the queue is empty."""
@@ -145,6 +241,113 @@ class Queue:
         self._elements = []
         self._size = 0
 
+    def _values(self) -> Iterator[Any]:
+        """Iterate over the elements from the first to the last one."""
+        return iter(self._elements)
+
+    def _empty_like(self) -> "Queue":
+        """Create an empty queue of the same kind and capacity."""
+        return plain_class(type(self))(self._capacity)
+
+    def to_list(self) -> list:
+        """Return a list of the elements, from the first to the last one."""
+        return list(self._values())
+
+    def drain(self, n: int = None) -> list:
+        """Remove the n first elements of the queue and return them in a list.
+
+        Parameters
+        ----------
+        n: int
+            The maximum amount of elements to remove. If unspecified, the queue is emptied.
+            default = None
+
+        Returns
+        -------
+        elements: list
+            The removed elements, from the first one.
+        """
+
+        count = self._drain_count(n)
+        if type(self).dequeue is not Queue.dequeue:
+            # Subclasses and wrappers keep state per dequeued element, and feeding queues refill while they're drained.
+            if n is not None:
+                count = n
+            elements = []
+            while len(elements) < count and not self.empty():
+                elements.append(self.dequeue())
+            return elements
+
+        elements = self._elements[:count]
+        del self._elements[:count]
+        self._size -= count
+        return elements
+
+    def parallel_map(
+        self, func: Callable[[Any], Any], workers: int = None, chunk_size: int = 1024
+    ) -> "Queue":
+        """Return a new queue of the same kind holding func(element) for every element, computed by a pool of processes.
+
+        See Parallel.parallel_map().
+        """
+        return parallel_map(self, func, workers, chunk_size)
+
+    def enable_filter(self, fp_rate: float = 0.01, counting: bool = True) -> BloomFilter:
+        """Put a Bloom filter in front of the `in` operator, so most misses are answered without scanning the queue.
+
+        See Filters.enable_filter().
+        """
+        return enable_filter(self, fp_rate, counting)
+
+    def disable_filter(self) -> BloomFilter:
+        """Remove the Bloom filter of the queue and return it."""
+        return disable_filter(self)
+
+    def memory_usage(self, deep: bool = False) -> dict:
+        """Report the memory held by the queue, in bytes.
+
+        Parameters
+        ----------
+        deep: bool
+            Whether to include the elements, and the objects they refer to, as the "payload" component. Objects referenced several times are counted once.
+            default = False
+
+        Returns
+        -------
+        breakdown: dict
+            Bytes used by each component, see Memory.sequence_usage(), and their "total".
+        """
+
+        return sequence_usage(self, self._elements, deep)
+
+    def enable_metrics(self) -> QueueMetrics:
+        """Start recording throughput, occupancy and sojourn time metrics.
+
+        The queue class is swapped for a metered subclass, so a queue without metrics runs the original methods without any extra work.
+        Elements already in the queue are treated as if they were enqueued right now.
+
+        Returns
+        -------
+        metrics: QueueMetrics
+        """
+
+        if not hasattr(self, "_metrics"):
+            self._metrics = QueueMetrics(self._capacity, self._size)
+            add_feature(self, "metrics")
+        return self._metrics
+
+    def disable_metrics(self) -> QueueMetrics:
+        """Stop recording metrics and return the recorded ones."""
+        metrics = self.__dict__.pop("_metrics", None)
+        if metrics is not None:
+            remove_feature(self, "metrics")
+        return metrics
+
+    def stats(self) -> dict:
+        """Return the recorded metrics, see QueueMetrics.stats()."""
+        assert hasattr(self, "_metrics"), "Metrics are not enabled, call enable_metrics() first."
+        return self._metrics.stats()
+
 
 class QueueLL(Queue):
     """LinkedList-based implementation of Queue data structure.
@@ -156,7 +359,11 @@ class QueueLL(Queue):
         default = None
 
     vals: iterable
-        a group of elements that are added to the Queue during its construction. If unspecified, an empty Queue is created. If the number of elements in vals exceeds the specified capacity, An assertion error is raised.
+        a group of elements that are added to the Queue during its construction. If unspecified, an empty Queue is created. If the number of elements in vals exceeds the specified capacity, An assertion error is raised. Iterables without a length, like generators, are consumed lazily and the capacity is checked while they're consumed.
+        default = None
+
+    pool: NodePool
+        A pool that provides the linked list nodes and receives them back once elements are removed.
         default = None
 
     Methods
@@ -178,12 +385,42 @@ class QueueLL(Queue):
 
     delete() -> None:
         Remove all elements from the Queue.
+
+    enable_metrics() -> QueueMetrics:
+        Start recording throughput, occupancy and sojourn time metrics.
+
+    disable_metrics() -> QueueMetrics:
+        Stop recording metrics and return the recorded ones.
+
+    stats() -> dict:
+        Return the recorded metrics.
+
+    memory_usage(deep=False) -> dict:
+        Report the memory held by the queue, in bytes.
+
+    from_iter(iterable, capacity=None, on_overflow="raise") -> Queue:
+        Create a queue from any iterable, consuming it lazily.
+
+    to_list() -> list:
+        Return the elements, from the first to the last one.
+
+    drain(n=None) -> list:
+        Remove the n first elements, or all of them, and return them.
+
+    to_array(typecode="d") -> array:
+        Export numeric elements to a typed array, for memoryview() and NumPy.
+
+    enable_filter(fp_rate=0.01, counting=True) -> BloomFilter:
+        Answer most `in` misses without scanning the queue.
+
+    disable_filter() -> BloomFilter:
+        Remove the Bloom filter of the queue.
     """
 
-    def __init__(self, capacity: int = None, vals: list = None) -> None:
-        self._assert_params(capacity, vals)
+    def __init__(self, capacity: int = None, vals: list = None, pool: NodePool = None) -> None:
+        vals = self._assert_params(capacity, vals)
         self._capacity = capacity
-        self._elements = SinglyLL(vals)
+        self._elements = SinglyLL(vals, pool=pool)
         self._size = len(self._elements)
 
     def enqueue(self, element: Any):
@@ -222,11 +459,32 @@ class QueueLL(Queue):
         self._size -= 1
         return removed_element
 
+    def peek(self) -> Any:
+        """Access the first element of the queue.
+
+        Returns
+        -------
+        Element: Any
+            The first element in the queue.
+        """
+
+        assert not self.empty(), EMPTY_QUEUE_ERROR_MSG
+
+        return self._elements.head.data
+
     def delete(self) -> None:
         """Remove all elements from the Queue."""
         self._elements.delete()
         self._size = 0
 
+    def _values(self) -> Iterator[Any]:
+        """Iterate over the elements from the first to the last one."""
+        return (node.data for node in self._elements._nodes())
+
+    def _empty_like(self) -> "Queue":
+        """Create an empty queue of the same kind and capacity."""
+        return plain_class(type(self))(self._capacity, pool=self._elements._pool)
+
 
 class QueueCirc(Queue):
     """a List-based implementation of the Circular Queue data structure. It is a special version of queue where the last element of the queue is connected to the first element of the queue forming a circle.
@@ -256,9 +514,46 @@ class QueueCirc(Queue):
 
     delete() -> None:
         Remove all elements from the Queue.
+
+    enable_metrics() -> QueueMetrics:
+        Start recording throughput, occupancy and sojourn time metrics.
+
+    disable_metrics() -> QueueMetrics:
+        Stop recording metrics and return the recorded ones.
+
+    stats() -> dict:
+        Return the recorded metrics.
+
+    memory_usage(deep=False) -> dict:
+        Report the memory held by the queue, in bytes.
+
+    from_iter(iterable, capacity=None, on_overflow="raise") -> Queue:
+        Create a queue from any iterable, consuming it lazily.
+
+    to_list() -> list:
+        Return the elements, from the first to the last one.
+
+    drain(n=None) -> list:
+        Remove the n first elements, or all of them, and return them.
+
+    to_array(typecode="d") -> array:
+        Export numeric elements to a typed array, for memoryview() and NumPy.
+
+    segments() -> list:
+        Return the elements as at most two lists copied from the ring buffer, in logical order.
+
+    enable_filter(fp_rate=0.01, counting=True) -> BloomFilter:
+        Answer most `in` misses without scanning the queue.
+
+    disable_filter() -> BloomFilter:
+        Remove the Bloom filter of the queue.
     """
 
     def __init__(self, capacity: int) -> None:
+        # The ring is preallocated, so it can't be limitless, e.g. when from_iter() is called without a capacity.
+        if capacity is None:
+            raise TypeError("capacity must be of type 'int'.")
+        self._assert_params(capacity, None)
         self._capacity = capacity
         self._elements = capacity * [None]
         self._first = 0
@@ -268,6 +563,14 @@ class QueueCirc(Queue):
     def __len__(self) -> int:
         return self._size
 
+    # Read through _values(), so the padding of the ring is never visible and subclasses can hide their stale elements.
+    def __iter__(self):
+        self._queue_iterator = self._values()
+        return self
+
+    def __contains__(self, element) -> bool:
+        return element in self._values()
+
     def empty(self) -> bool:
         """Check if the queue is empty."""
         return self._size == 0
@@ -332,3 +635,947 @@ class QueueCirc(Queue):
         self._first = 0
         self._last = -1
         self._size = 0
+
+    def _values(self) -> Iterator[Any]:
+        """Iterate over the elements from the first to the last one."""
+        elements, capacity, first = self._elements, self._capacity, self._first
+        return (elements[(first + i) % capacity] for i in range(self._size))
+
+    def _runs(self, count: int) -> list:
+        """Return the (start, stop) slices of the buffer holding the count first elements, at most two of them."""
+        if not count:
+            return []
+        first, end = self._first, self._first + count
+        if end <= self._capacity:
+            return [(first, end)]
+        return [(first, self._capacity), (0, end - self._capacity)]
+
+    def segments(self) -> list:
+        """Return the elements as at most two lists, copied from the contiguous runs of the ring buffer in logical order.
+
+        Returns
+        -------
+        segments: list
+            The lists of elements, from the first one; empty if the queue is empty.
+        """
+
+        # len() first, so subclasses drop their stale elements.
+        count = len(self)
+        return [self._elements[start:stop] for start, stop in self._runs(count)]
+
+    def to_list(self) -> list:
+        """Return a list of the elements, from the first to the last one."""
+        segments = self.segments()
+        return segments[0] + segments[1] if len(segments) == 2 else (segments[0] if segments else [])
+
+    def drain(self, n: int = None) -> list:
+        """Remove the n first elements of the queue and return them in a list.
+
+        Parameters
+        ----------
+        n: int
+            The maximum amount of elements to remove. If unspecified, the queue is emptied.
+            default = None
+
+        Returns
+        -------
+        elements: list
+            The removed elements, from the first one.
+        """
+
+        if type(self).dequeue is not QueueCirc.dequeue:
+            return super().drain(n)
+
+        count = self._drain_count(n)
+        elements = []
+        for start, stop in self._runs(count):
+            elements += self._elements[start:stop]
+            self._elements[start:stop] = [None] * (stop - start)
+        self._first = (self._first + count) % self._capacity
+        self._size -= count
+        return elements
+
+
+class QueueTTL(QueueCirc):
+    """Circular Queue whose elements expire `ttl` seconds after they were enqueued, e.g. the request timestamps of a sliding-window rate limiter.
+
+    Expired elements are dropped lazily, whenever the queue is used, so they never have to be dequeued by hand.
+    Enqueue times are kept in a compact `array` ring next to the elements, and since they never decrease, a run of expired elements is found with a binary search and dropped at once.
+    Like the Circular Queue, all the storage is allocated by the constructor and never grows.
+
+    Parameters
+    ----------
+    capacity: int
+        Determine the maximum amount of live elements a Queue can carry.
+
+    ttl: float
+        The amount of seconds an element stays in the queue.
+
+    clock: callable
+        Return the current time in seconds, it must never go backwards.
+        default = time.monotonic
+
+    Methods
+    -------
+    empty() -> bool:
+        Check if the queue is empty.
+
+    full() -> bool:
+        Check if the queue is full.
+
+    enqueue(element) -> self:
+        Add an element to the end of the queue.
+
+    dequeue() -> Any:
+        pop the first element in the queue.
+
+    peek() -> Any:
+        Access the first element of the queue.
+
+    expire(now=None) -> int:
+        Drop the elements that expired at time `now`.
+
+    delete() -> None:
+        Remove all elements from the Queue.
+
+    enable_metrics() -> QueueMetrics:
+        Start recording throughput, occupancy and sojourn time metrics.
+
+    disable_metrics() -> QueueMetrics:
+        Stop recording metrics and return the recorded ones.
+
+    stats() -> dict:
+        Return the recorded metrics.
+
+    memory_usage(deep=False) -> dict:
+        Report the memory held by the queue, in bytes.
+
+    from_iter(iterable, capacity=None, on_overflow="raise") -> Queue:
+        Create a queue from any iterable, consuming it lazily.
+
+    to_list() -> list:
+        Return the elements, from the first to the last one.
+
+    drain(n=None) -> list:
+        Remove the n first elements, or all of them, and return them.
+
+    to_array(typecode="d") -> array:
+        Export numeric elements to a typed array, for memoryview() and NumPy.
+
+    segments() -> list:
+        Return the elements as at most two lists copied from the ring buffer, in logical order.
+
+    enable_filter(fp_rate=0.01, counting=True) -> BloomFilter:
+        Answer most `in` misses without scanning the queue.
+
+    disable_filter() -> BloomFilter:
+        Remove the Bloom filter of the queue.
+    """
+
+    def __init__(self, capacity: int, ttl: float, clock: Callable[[], float] = time.monotonic) -> None:
+        if capacity is None:
+            raise TypeError("capacity must be of type 'int'.")
+        self._assert_params(capacity, None)
+        if not isinstance(ttl, (int, float)) or isinstance(ttl, bool):
+            raise TypeError("ttl must be a number.")
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than zero.")
+        if not callable(clock):
+            raise TypeError("clock must be callable.")
+
+        super().__init__(capacity)
+        self._ttl = ttl
+        self._clock = clock
+        self._times = array("d", bytes(8 * capacity))
+
+    def __repr__(self) -> str:
+        return f"QueueTTL({list(self._values())}, ttl={self._ttl})"
+
+    def __len__(self) -> int:
+        self.expire()
+        return self._size
+
+    def empty(self) -> bool:
+        """Check if the queue is empty."""
+        self.expire()
+        return self._size == 0
+
+    def full(self) -> bool:
+        """Check if the queue is full."""
+        self.expire()
+        return self._size == self._capacity
+
+    def expire(self, now: float = None) -> int:
+        """Drop the elements that expired at time `now`, the ones enqueued `ttl` seconds before it or earlier.
+
+        Parameters
+        ----------
+        now: float
+            The current time, as returned by the clock. If unspecified, the clock is called.
+            default = None
+
+        Returns
+        -------
+        count: int
+            The amount of dropped elements.
+        """
+
+        if now is None:
+            now = self._clock()
+        cutoff = now - self._ttl
+
+        times, first, size = self._times, self._first, self._size
+        # Most calls find a fresh first element.
+        if not size or times[first] > cutoff:
+            return 0
+
+        # The live elements span at most two runs of the ring: [first, end) and [0, wrapped).
+        capacity = self._capacity
+        end = min(first + size, capacity)
+        wrapped = first + size - end
+        count = bisect_right(times, cutoff, first, end) - first
+        if count == end - first and wrapped:
+            count += bisect_right(times, cutoff, 0, wrapped)
+
+        self._drop(count)
+        return count
+
+    def _drop(self, count: int) -> None:
+        """Remove the count first elements at once, releasing their references."""
+        first, capacity, elements = self._first, self._capacity, self._elements
+        stop = first + count
+        if stop <= capacity:
+            elements[first:stop] = [None] * count
+        else:
+            elements[first:] = [None] * (capacity - first)
+            elements[: stop - capacity] = [None] * (stop - capacity)
+        self._first = stop % capacity
+        self._size -= count
+
+    def enqueue(self, element: Any):
+        """Add an element to the end of the queue, stamped with the current time.
+
+        Parameters
+        ----------
+        element: Any
+            The element that is added to the queue.
+
+        Returns
+        -------
+        self
+        """
+
+        now = self._clock()
+        self.expire(now)
+        assert self._size < self._capacity, FULL_QUEUE_ERROR_MSG
+        if self._size and now < self._times[self._last]:
+            raise ValueError("clock went backwards.")
+
+        self._last = (self._last + 1) % self._capacity
+        self._elements[self._last] = element
+        self._times[self._last] = now
+        self._size += 1
+        return self
+
+    def dequeue(self) -> Any:
+        """pop the first live element in the queue.
+
+        Returns
+        -------
+        Element: Any
+            The first live element in the queue.
+        """
+
+        self.expire()
+        return super().dequeue()
+
+    def peek(self) -> Any:
+        """Access the first live element in the queue.
+
+        Returns
+        -------
+        Element: Any
+            The first live element in the queue.
+        """
+
+        self.expire()
+        return super().peek()
+
+    def _values(self) -> Iterator[Any]:
+        """Iterate over the live elements from the first to the last one."""
+        self.expire()
+        return super()._values()
+
+    def _empty_like(self) -> "QueueTTL":
+        """Create an empty queue with the same capacity, ttl and clock."""
+        return plain_class(type(self))(self._capacity, self._ttl, self._clock)
+
+    def memory_usage(self, deep: bool = False) -> dict:
+        """Report the memory held by the queue, in bytes.
+
+        Parameters
+        ----------
+        deep: bool
+            Whether to include the elements, and the objects they refer to, as the "payload" component. Objects referenced several times are counted once.
+            default = False
+
+        Returns
+        -------
+        breakdown: dict
+            Bytes used by each component, see Memory.sequence_usage(), the enqueue "timestamps", and their "total".
+        """
+
+        breakdown = sequence_usage(self, self._elements, deep)
+        breakdown.pop("total")
+        breakdown["timestamps"] = sys.getsizeof(self._times)
+        return with_total(breakdown)
+
+
+class QueueWindow(QueueCirc):
+    """Circular Queue of numbers that keeps aggregates of the current window up to date, e.g. the latest samples shown on a dashboard.
+
+    The sum, mean and variance are updated in O(1) time on every enqueue and dequeue, using compensated summation and Welford's algorithm so rounding errors don't pile up over long runs.
+    A sorted copy of the window is kept up to date with binary searches, so quantiles are read without sorting.
+
+    Parameters
+    ----------
+    capacity: int
+        Determine the maximum amount of elements a Queue can carry.
+
+    Methods
+    -------
+    empty() -> bool:
+        Check if the queue is empty.
+
+    full() -> bool:
+        Check if the queue is full.
+
+    enqueue(element) -> self:
+        Add a number to the end of the queue.
+
+    dequeue() -> Any:
+        pop the first number in the queue.
+
+    peek() -> Any:
+        Access the first number of the queue.
+
+    sum() -> float:
+        Sum of the numbers in the queue.
+
+    mean() -> float:
+        Mean of the numbers in the queue.
+
+    variance(ddof=0) -> float:
+        Variance of the numbers in the queue.
+
+    quantile(q) -> float:
+        The q-quantile of the numbers in the queue.
+
+    delete() -> None:
+        Remove all elements from the Queue.
+
+    enable_metrics() -> QueueMetrics:
+        Start recording throughput, occupancy and sojourn time metrics.
+
+    disable_metrics() -> QueueMetrics:
+        Stop recording metrics and return the recorded ones.
+
+    stats() -> dict:
+        Return the recorded metrics.
+
+    memory_usage(deep=False) -> dict:
+        Report the memory held by the queue, in bytes.
+
+    from_iter(iterable, capacity=None, on_overflow="raise") -> Queue:
+        Create a queue from any iterable, consuming it lazily.
+
+    to_list() -> list:
+        Return the elements, from the first to the last one.
+
+    drain(n=None) -> list:
+        Remove the n first elements, or all of them, and return them.
+
+    to_array(typecode="d") -> array:
+        Export numeric elements to a typed array, for memoryview() and NumPy.
+
+    segments() -> list:
+        Return the elements as at most two lists copied from the ring buffer, in logical order.
+
+    enable_filter(fp_rate=0.01, counting=True) -> BloomFilter:
+        Answer most `in` misses without scanning the queue.
+
+    disable_filter() -> BloomFilter:
+        Remove the Bloom filter of the queue.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity is None:
+            raise TypeError("capacity must be of type 'int'.")
+        self._assert_params(capacity, None)
+
+        super().__init__(capacity)
+        self._reset_aggregates()
+
+    def __repr__(self) -> str:
+        return f"QueueWindow({list(self._values())})"
+
+    def _reset_aggregates(self) -> None:
+        self._sum = 0.0
+        # Neumaier compensation of the rounding errors of _sum.
+        self._sum_error = 0.0
+        self._mean = 0.0
+        # Sum of squared differences from the mean.
+        self._m2 = 0.0
+        self._sorted = []
+
+    def _add_to_sum(self, value: float) -> None:
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._sum_error += (self._sum - total) + value
+        else:
+            self._sum_error += (value - total) + self._sum
+        self._sum = total
+
+    def enqueue(self, element: float):
+        """Add a number to the end of the queue.
+
+        Parameters
+        ----------
+        element: int or float
+            The number that is added to the queue.
+
+        Returns
+        -------
+        self
+        """
+
+        if not isinstance(element, (int, float)) or isinstance(element, bool):
+            raise TypeError("element must be a number.")
+        if element != element:
+            raise ValueError("element can't be NaN.")
+
+        super().enqueue(element)
+        self._add_to_sum(element)
+        delta = element - self._mean
+        self._mean += delta / self._size
+        self._m2 += delta * (element - self._mean)
+        insort(self._sorted, element)
+        return self
+
+    def dequeue(self) -> float:
+        """pop the first number in the queue.
+
+        Returns
+        -------
+        Element: int or float
+            The first number in the queue.
+        """
+
+        element = super().dequeue()
+        if not self._size:
+            self._reset_aggregates()
+            return element
+
+        self._add_to_sum(-element)
+        delta = element - self._mean
+        self._mean -= delta / self._size
+        self._m2 = max(0.0, self._m2 - delta * (element - self._mean))
+        del self._sorted[bisect_left(self._sorted, element)]
+        return element
+
+    def delete(self) -> None:
+        """Remove all elements from the Queue."""
+        super().delete()
+        self._reset_aggregates()
+
+    def sum(self) -> float:
+        """Sum of the numbers in the queue, 0 if it's empty."""
+        return self._sum + self._sum_error
+
+    def mean(self) -> float:
+        """Mean of the numbers in the queue."""
+        assert not self.empty(), EMPTY_QUEUE_ERROR_MSG
+        return self._mean
+
+    def variance(self, ddof: int = 0) -> float:
+        """Variance of the numbers in the queue.
+
+        Parameters
+        ----------
+        ddof: int
+            Delta degrees of freedom, the divisor is the amount of numbers minus ddof. Use 1 for the sample variance.
+            default = 0
+        """
+
+        if not isinstance(ddof, int) or ddof < 0:
+            raise ValueError("ddof must be a non-negative int.")
+        assert self._size > ddof, f"variance needs more than {ddof} elements."
+        return self._m2 / (self._size - ddof)
+
+    def quantile(self, q: float) -> float:
+        """The q-quantile of the numbers in the queue, interpolated linearly between the closest ranks.
+
+        Parameters
+        ----------
+        q: float
+            Between 0 and 1, e.g. 0.5 for the median and 1 for the largest number.
+        """
+
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1.")
+        assert not self.empty(), EMPTY_QUEUE_ERROR_MSG
+
+        rank = q * (self._size - 1)
+        lower = int(rank)
+        if lower == self._size - 1:
+            return self._sorted[lower]
+        low, high = self._sorted[lower], self._sorted[lower + 1]
+        return low + (high - low) * (rank - lower)
+
+    def memory_usage(self, deep: bool = False) -> dict:
+        """Report the memory held by the queue, in bytes.
+
+        Parameters
+        ----------
+        deep: bool
+            Whether to include the elements, and the objects they refer to, as the "payload" component. Objects referenced several times are counted once.
+            default = False
+
+        Returns
+        -------
+        breakdown: dict
+            Bytes used by each component, see Memory.sequence_usage(), the sorted copy of the window as "ranks", and their "total".
+        """
+
+        breakdown = sequence_usage(self, self._elements, deep)
+        breakdown.pop("total")
+        breakdown["ranks"] = sys.getsizeof(self._sorted)
+        return with_total(breakdown)
+
+
+class QueueSpill(Queue):
+    """Spill-to-disk implementation of Queue data structure.
+
+    The head and tail windows of the queue are kept in memory, while the cold middle is written to a temporary file in blocks of `block_size` elements. Once the head window is empty, the next block is read back from disk, and the tail window is spilled first if the block wouldn't fit within `memory_limit`.
+    Elements must be picklable.
+    
+    Parameters
+    ----------
+    capacity: int
+        Determine the maximum amount of elements a Queue can carry. If unspecified, Queue capacity will be limitless.
+        default = None
+
+    vals: iterable
+        a group of elements that are added to the Queue during its construction. If unspecified, an empty Queue is created. If the number of elements in vals exceeds the specified capacity, An assertion error is raised. Iterables without a length, like generators, are consumed lazily and the capacity is checked while they're consumed.
+        default = None
+
+    memory_limit: int
+        The maximum amount of elements kept in memory. Elements beyond this limit are moved to disk.
+        default = 65536
+
+    block_size: int
+        The amount of elements written to or read from disk at once, at most half of `memory_limit`. If unspecified, a quarter of `memory_limit` is used.
+        default = None
+
+    Methods
+    -------
+    empty() -> bool:
+        Check if the queue is empty.
+
+    full() -> bool:
+        Check if the queue is full.
+
+    enqueue(element) -> self:
+        Add an element to the end of the queue.
+
+    dequeue() -> Any:
+        pop the first element in the queue.
+
+    peek() -> Any:
+        Access the first element of the queue.
+
+    delete() -> None:
+        Remove all elements from the Queue.
+
+    enable_metrics() -> QueueMetrics:
+        Start recording throughput, occupancy and sojourn time metrics.
+
+    disable_metrics() -> QueueMetrics:
+        Stop recording metrics and return the recorded ones.
+
+    stats() -> dict:
+        Return the recorded metrics.
+
+    memory_usage(deep=False) -> dict:
+        Report the memory held by the queue, in bytes.
+
+    from_iter(iterable, capacity=None, on_overflow="raise") -> Queue:
+        Create a queue from any iterable, consuming it lazily.
+
+    to_list() -> list:
+        Return the elements, from the first to the last one.
+
+    drain(n=None) -> list:
+        Remove the n first elements, or all of them, and return them.
+
+    to_array(typecode="d") -> array:
+        Export numeric elements to a typed array, for memoryview() and NumPy.
+
+    enable_filter(fp_rate=0.01, counting=True) -> BloomFilter:
+        Answer most `in` misses without scanning the queue.
+
+    disable_filter() -> BloomFilter:
+        Remove the Bloom filter of the queue.
+    """
+
+    def __init__(
+        self,
+        capacity: int = None,
+        vals: list = None,
+        memory_limit: int = 65536,
+        block_size: int = None,
+    ) -> None:
+        if block_size is None:
+            block_size = max(1, memory_limit // 4) if isinstance(memory_limit, int) else None
+        assert_spill_params(memory_limit, block_size)
+        vals = self._assert_params(capacity, vals)
+        self._capacity = capacity
+        self._memory_limit = memory_limit
+        self._block_size = block_size
+        # Logical order of the elements is: head, spilled blocks, tail.
+        self._head = deque()
+        self._spill = SpillFile()
+        self._tail = []
+        self._size = 0
+
+        if vals:
+            for val in vals:
+                self.enqueue(val)
+
+    def __repr__(self) -> str:
+        return f"QueueSpill({list(self)})"
+
+    def __iter__(self):
+        self._queue_iterator = chain(self._head, self._spill, self._tail)
+        return self
+
+    def __contains__(self, element) -> bool:
+        return any(val == element for val in chain(self._head, self._spill, self._tail))
+
+    def _in_memory(self) -> int:
+        return len(self._head) + len(self._tail)
+
+    def _values(self) -> Iterator[Any]:
+        """Iterate over the elements from the first to the last one."""
+        return chain(self._head, self._spill, self._tail)
+
+    def _empty_like(self) -> "Queue":
+        """Create an empty queue of the same kind, capacity and memory limits."""
+        return plain_class(type(self))(
+            self._capacity, memory_limit=self._memory_limit, block_size=self._block_size
+        )
+
+    def _spill_tail(self) -> None:
+        """Move the tail window to disk in whole blocks, oldest first."""
+        block_size = self._block_size
+        spilled = len(self._tail) - len(self._tail) % block_size
+        for start in range(0, spilled, block_size):
+            self._spill.push(self._tail[start : start + block_size])
+        del self._tail[:spilled]
+
+    def _refill(self) -> None:
+        """Page the next block of the queue into the head window once it runs out.
+
+        The head window never holds more than `block_size` elements, so the tail window always has a whole block to spill when the memory limit is reached.
+        """
+
+        if self._head:
+            return
+
+        block_size = self._block_size
+        if len(self._spill):
+            if self._in_memory() + block_size > self._memory_limit:
+                self._spill_tail()
+            self._head.extend(self._spill.pop_first())
+        elif len(self._tail) <= block_size:
+            self._head.extend(self._tail)
+            self._tail = []
+        else:
+            self._head.extend(self._tail[:block_size])
+            del self._tail[:block_size]
+
+    def enqueue(self, element: Any):
+        """Add an element to the end of the queue.
+        
+        Parameters
+        ----------
+        element: Any
+            The element that is added to the queue.
+
+        Returns
+        -------
+        self
+        """
+
+        assert not self.full(), FULL_QUEUE_ERROR_MSG
+
+        if self._in_memory() >= self._memory_limit:
+            self._spill_tail()
+
+        if not len(self._spill) and not self._tail and len(self._head) < self._block_size:
+            self._head.append(element)
+        else:
+            self._tail.append(element)
+        self._size += 1
+        return self
+
+    def dequeue(self) -> Any:
+        """pop the first element in the queue.
+
+        Returns
+        -------
+        Element: Any
+            The first element in the queue.
+        """
+
+        assert not self.empty(), EMPTY_QUEUE_ERROR_MSG
+
+        self._refill()
+        self._size -= 1
+        element = self._head.popleft()
+        self._refill()
+        return element
+
+    def peek(self) -> Any:
+        """Access the first element of the queue.
+
+        Returns
+        -------
+        Element: Any
+            The first element in the queue.
+        """
+
+        assert not self.empty(), EMPTY_QUEUE_ERROR_MSG
+
+        self._refill()
+        return self._head[0]
+
+    def memory_usage(self, deep: bool = False) -> dict:
+        """Report the memory held by the queue, in bytes.
+
+        Parameters
+        ----------
+        deep: bool
+            Whether to include the elements, and the objects they refer to, as the "payload" component. Objects referenced several times are counted once.
+            default = False
+
+        Returns
+        -------
+        breakdown: dict
+            Bytes used by each component: "container", "storage" for the in-memory windows and the index of spilled blocks, "disk" for the spilled bytes (not part of the total), and their "total".
+        """
+
+        breakdown = {
+            "container": shallow_size(self) + shallow_size(self._spill),
+            "storage": sys.getsizeof(self._head)
+            + sys.getsizeof(self._tail)
+            + sys.getsizeof(self._spill._blocks),
+            "disk": self._spill._end,
+        }
+        if deep:
+            breakdown["payload"] = payload_size(chain(self._head, self._tail))
+        return with_total(breakdown)
+
+    def delete(self) -> None:
+        """Remove all elements from the Queue."""
+        self._head = deque()
+        self._spill.clear()
+        self._tail = []
+        self._size = 0
+
+
+class MinMaxQueue(QueueLL):
+    """LinkedList-based Queue that tracks its smallest and largest elements, so min() and max() take O(1) time.
+
+    Two monotonic deques hold the elements that may still become the smallest (or largest) one, together with their keys. Each element enters and leaves them at most once, so enqueue and dequeue stay amortized O(1).
+
+    Parameters
+    ----------
+    capacity: int
+        Determine the maximum amount of elements a Queue can carry. If unspecified, Queue capacity will be limitless.
+        default = None
+
+    vals: iterable
+        a group of elements that are added to the Queue during its construction. If unspecified, an empty Queue is created. If the number of elements in vals exceeds the specified capacity, An assertion error is raised. Iterables without a length, like generators, are consumed lazily and the capacity is checked while they're consumed.
+        default = None
+
+    pool: NodePool
+        A pool of nodes shared with other linked lists, see LinkedList.
+        default = None
+
+    key: callable
+        Compute the value the elements are compared by, like the key of the builtin min(). If unspecified, the elements are compared directly.
+        default = None
+
+    Methods
+    -------
+    empty() -> bool:
+        Check if the queue is empty.
+
+    full() -> bool:
+        Check if the queue is full.
+
+    enqueue(element) -> self:
+        Add an element to the end of the queue.
+
+    dequeue() -> Any:
+        pop the first element in the queue.
+
+    peek() -> Any:
+        Access the first element of the queue.
+
+    min() -> Any:
+        Access the smallest element of the queue.
+
+    max() -> Any:
+        Access the largest element of the queue.
+
+    delete() -> None:
+        Remove all elements from the Queue.
+
+    enable_metrics() -> QueueMetrics:
+        Start recording throughput, occupancy and sojourn time metrics.
+
+    disable_metrics() -> QueueMetrics:
+        Stop recording metrics and return the recorded ones.
+
+    stats() -> dict:
+        Return the recorded metrics.
+
+    memory_usage(deep=False) -> dict:
+        Report the memory held by the queue, in bytes.
+
+    from_iter(iterable, capacity=None, on_overflow="raise") -> Queue:
+        Create a queue from any iterable, consuming it lazily.
+
+    to_list() -> list:
+        Return the elements, from the first to the last one.
+
+    drain(n=None) -> list:
+        Remove the n first elements, or all of them, and return them.
+
+    to_array(typecode="d") -> array:
+        Export numeric elements to a typed array, for memoryview() and NumPy.
+
+    enable_filter(fp_rate=0.01, counting=True) -> BloomFilter:
+        Answer most `in` misses without scanning the queue.
+
+    disable_filter() -> BloomFilter:
+        Remove the Bloom filter of the queue.
+    """
+
+    def __init__(
+        self,
+        capacity: int = None,
+        vals: list = None,
+        pool: NodePool = None,
+        key: Callable[[Any], Any] = None,
+    ) -> None:
+        if key is not None and not callable(key):
+            raise TypeError("key must be callable.")
+
+        self._key = key
+        self._mins = deque()
+        self._maxs = deque()
+        super().__init__(capacity, vals, pool)
+        for element in self._values():
+            self._track(element)
+
+    def _track(self, element: Any) -> None:
+        """Add an element enqueued at the end of the queue to the monotonic deques."""
+        key = element if self._key is None else self._key(element)
+        mins, maxs = self._mins, self._maxs
+        # Equal keys are kept, so dequeuing one of several equal elements leaves the others tracked.
+        while mins and mins[-1][0] > key:
+            mins.pop()
+        mins.append((key, element))
+        while maxs and maxs[-1][0] < key:
+            maxs.pop()
+        maxs.append((key, element))
+
+    def enqueue(self, element: Any):
+        """Add an element to the end of the queue.
+
+        Parameters
+        ----------
+        element: Any
+            The element that is added to the queue.
+
+        Returns
+        -------
+        self
+        """
+
+        super().enqueue(element)
+        self._track(element)
+        return self
+
+    def dequeue(self) -> Any:
+        """pop the first element in the queue.
+
+        Returns
+        -------
+        Element: Any
+            The first element in the queue.
+        """
+
+        element = super().dequeue()
+        key = element if self._key is None else self._key(element)
+        if key == self._mins[0][0]:
+            self._mins.popleft()
+        if key == self._maxs[0][0]:
+            self._maxs.popleft()
+        return element
+
+    def min(self) -> Any:
+        """Access the smallest element of the queue, the first one if several are equal."""
+        assert not self.empty(), EMPTY_QUEUE_ERROR_MSG
+        return self._mins[0][1]
+
+    def max(self) -> Any:
+        """Access the largest element of the queue, the first one if several are equal."""
+        assert not self.empty(), EMPTY_QUEUE_ERROR_MSG
+        return self._maxs[0][1]
+
+    def delete(self) -> None:
+        """Remove all elements from the Queue."""
+        super().delete()
+        self._mins.clear()
+        self._maxs.clear()
+
+    def _empty_like(self) -> "MinMaxQueue":
+        """Create an empty queue with the same capacity, pool and key."""
+        return plain_class(type(self))(self._capacity, pool=self._elements._pool, key=self._key)
+
+    def memory_usage(self, deep: bool = False) -> dict:
+        """Report the memory held by the queue, in bytes.
+
+        Parameters
+        ----------
+        deep: bool
+            Whether to include the elements, and the objects they refer to, as the "payload" component. Objects referenced several times are counted once.
+            default = False
+
+        Returns
+        -------
+        breakdown: dict
+            Bytes used by each component, see Memory.sequence_usage(), the monotonic deques as "extrema", and their "total".
+        """
+
+        breakdown = super().memory_usage(deep)
+        breakdown.pop("total")
+        breakdown["extrema"] = sum(
+            sys.getsizeof(aux) + sum(sys.getsizeof(entry) for entry in aux)
+            for aux in (self._mins, self._maxs)
+        )
+        return with_total(breakdown)
@@ -0,0 +1,524 @@
+"""
+Created on Mon Oct 19 19:12:05 2026
+
+Work-stealing deque and a thread pool scheduler that gives each worker its own deque, and a fair scheduler dispatching the jobs of many tenant queues.
+
+"""
+import os
+import random
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Tuple
+
+from .LinkedLists import DoublyLL, Node
+from .Queues import QueueLL
+
+EMPTY_DEQUE_ERROR_MSG = "Deque is empty."
+EMPTY_SCHEDULER_ERROR_MSG = "Scheduler has no pending jobs."
+
+
+class WorkStealingDeque:
+    """Double-ended task queue owned by a single worker.
+
+    The owner pushes and pops tasks at the bottom (LIFO), so it keeps working on the most recent and cache-warm tasks, while other workers steal the oldest tasks from the top (FIFO), which tend to be the biggest ones in recursive workloads.
+    Both ends are operated through the atomic append, pop and popleft of `collections.deque`, so the owner and the thieves never take a lock.
+
+    Parameters
+    ----------
+    vals: iterable
+        a group of tasks that are added to the deque during its construction, from the top to the bottom. If unspecified, an empty deque is created.
+        default = None
+
+    Methods
+    -------
+    empty() -> bool:
+        Check if the deque is empty.
+
+    push(task) -> self:
+        Add a task to the bottom of the deque, called by the owner.
+
+    pop() -> Any:
+        Remove the bottom task of the deque, called by the owner.
+
+    steal() -> Any:
+        Remove the top task of the deque, called by the other workers.
+    """
+
+    def __init__(self, vals: Iterable = None) -> None:
+        if vals is not None and not hasattr(vals, "__iter__"):
+            raise TypeError("vals is not iterable")
+        self._tasks = deque(vals) if vals is not None else deque()
+
+    def __repr__(self) -> str:
+        return f"WorkStealingDeque({list(self._tasks)})"
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def empty(self) -> bool:
+        """Check if the deque is empty."""
+        return not self._tasks
+
+    def push(self, task: Any) -> "WorkStealingDeque":
+        """Add a task to the bottom of the deque, called by the owner."""
+        self._tasks.append(task)
+        return self
+
+    def pop(self) -> Any:
+        """Remove the bottom task of the deque, called by the owner."""
+        # Checking empty() first would race with the thieves.
+        try:
+            return self._tasks.pop()
+        except IndexError:
+            raise AssertionError(EMPTY_DEQUE_ERROR_MSG) from None
+
+    def steal(self) -> Any:
+        """Remove the top task of the deque, called by the other workers."""
+        try:
+            return self._tasks.popleft()
+        except IndexError:
+            raise AssertionError(EMPTY_DEQUE_ERROR_MSG) from None
+
+
+class WorkStealingScheduler:
+    """Thread pool running fine-grained tasks, each worker has its own WorkStealingDeque.
+
+    Tasks spawned by a worker go to the bottom of its own deque, and tasks spawned from outside the pool go to a shared injection queue.
+    A worker runs its own tasks first, then the injected ones, and steals from the other workers only when both are empty, so the workers rarely touch the same structure.
+
+    Parameters
+    ----------
+    workers: int
+        The amount of worker threads. If unspecified, the amount of CPUs is used.
+        default = None
+
+    Methods
+    -------
+    spawn(func, *args, **kwargs) -> None:
+        Schedule func(*args, **kwargs) to run on the pool.
+
+    wait() -> None:
+        Block until every spawned task finished, including the tasks they spawned.
+
+    shutdown() -> None:
+        Wait for the tasks and stop the worker threads.
+    """
+
+    # Seconds an idle worker sleeps before looking for work again, in case a wakeup was missed.
+    _IDLE_TIMEOUT = 0.01
+
+    def __init__(self, workers: int = None) -> None:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if not isinstance(workers, int) or workers <= 0:
+            raise ValueError("workers must be a positive int.")
+
+        self._deques = [WorkStealingDeque() for _ in range(workers)]
+        self._injected = deque()
+        self._local = threading.local()
+        self._wakeup = threading.Condition()
+        self._done = threading.Condition()
+        self._idle = 0
+        self._stopped = False
+        self._error = None
+
+        # Each counter is only written by its own worker, so they don't need a lock.
+        self._spawned = [0] * workers
+        self._completed = [0] * workers
+        self._injected_count = 0
+
+        self._threads = [
+            threading.Thread(target=self._work, args=(index,), daemon=True)
+            for index in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def __len__(self) -> int:
+        return len(self._threads)
+
+    def __enter__(self) -> "WorkStealingScheduler":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+    def spawn(self, func: Callable, *args, **kwargs) -> None:
+        """Schedule func(*args, **kwargs) to run on the pool.
+
+        Called from a task, the new task goes to the bottom of the worker's own deque, otherwise it goes to the shared injection queue.
+        """
+
+        assert not self._stopped, "Scheduler is shut down."
+
+        task = (func, args, kwargs)
+        index = getattr(self._local, "index", None)
+        if index is not None:
+            self._spawned[index] += 1
+            self._deques[index].push(task)
+        else:
+            with self._done:
+                self._injected_count += 1
+            self._injected.append(task)
+
+        if self._idle:
+            with self._wakeup:
+                self._wakeup.notify()
+
+    def _pending(self) -> bool:
+        """Check if some spawned tasks didn't finish yet."""
+        # Completed counts are read first: a task counts its children as spawned before it counts itself as completed.
+        completed = sum(self._completed)
+        return completed < sum(self._spawned) + self._injected_count
+
+    def wait(self) -> None:
+        """Block until every spawned task finished, including the tasks they spawned.
+
+        The first exception raised by a task is re-raised here.
+        """
+
+        with self._done:
+            while self._pending():
+                self._done.wait(self._IDLE_TIMEOUT)
+
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def shutdown(self) -> None:
+        """Wait for the tasks and stop the worker threads."""
+        try:
+            self.wait()
+        finally:
+            self._stopped = True
+            with self._wakeup:
+                self._wakeup.notify_all()
+            for thread in self._threads:
+                thread.join()
+
+    def _next_task(self, index: int) -> Any:
+        """Find a task for a worker: from its own deque, then the injection queue, then the other deques. Return None if there's none."""
+        try:
+            return self._deques[index]._tasks.pop()
+        except IndexError:
+            pass
+
+        try:
+            return self._injected.popleft()
+        except IndexError:
+            pass
+
+        count = len(self._deques)
+        start = random.randrange(count)
+        for offset in range(count):
+            victim = (start + offset) % count
+            if victim != index:
+                try:
+                    return self._deques[victim]._tasks.popleft()
+                except IndexError:
+                    pass
+        return None
+
+    def _work(self, index: int) -> None:
+        """Main loop of a worker thread."""
+        self._local.index = index
+        completed = self._completed
+
+        while not self._stopped:
+            task = self._next_task(index)
+            if task is None:
+                # Let wait() know the pool may have gone idle.
+                with self._done:
+                    self._done.notify_all()
+                with self._wakeup:
+                    self._idle += 1
+                    self._wakeup.wait(self._IDLE_TIMEOUT)
+                    self._idle -= 1
+                continue
+
+            func, args, kwargs = task
+            try:
+                func(*args, **kwargs)
+            except BaseException as error:
+                if self._error is None:
+                    self._error = error
+            completed[index] += 1
+
+
+class _Tenant:
+    """State of a tenant of a FairScheduler."""
+
+    def __init__(self, name: Hashable, weight: int, capacity: int) -> None:
+        self.name = name
+        self.weight = weight
+        # Jobs are stored as (job, cost) pairs.
+        self.jobs = QueueLL(capacity)
+        self.deficit = 0
+        # Whether the tenant reached the front of its ring and didn't get its quantum yet.
+        self.fresh = True
+        self.level = 0
+        # Cost served at the current level, for the demotion.
+        self.used = 0
+        # Node of the tenant in the ring of its level, None while it has no pending jobs.
+        self.node: Node = None
+        # Boost epoch of the scheduler when the tenant was last touched, level and used are stale while it's older.
+        self.epoch = 0
+
+
+class FairScheduler:
+    """Dispatch the jobs of many tenants, each one with its own QueueLL, by weighted fair queuing and multi-level feedback priority.
+
+    Tenants with pending jobs are kept in an active ring per priority level, a DoublyLL of node handles, so idle tenants are never visited and picking the next job takes constant time whatever the amount of tenants.
+    Within a level, tenants are served by deficit round robin: every time a tenant reaches the front of the ring, its deficit grows by `quantum * weight`, and it's served while its deficit covers the cost of its next job, then moved to the back. Over time each tenant gets a share of the dispatched cost proportional to its weight.
+    With several levels, the lowest level that has active tenants is served first. A tenant that used `allotment` cost at its level is demoted to the next one, so tenants with few jobs keep being dispatched quickly next to heavy ones, and every `boost_interval` dispatches all tenants move back to the first level so none of them starves.
+    Boosts are lazy: a boost only starts a new epoch, idle tenants are reset when they're next touched and active tenants of the lower levels move to the first level one per dispatch, so dispatching never visits every tenant.
+
+    Parameters
+    ----------
+    quantum: int
+        The cost a tenant of weight 1 may use per round.
+        default = 1
+
+    levels: int
+        The amount of priority levels, a single level is plain deficit round robin.
+        default = 1
+
+    allotment: int
+        The cost a tenant may use at a level before it's demoted. If unspecified, tenants are never demoted.
+        default = None
+
+    boost_interval: int
+        The amount of dispatches between two boosts of every tenant to the first level. If unspecified, tenants are only boosted by boost().
+        default = None
+
+    capacity: int
+        The default maximum amount of pending jobs of a tenant. If unspecified, tenant queues are limitless.
+        default = None
+
+    Methods
+    -------
+    add_tenant(tenant, weight=1, capacity=None) -> None:
+        Register a tenant.
+
+    remove_tenant(tenant) -> list:
+        Unregister a tenant and return its pending jobs.
+
+    submit(tenant, job, cost=1) -> self:
+        Add a job to the queue of a tenant.
+
+    dispatch() -> (tenant, job):
+        Remove the next job to run.
+
+    pending(tenant) -> int:
+        Return the amount of pending jobs of a tenant.
+
+    boost() -> None:
+        Move every tenant back to the first level.
+    """
+
+    def __init__(
+        self,
+        quantum: int = 1,
+        levels: int = 1,
+        allotment: int = None,
+        boost_interval: int = None,
+        capacity: int = None,
+    ) -> None:
+        if not isinstance(quantum, int) or quantum <= 0:
+            raise ValueError("quantum must be a positive int.")
+        if not isinstance(levels, int) or levels <= 0:
+            raise ValueError("levels must be a positive int.")
+        if allotment is not None and (not isinstance(allotment, int) or allotment <= 0):
+            raise ValueError("allotment must be a positive int.")
+        if boost_interval is not None and (not isinstance(boost_interval, int) or boost_interval <= 0):
+            raise ValueError("boost_interval must be a positive int.")
+        if capacity is not None and (not isinstance(capacity, int) or capacity <= 0):
+            raise ValueError("capacity must be a positive int.")
+
+        self._quantum = quantum
+        self._allotment = allotment
+        self._boost_interval = boost_interval
+        self._capacity = capacity
+        self._tenants: Dict[Hashable, _Tenant] = {}
+        self._rings = [DoublyLL() for _ in range(levels)]
+        self._size = 0
+        self._dispatched = 0
+        self._epoch = 0
+        # Whether the lower rings may still start with tenants active since before the last boost.
+        self._migrating = False
+
+    def __repr__(self) -> str:
+        return f"FairScheduler(tenants={len(self._tenants)}, levels={len(self._rings)}, pending={self._size})"
+
+    def __len__(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        """Check if no tenant has pending jobs."""
+        return self._size == 0
+
+    def add_tenant(self, tenant: Hashable, weight: int = 1, capacity: int = None) -> None:
+        """Register a tenant.
+
+        Parameters
+        ----------
+        tenant: Hashable
+            The name of the tenant.
+
+        weight: int
+            The share of the tenant relative to the other tenants of its level.
+            default = 1
+
+        capacity: int
+            The maximum amount of pending jobs of the tenant. If unspecified, the capacity of the scheduler is used.
+            default = None
+        """
+
+        if tenant in self._tenants:
+            raise ValueError(f"tenant {tenant!r} already exists.")
+        if not isinstance(weight, int) or weight <= 0:
+            raise ValueError("weight must be a positive int.")
+
+        self._tenants[tenant] = _Tenant(tenant, weight, self._capacity if capacity is None else capacity)
+
+    def remove_tenant(self, tenant: Hashable) -> List[Any]:
+        """Unregister a tenant and return its pending jobs, from the oldest one."""
+        state = self._get(tenant)
+        if state.node is not None:
+            self._rings[state.level].remove_node(state.node)
+        del self._tenants[tenant]
+
+        jobs = [job for job, _ in state.jobs._values()]
+        self._size -= len(jobs)
+        return jobs
+
+    def _get(self, tenant: Hashable) -> _Tenant:
+        try:
+            return self._tenants[tenant]
+        except KeyError:
+            raise KeyError(f"tenant {tenant!r} doesn't exist.") from None
+
+    def pending(self, tenant: Hashable) -> int:
+        """Return the amount of pending jobs of a tenant."""
+        return len(self._get(tenant).jobs)
+
+    def submit(self, tenant: Hashable, job: Any, cost: int = 1) -> "FairScheduler":
+        """Add a job to the queue of a tenant, registering the tenant with the default weight if needed.
+
+        Parameters
+        ----------
+        tenant: Hashable
+            The name of the tenant.
+
+        job: Any
+            The job, returned by dispatch().
+
+        cost: int
+            The amount of deficit the job uses, e.g. its size or its expected duration.
+            default = 1
+
+        Returns
+        -------
+        self
+        """
+
+        if not isinstance(cost, int) or cost <= 0:
+            raise ValueError("cost must be a positive int.")
+
+        state = self._tenants.get(tenant)
+        if state is None:
+            self.add_tenant(tenant)
+            state = self._tenants[tenant]
+
+        state.jobs.enqueue((job, cost))
+        self._size += 1
+        if state.node is None:
+            self._refresh(state)
+            state.fresh = True
+            state.node = self._rings[state.level].insert_node(state)
+        return self
+
+    def dispatch(self) -> Tuple[Hashable, Any]:
+        """Remove the next job to run.
+
+        Returns
+        -------
+        (tenant, job): tuple
+            The job and the name of its tenant.
+        """
+
+        assert self._size, EMPTY_SCHEDULER_ERROR_MSG
+
+        interval = self._boost_interval
+        if interval is not None and self._dispatched and self._dispatched % interval == 0:
+            self.boost()
+        self._dispatched += 1
+        if self._migrating:
+            self._migrate()
+
+        ring = next(ring for ring in self._rings if ring.head is not None)
+        while True:
+            state = ring.head.data
+            self._refresh(state)
+            if state.fresh:
+                state.deficit += self._quantum * state.weight
+                state.fresh = False
+            cost = state.jobs.peek()[1]
+            if cost <= state.deficit:
+                break
+            # Its next round starts when it reaches the front again.
+            state.fresh = True
+            ring.move_to_back(state.node)
+
+        job, cost = state.jobs.dequeue()
+        self._size -= 1
+        state.deficit -= cost
+        state.used += cost
+
+        if state.jobs.empty():
+            # An idle tenant doesn't keep its deficit, like in deficit round robin.
+            ring.remove_node(state.node)
+            state.node = None
+            state.deficit = 0
+        elif self._allotment is not None and state.used >= self._allotment and state.level + 1 < len(self._rings):
+            self._move(state, state.level + 1)
+        return state.name, job
+
+    def _move(self, state: _Tenant, level: int) -> None:
+        """Move an active tenant to the back of the ring of another level."""
+        self._rings[state.level].remove_node(state.node)
+        state.level = level
+        state.used = 0
+        state.deficit = 0
+        state.fresh = True
+        state.epoch = self._epoch
+        state.node = self._rings[level].insert_node(state)
+
+    def _refresh(self, state: _Tenant) -> None:
+        """Apply the boosts an idle tenant, or a tenant at the front of a ring it's served from, missed since it was last touched."""
+        if state.epoch != self._epoch:
+            state.epoch = self._epoch
+            state.used = 0
+            if state.node is None:
+                state.level = 0
+
+    def _migrate(self) -> None:
+        """Move one tenant active since before the last boost from a lower ring to the first one.
+
+        Tenants reach the lower rings at the back, so the ones older than the boost are always at the front of each ring.
+        """
+
+        for ring in self._rings[1:]:
+            if ring.head is not None and ring.head.data.epoch != self._epoch:
+                self._move(ring.head.data, 0)
+                return
+        self._migrating = False
+
+    def boost(self) -> None:
+        """Move every tenant back to the first level.
+
+        Takes constant time, tenants are moved lazily by the following dispatches.
+        """
+
+        self._epoch += 1
+        self._migrating = len(self._rings) > 1
@@ -0,0 +1,243 @@
+"""
+Created on Mon Oct 19 22:41:08 2026
+
+Sharded queue: several independently locked lanes, so concurrent producers rarely contend on the same lock.
+
+"""
+import heapq
+import itertools
+import os
+import threading
+from typing import Any, Hashable, List
+
+from .Queues import EMPTY_QUEUE_ERROR_MSG, Queue, QueueCirc, QueueLL
+
+ORDERINGS = ("lane", "global")
+
+
+class ShardedQueue:
+    """Thread-safe queue made of several lanes, each one a QueueLL or QueueCirc behind its own lock.
+
+    A producer enqueues into the lane of its key hash if it gives a key, otherwise into the lane assigned to its thread, so producers on different lanes never wait for each other.
+    Consumers visit the lanes round-robin and grab up to `batch` elements per lock acquisition.
+
+    With the "lane" ordering, elements of a lane (a key, or a producer thread) are dequeued in FIFO order, but lanes are interleaved.
+    With the "global" ordering, every element is tagged with a sequence number and consumers always take the oldest head among the lanes, so a single consumer sees the global FIFO order as long as the producers aren't racing it; it costs a heap of the lane heads per call.
+
+    Parameters
+    ----------
+    lanes: int
+        The amount of lanes. If unspecified, the amount of CPUs is used.
+        default = None
+
+    capacity: int
+        The maximum amount of elements of each lane. If unspecified, lanes are limitless, which requires QueueLL lanes.
+        default = None
+
+    lane: type
+        The queue class of the lanes, QueueLL or QueueCirc.
+        default = QueueLL
+
+    ordering: str
+        "lane" for a FIFO order within each lane only, "global" for a best-effort FIFO order across lanes.
+        default = "lane"
+
+    batch: int
+        The maximum amount of elements dequeue_many() takes from a lane per lock acquisition.
+        default = 64
+
+    Methods
+    -------
+    empty() -> bool:
+        Check if every lane is empty.
+
+    full() -> bool:
+        Check if every lane is full.
+
+    enqueue(element, key=None) -> self:
+        Add an element to the end of a lane.
+
+    dequeue() -> Any:
+        Remove the first element of the next non-empty lane.
+
+    dequeue_many(n) -> list:
+        Remove up to n elements, in batches taken lane by lane.
+
+    delete() -> None:
+        Remove all elements from every lane.
+    """
+
+    def __init__(
+        self,
+        lanes: int = None,
+        capacity: int = None,
+        lane: type = QueueLL,
+        ordering: str = "lane",
+        batch: int = 64,
+    ) -> None:
+        if lanes is None:
+            lanes = os.cpu_count() or 1
+        if not isinstance(lanes, int) or lanes <= 0:
+            raise ValueError("lanes must be a positive int.")
+        if capacity is not None and (not isinstance(capacity, int) or capacity <= 0):
+            raise ValueError("capacity must be a positive int.")
+        if not (isinstance(lane, type) and issubclass(lane, (QueueLL, QueueCirc))):
+            raise TypeError("lane must be QueueLL, QueueCirc or a subclass of them.")
+        if issubclass(lane, QueueCirc) and capacity is None:
+            raise ValueError("QueueCirc lanes need a capacity.")
+        if ordering not in ORDERINGS:
+            raise ValueError(f"ordering must be one of {ORDERINGS}.")
+        if not isinstance(batch, int) or batch <= 0:
+            raise ValueError("batch must be a positive int.")
+
+        self._lanes: List[Queue] = [
+            lane(capacity) if issubclass(lane, QueueCirc) else lane(capacity=capacity)
+            for _ in range(lanes)
+        ]
+        self._locks = [threading.Lock() for _ in range(lanes)]
+        self._capacity = capacity
+        self._ordering = ordering
+        self._batch = batch
+        self._local = threading.local()
+        # next() on itertools.count is atomic, it hands out thread lanes and sequence numbers without a lock.
+        self._thread_lanes = itertools.count()
+        self._sequence = itertools.count()
+        # Where the next consumer starts looking, only a hint so it isn't locked.
+        self._cursor = 0
+
+    def __repr__(self) -> str:
+        return f"ShardedQueue(lanes={len(self._lanes)}, ordering={self._ordering!r}, size={len(self)})"
+
+    def __len__(self) -> int:
+        # Reading the sizes is atomic, the total is exact when no operation is in progress.
+        return sum(lane._size for lane in self._lanes)
+
+    def empty(self) -> bool:
+        """Check if every lane is empty."""
+        return not any(lane._size for lane in self._lanes)
+
+    def full(self) -> bool:
+        """Check if every lane is full."""
+        if self._capacity is None:
+            return False
+        return len(self) >= self._capacity * len(self._lanes)
+
+    def _lane_index(self, key: Hashable) -> int:
+        if key is not None:
+            return hash(key) % len(self._lanes)
+        index = getattr(self._local, "lane", None)
+        if index is None:
+            index = self._local.lane = next(self._thread_lanes) % len(self._lanes)
+        return index
+
+    def enqueue(self, element: Any, key: Hashable = None) -> "ShardedQueue":
+        """Add an element to the end of a lane.
+
+        Parameters
+        ----------
+        element: Any
+            The element that is added to the queue.
+
+        key: Hashable
+            Elements with the same key go to the same lane, so they keep their order. If unspecified, the lane of the calling thread is used.
+            default = None
+
+        Returns
+        -------
+        self
+        """
+
+        index = self._lane_index(key)
+        if self._ordering == "global":
+            element = (next(self._sequence), element)
+
+        lane = self._lanes[index]
+        with self._locks[index]:
+            lane.enqueue(element)
+        return self
+
+    def dequeue(self) -> Any:
+        """Remove the first element of the next non-empty lane, or the oldest head with the "global" ordering.
+
+        Returns
+        -------
+        element: Any
+        """
+
+        elements = self.dequeue_many(1)
+        assert elements, EMPTY_QUEUE_ERROR_MSG
+        return elements[0]
+
+    def dequeue_many(self, n: int) -> List[Any]:
+        """Remove up to n elements, in batches taken lane by lane.
+
+        Parameters
+        ----------
+        n: int
+            The maximum amount of elements to remove.
+
+        Returns
+        -------
+        elements: list
+            The removed elements, fewer than n if the lanes ran out of elements.
+        """
+
+        if not isinstance(n, int):
+            raise TypeError("n must be of type 'int'.")
+        if n < 0:
+            raise ValueError("n must be a non-negative int.")
+
+        if self._ordering == "global":
+            return self._merge_heads(n)
+
+        lanes, locks, batch = self._lanes, self._locks, self._batch
+        count = len(lanes)
+        elements = []
+        index = self._cursor
+        idle = 0
+        # Stop after a full round without finding any element.
+        while len(elements) < n and idle < count:
+            lane = lanes[index]
+            if lane._size:
+                with locks[index]:
+                    for _ in range(min(batch, n - len(elements), lane._size)):
+                        elements.append(lane.dequeue())
+                idle = 0
+            else:
+                idle += 1
+            index = (index + 1) % count
+
+        self._cursor = index
+        return elements
+
+    def _merge_heads(self, n: int) -> List[Any]:
+        """Remove up to n elements by repeatedly taking the lane head with the lowest sequence number."""
+        lanes, locks = self._lanes, self._locks
+        heads = []
+        for index, lane in enumerate(lanes):
+            if lane._size:
+                with locks[index]:
+                    if lane._size:
+                        heads.append((lane.peek()[0], index))
+        heapq.heapify(heads)
+
+        elements = []
+        while heads and len(elements) < n:
+            _, index = heads[0]
+            lane = lanes[index]
+            with locks[index]:
+                # Another consumer may have emptied the lane meanwhile.
+                if lane._size:
+                    elements.append(lane.dequeue()[1])
+                following = lane.peek()[0] if lane._size else None
+            if following is None:
+                heapq.heappop(heads)
+            else:
+                heapq.heapreplace(heads, (following, index))
+        return elements
+
+    def delete(self) -> None:
+        """Remove all elements from every lane."""
+        for lane, lock in zip(self._lanes, self._locks):
+            with lock:
+                lane.delete()
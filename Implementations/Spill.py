@@ -0,0 +1,157 @@
+"""
+Created on Mon Oct 19 10:12:40 2026
+
+Temporary-file block storage used by the spill-to-disk Stack and Queue implementations.
+
+"""
+import pickle
+import tempfile
+from collections import deque
+from typing import Any, Iterator, List
+
+# Copy chunk used when compacting the file.
+_COPY_CHUNK = 1 << 20
+
+
+def assert_spill_params(memory_limit, block_size) -> None:
+    """Validate the memory parameters shared by the spill-to-disk structures."""
+    if not isinstance(memory_limit, int):
+        raise TypeError("memory_limit must be of type 'int'.")
+    if memory_limit <= 0:
+        raise ValueError("memory_limit must be greater than zero.")
+
+    if not isinstance(block_size, int):
+        raise TypeError("block_size must be of type 'int'.")
+    # A block paged in from disk must fit next to a full block waiting to be spilled.
+    if not 0 < block_size <= memory_limit // 2:
+        raise ValueError("block_size must be between 1 and memory_limit // 2.")
+
+
+class SpillFile:
+    """Store blocks of elements in an anonymous temporary file.
+
+    Blocks are written and read whole, so the disk is always accessed in large sequential chunks.
+    Blocks can be taken back from either end, which lets the same file serve as the cold part of a stack (LIFO blocks) or a queue (FIFO blocks).
+
+    Methods
+    -------
+    push(block) -> None:
+        Write a block of elements to the end of the file.
+
+    pop_first() -> list:
+        Read and discard the oldest block in the file.
+
+    pop_last() -> list:
+        Read and discard the newest block in the file.
+
+    clear() -> None:
+        Discard all blocks and truncate the file.
+
+    close() -> None:
+        Close and remove the temporary file.
+    """
+
+    def __init__(self) -> None:
+        self._file = None
+        # (offset, nbytes, count) of every live block, oldest first.
+        self._blocks = deque()
+        self._end = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of elements stored in the file."""
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        for offset, nbytes, _ in list(self._blocks):
+            yield from self._read(offset, nbytes)
+
+    @property
+    def blocks(self) -> int:
+        """Number of blocks stored in the file."""
+        return len(self._blocks)
+
+    def _read(self, offset: int, nbytes: int) -> List[Any]:
+        self._file.seek(offset)
+        return pickle.loads(self._file.read(nbytes))
+
+    def push(self, block: List[Any]) -> None:
+        """Write a block of elements to the end of the file."""
+        if not block:
+            return
+
+        if self._file is None:
+            self._file = tempfile.TemporaryFile()
+
+        data = pickle.dumps(block, pickle.HIGHEST_PROTOCOL)
+        self._file.seek(self._end)
+        self._file.write(data)
+        self._blocks.append((self._end, len(data), len(block)))
+        self._end += len(data)
+        self._size += len(block)
+
+    def pop_first(self) -> List[Any]:
+        """Read and discard the oldest block in the file."""
+        assert self._blocks, "Spill file is empty."
+
+        offset, nbytes, count = self._blocks.popleft()
+        block = self._read(offset, nbytes)
+        self._size -= count
+        if not self._blocks:
+            self.clear()
+        elif self._blocks[0][0] > self._end // 2:
+            self._compact()
+        return block
+
+    def pop_last(self) -> List[Any]:
+        """Read and discard the newest block in the file."""
+        assert self._blocks, "Spill file is empty."
+
+        offset, nbytes, count = self._blocks.pop()
+        block = self._read(offset, nbytes)
+        self._size -= count
+        # The freed space is at the end of the file, so it can be reused right away.
+        self._end = offset
+        self._file.truncate(offset)
+        return block
+
+    def _compact(self) -> None:
+        """Move the live blocks to the start of the file once more than half of it is dead space."""
+        start = self._blocks[0][0]
+        read_pos, write_pos = start, 0
+        while read_pos < self._end:
+            self._file.seek(read_pos)
+            chunk = self._file.read(min(_COPY_CHUNK, self._end - read_pos))
+            self._file.seek(write_pos)
+            self._file.write(chunk)
+            read_pos += len(chunk)
+            write_pos += len(chunk)
+
+        self._blocks = deque(
+            (offset - start, nbytes, count) for offset, nbytes, count in self._blocks
+        )
+        self._end -= start
+        self._file.truncate(self._end)
+
+    def clear(self) -> None:
+        """Discard all blocks and truncate the file."""
+        self._blocks.clear()
+        self._end = 0
+        self._size = 0
+        if self._file is not None:
+            self._file.truncate(0)
+
+    def close(self) -> None:
+        """Close and remove the temporary file."""
+        self._blocks.clear()
+        self._end = 0
+        self._size = 0
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
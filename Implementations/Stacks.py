@@ -6,15 +6,23 @@ Created on Wed Oct 20 13:54:12 2022
 Stack data structure implementations using lists and linked lists.
 
 """
-from typing import Any
-
-from LinkedLists import SinglyLL
+import sys
+from itertools import chain
+from typing import Any, Callable, Iterable, Iterator
+
+from .Containers import ContainerMixin, bounded
+from .Features import plain_class
+from .Filters import BloomFilter, disable_filter, enable_filter
+from .LinkedLists import NodePool, SinglyLL
+from .Memory import payload_size, sequence_usage, shallow_size, with_total
+from .Parallel import parallel_map
+from .Spill import SpillFile, assert_spill_params
 
 FULL_STACK_ERROR_MSG = "Maximum stack capacity reached, unable to store more elements."
 EMPTY_STACK_ERROR_MSG = "Stack is empty."
 
 
-class Stack:
+class Stack(ContainerMixin):
     """List-based implementation of the Stack data structure.
     
     Parameters
@@ -24,7 +32,7 @@ class Stack:
         default = None
 
     vals: iterable
-        a group of elements that are added to the Stack during its construction. If unspecified, an empty Stack is created. If the number of elements in vals exceeds the specified capacity, An assertion error is raised.
+        a group of elements that are added to the Stack during its construction. If unspecified, an empty Stack is created. If the number of elements in vals exceeds the specified capacity, An assertion error is raised. Iterables without a length, like generators, are consumed lazily and the capacity is checked while they're consumed.
         default = None
 
     Methods
@@ -46,10 +54,35 @@ class Stack:
 
     delete() -> None:
         Remove all elements from the stack.
+
+    memory_usage(deep=False) -> dict:
+        Report the memory held by the stack, in bytes.
+
+    from_iter(iterable, capacity=None, on_overflow="raise") -> Stack:
+        Create a stack from any iterable, consuming it lazily.
+
+    to_list() -> list:
+        Return the elements, from the bottom to the top.
+
+    drain(n=None) -> list:
+        Remove the n top elements, or all of them, and return them.
+
+    to_array(typecode="d") -> array:
+        Export numeric elements to a typed array, for memoryview() and NumPy.
+
+    enable_filter(fp_rate=0.01, counting=True) -> BloomFilter:
+        Answer most `in` misses without scanning the stack.
+
+    disable_filter() -> BloomFilter:
+        Remove the Bloom filter of the stack.
     """
 
+    _kind = "stack"
+    _add = "push"
+    _remove = "pop"
+
     def __init__(self, capacity: int = None, vals: list = None) -> None:
-        self._assert_params(capacity, vals)
+        vals = self._assert_params(capacity, vals)
         self._capacity = capacity
         self._elements = list(vals) if vals else []
         self._size = len(self._elements)
@@ -66,7 +99,12 @@ class Stack:
     def __contains__(self, element) -> bool:
         return element in self._elements
 
-    def _assert_params(self, capacity, vals) -> None:
+    def _assert_params(self, capacity, vals) -> Iterable:
+        """Validate the constructor parameters, and return vals.
+
+        If vals has no length (e.g. a generator), it's wrapped to enforce the capacity while it's consumed, so it doesn't need to be materialized first.
+        """
+
         if capacity is not None:
             if not isinstance(capacity, int):
                 raise TypeError("capacity must be of type 'int'.")
@@ -77,9 +115,13 @@ class Stack:
             if not hasattr(vals, "__iter__"):
                 raise TypeError("vals is not iterable")
             if capacity is not None:
-                assert (
-                    len(vals) <= capacity
-                ), f"Cannot create stack with {len(vals)} elements and max capacity of {capacity}."
+                if hasattr(vals, "__len__"):
+                    assert (
+                        len(vals) <= capacity
+                    ), f"Cannot create stack with {len(vals)} elements and max capacity of {capacity}."
+                else:
+                    vals = bounded(vals, capacity, "stack")
+        return vals
 
     def empty(self) -> bool:
         """Check if the stack is empty."""
@@ -141,6 +183,88 @@ class Stack:
         self._elements = []
         self._size = 0
 
+    def _values(self) -> Iterator[Any]:
+        """Iterate over the elements from the bottom to the top of the stack."""
+        return iter(self._elements)
+
+    def _empty_like(self) -> "Stack":
+        """Create an empty stack of the same kind and capacity."""
+        return plain_class(type(self))(self._capacity)
+
+    def to_list(self) -> list:
+        """Return a list of the elements, from the bottom to the top of the stack."""
+        return list(self._values())
+
+    def drain(self, n: int = None) -> list:
+        """Remove the n top elements of the stack and return them in a list.
+
+        Parameters
+        ----------
+        n: int
+            The maximum amount of elements to remove. If unspecified, the stack is emptied.
+            default = None
+
+        Returns
+        -------
+        elements: list
+            The removed elements, from the top one, in the order pop() returns them.
+        """
+
+        count = self._drain_count(n)
+        if type(self).pop is not Stack.pop:
+            # Subclasses and wrappers keep state per popped element, and feeding stacks refill while they're drained.
+            if n is not None:
+                count = n
+            elements = []
+            while len(elements) < count and not self.empty():
+                elements.append(self.pop())
+            return elements
+        if not count:
+            return []
+
+        elements = self._elements[-count:]
+        del self._elements[-count:]
+        self._size -= count
+        elements.reverse()
+        return elements
+
+    def parallel_map(
+        self, func: Callable[[Any], Any], workers: int = None, chunk_size: int = 1024
+    ) -> "Stack":
+        """Return a new stack of the same kind holding func(element) for every element, computed by a pool of processes.
+
+        See Parallel.parallel_map().
+        """
+        return parallel_map(self, func, workers, chunk_size)
+
+    def enable_filter(self, fp_rate: float = 0.01, counting: bool = True) -> BloomFilter:
+        """Put a Bloom filter in front of the `in` operator, so most misses are answered without scanning the stack.
+
+        See Filters.enable_filter().
+        """
+        return enable_filter(self, fp_rate, counting)
+
+    def disable_filter(self) -> BloomFilter:
+        """Remove the Bloom filter of the stack and return it."""
+        return disable_filter(self)
+
+    def memory_usage(self, deep: bool = False) -> dict:
+        """Report the memory held by the stack, in bytes.
+
+        Parameters
+        ----------
+        deep: bool
+            Whether to include the elements, and the objects they refer to, as the "payload" component. Objects referenced several times are counted once.
+            default = False
+
+        Returns
+        -------
+        breakdown: dict
+            Bytes used by each component, see Memory.sequence_usage(), and their "total".
+        """
+
+        return sequence_usage(self, self._elements, deep)
+
 
 class StackLL(Stack):
     """LinkedList-based implementation of the Stack data structure.
@@ -152,7 +276,11 @@ class StackLL(Stack):
         default = None
 
     vals: iterable
-        a group of elements that are added to the Stack during its construction. If unspecified, an empty Stack is created. If the number of elements in `vals` exceeds the specified capacity, An assertion error is raised.
+        a group of elements that are added to the Stack during its construction. If unspecified, an empty Stack is created. If the number of elements in `vals` exceeds the specified capacity, An assertion error is raised. Iterables without a length, like generators, are consumed lazily and the capacity is checked while they're consumed.
+        default = None
+
+    pool: NodePool
+        A pool that provides the linked list nodes and receives them back once elements are removed.
         default = None
 
     Methods
@@ -174,12 +302,33 @@ class StackLL(Stack):
 
     delete() -> None:
         Remove all elements from the stack.
+
+    memory_usage(deep=False) -> dict:
+        Report the memory held by the stack, in bytes.
+
+    from_iter(iterable, capacity=None, on_overflow="raise") -> Stack:
+        Create a stack from any iterable, consuming it lazily.
+
+    to_list() -> list:
+        Return the elements, from the bottom to the top.
+
+    drain(n=None) -> list:
+        Remove the n top elements, or all of them, and return them.
+
+    to_array(typecode="d") -> array:
+        Export numeric elements to a typed array, for memoryview() and NumPy.
+
+    enable_filter(fp_rate=0.01, counting=True) -> BloomFilter:
+        Answer most `in` misses without scanning the stack.
+
+    disable_filter() -> BloomFilter:
+        Remove the Bloom filter of the stack.
     """
 
-    def __init__(self, capacity: int = None, vals: list = None) -> None:
-        self._assert_params(capacity, vals)
+    def __init__(self, capacity: int = None, vals: list = None, pool: NodePool = None) -> None:
+        vals = self._assert_params(capacity, vals)
         self._capacity = capacity
-        self._elements = SinglyLL(vals)
+        self._elements = SinglyLL(vals, pool=pool)
         self._size = len(self._elements)
 
     def push(self, element: Any):
@@ -235,3 +384,610 @@ class StackLL(Stack):
         """Remove all elements from the stack."""
         self._elements.delete()
         self._size = 0
+
+    def _values(self) -> Iterator[Any]:
+        """Iterate over the elements from the bottom to the top of the stack."""
+        return (node.data for node in self._elements._nodes())
+
+    def _empty_like(self) -> "Stack":
+        """Create an empty stack of the same kind and capacity."""
+        return plain_class(type(self))(self._capacity, pool=self._elements._pool)
+
+
+class StackSpill(Stack):
+    """Spill-to-disk implementation of the Stack data structure.
+
+    The top of the stack is kept in memory, while the cold bottom is written to a temporary file in blocks of `block_size` elements and read back one block at a time before the in-memory part runs out.
+    Elements must be picklable.
+    
+    Parameters
+    ----------
+    capacity: int
+        Determine the maximum amount of elements a Stack can carry. If unspecified, Stack capacity will be limitless.
+        default = None
+
+    vals: iterable
+        a group of elements that are added to the Stack during its construction. If unspecified, an empty Stack is created. If the number of elements in `vals` exceeds the specified capacity, An assertion error is raised. Iterables without a length, like generators, are consumed lazily and the capacity is checked while they're consumed.
+        default = None
+
+    memory_limit: int
+        The maximum amount of elements kept in memory. Elements beyond this limit are moved to disk.
+        default = 65536
+
+    block_size: int
+        The amount of elements written to or read from disk at once, at most half of `memory_limit`. If unspecified, a quarter of `memory_limit` is used.
+        default = None
+
+    Methods
+    -------
+    empty() -> bool:
+        Check if the stack is empty.
+
+    full() -> bool:
+        Check if the stack is full.
+
+    push(element) -> self:
+        Add an element to the top of the stack.
+
+    pop() -> Any:
+        Remove the top element in the stack.
+
+    peek() -> Any:
+        Access the top element of the stack.
+
+    delete() -> None:
+        Remove all elements from the stack.
+
+    memory_usage(deep=False) -> dict:
+        Report the memory held by the stack, in bytes.
+
+    from_iter(iterable, capacity=None, on_overflow="raise") -> Stack:
+        Create a stack from any iterable, consuming it lazily.
+
+    to_list() -> list:
+        Return the elements, from the bottom to the top.
+
+    drain(n=None) -> list:
+        Remove the n top elements, or all of them, and return them.
+
+    to_array(typecode="d") -> array:
+        Export numeric elements to a typed array, for memoryview() and NumPy.
+
+    enable_filter(fp_rate=0.01, counting=True) -> BloomFilter:
+        Answer most `in` misses without scanning the stack.
+
+    disable_filter() -> BloomFilter:
+        Remove the Bloom filter of the stack.
+    """
+
+    def __init__(
+        self,
+        capacity: int = None,
+        vals: list = None,
+        memory_limit: int = 65536,
+        block_size: int = None,
+    ) -> None:
+        if block_size is None:
+            block_size = max(1, memory_limit // 4) if isinstance(memory_limit, int) else None
+        assert_spill_params(memory_limit, block_size)
+        vals = self._assert_params(capacity, vals)
+        self._capacity = capacity
+        self._memory_limit = memory_limit
+        self._block_size = block_size
+        self._elements = []
+        self._spill = SpillFile()
+        self._size = 0
+
+        if vals:
+            for val in vals:
+                self.push(val)
+
+    def __repr__(self) -> str:
+        return f"StackSpill({list(self)})"
+
+    def __iter__(self):
+        return chain(self._spill, self._elements)
+
+    def _values(self) -> Iterator[Any]:
+        """Iterate over the elements from the bottom to the top of the stack."""
+        return chain(self._spill, self._elements)
+
+    def _empty_like(self) -> "Stack":
+        """Create an empty stack of the same kind, capacity and memory limits."""
+        return plain_class(type(self))(
+            self._capacity, memory_limit=self._memory_limit, block_size=self._block_size
+        )
+
+    def __contains__(self, element) -> bool:
+        return any(val == element for val in self)
+
+    def push(self, element: Any):
+        """Add an element to the top of the stack.
+        
+        Parameters
+        ----------
+        element: Any
+            The element that is added to the stack.
+
+        Returns
+        -------
+        self
+        """
+
+        assert not self.full(), FULL_STACK_ERROR_MSG
+
+        self._elements.append(element)
+        self._size += 1
+
+        if len(self._elements) > self._memory_limit:
+            # Move the coldest in-memory block to disk.
+            self._spill.push(self._elements[: self._block_size])
+            del self._elements[: self._block_size]
+
+        return self
+
+    def pop(self) -> Any:
+        """Remove the top element in the stack.
+
+        Returns
+        -------
+        Element: Any
+            The top element in the stack.
+        """
+
+        assert not self.empty(), EMPTY_STACK_ERROR_MSG
+
+        element = self._elements.pop()
+        self._size -= 1
+
+        # Page the next block back in before the in-memory part runs out.
+        if (
+            len(self._spill)
+            and len(self._elements) < self._block_size
+            and (
+                not self._elements
+                or len(self._elements) + self._block_size <= self._memory_limit
+            )
+        ):
+            self._elements[:0] = self._spill.pop_last()
+
+        return element
+
+    def delete(self) -> None:
+        """Remove all elements from the stack."""
+        self._elements = []
+        self._spill.clear()
+        self._size = 0
+
+    def memory_usage(self, deep: bool = False) -> dict:
+        """Report the memory held by the stack, in bytes.
+
+        Parameters
+        ----------
+        deep: bool
+            Whether to include the elements, and the objects they refer to, as the "payload" component. Objects referenced several times are counted once.
+            default = False
+
+        Returns
+        -------
+        breakdown: dict
+            Bytes used by each component: "container", "storage" for the in-memory part and the index of spilled blocks, "disk" for the spilled bytes (not part of the total), and their "total".
+        """
+
+        breakdown = {
+            "container": shallow_size(self) + shallow_size(self._spill),
+            "storage": sys.getsizeof(self._elements) + sys.getsizeof(self._spill._blocks),
+            "disk": self._spill._end,
+        }
+        if deep:
+            breakdown["payload"] = payload_size(self._elements)
+        return with_total(breakdown)
+
+
+class MinMaxStack(Stack):
+    """List-based Stack that tracks its smallest and largest elements, so min() and max() take O(1) time.
+
+    Two auxiliary stacks hold each element that is smaller (or larger) than or equal to every element below it, together with its key. Pushing or popping an element touches only their tops.
+
+    Parameters
+    ----------
+    capacity: int
+        Determine the maximum amount of elements a Stack can carry. If unspecified, Stack capacity will be limitless.
+        default = None
+
+    vals: iterable
+        a group of elements that are added to the Stack during its construction. If unspecified, an empty Stack is created. If the number of elements in `vals` exceeds the specified capacity, An assertion error is raised. Iterables without a length, like generators, are consumed lazily and the capacity is checked while they're consumed.
+        default = None
+
+    key: callable
+        Compute the value the elements are compared by, like the key of the builtin min(). If unspecified, the elements are compared directly.
+        default = None
+
+    Methods
+    -------
+    empty() -> bool:
+        Check if the stack is empty.
+
+    full() -> bool:
+        Check if the stack is full.
+
+    push(element) -> self:
+        Add an element to the top of the stack.
+
+    pop() -> Any:
+        Remove the top element in the stack.
+
+    peek() -> Any:
+        Access the top element of the stack.
+
+    min() -> Any:
+        Access the smallest element of the stack.
+
+    max() -> Any:
+        Access the largest element of the stack.
+
+    delete() -> None:
+        Remove all elements from the stack.
+
+    memory_usage(deep=False) -> dict:
+        Report the memory held by the stack, in bytes.
+
+    from_iter(iterable, capacity=None, on_overflow="raise") -> Stack:
+        Create a stack from any iterable, consuming it lazily.
+
+    to_list() -> list:
+        Return the elements, from the bottom to the top.
+
+    drain(n=None) -> list:
+        Remove the n top elements, or all of them, and return them.
+
+    to_array(typecode="d") -> array:
+        Export numeric elements to a typed array, for memoryview() and NumPy.
+
+    enable_filter(fp_rate=0.01, counting=True) -> BloomFilter:
+        Answer most `in` misses without scanning the stack.
+
+    disable_filter() -> BloomFilter:
+        Remove the Bloom filter of the stack.
+    """
+
+    def __init__(self, capacity: int = None, vals: list = None, key: Callable[[Any], Any] = None) -> None:
+        if key is not None and not callable(key):
+            raise TypeError("key must be callable.")
+
+        self._key = key
+        self._mins = []
+        self._maxs = []
+        super().__init__(capacity, vals)
+        for element in self._elements:
+            self._track(element)
+
+    def _track(self, element: Any) -> None:
+        """Add an element pushed to the top of the stack to the auxiliary stacks."""
+        key = element if self._key is None else self._key(element)
+        mins, maxs = self._mins, self._maxs
+        # Ties are kept, so popping one of several equal elements leaves the others tracked.
+        if not mins or key <= mins[-1][0]:
+            mins.append((key, element))
+        if not maxs or key >= maxs[-1][0]:
+            maxs.append((key, element))
+
+    def push(self, element: Any):
+        """Add an element to the top of the stack.
+
+        Parameters
+        ----------
+        element: Any
+            The element that is added to the stack.
+
+        Returns
+        -------
+        self
+        """
+
+        super().push(element)
+        self._track(element)
+        return self
+
+    def pop(self) -> Any:
+        """Remove the top element in the stack.
+
+        Returns
+        -------
+        Element: Any
+            The top element in the stack.
+        """
+
+        element = super().pop()
+        key = element if self._key is None else self._key(element)
+        if key == self._mins[-1][0]:
+            self._mins.pop()
+        if key == self._maxs[-1][0]:
+            self._maxs.pop()
+        return element
+
+    def min(self) -> Any:
+        """Access the smallest element of the stack, the topmost one if several are equal."""
+        assert not self.empty(), EMPTY_STACK_ERROR_MSG
+        return self._mins[-1][1]
+
+    def max(self) -> Any:
+        """Access the largest element of the stack, the topmost one if several are equal."""
+        assert not self.empty(), EMPTY_STACK_ERROR_MSG
+        return self._maxs[-1][1]
+
+    def delete(self) -> None:
+        """Remove all elements from the stack."""
+        super().delete()
+        self._mins = []
+        self._maxs = []
+
+    def _empty_like(self) -> "MinMaxStack":
+        """Create an empty stack with the same capacity and key."""
+        return plain_class(type(self))(self._capacity, key=self._key)
+
+    def memory_usage(self, deep: bool = False) -> dict:
+        """Report the memory held by the stack, in bytes.
+
+        Parameters
+        ----------
+        deep: bool
+            Whether to include the elements, and the objects they refer to, as the "payload" component. Objects referenced several times are counted once.
+            default = False
+
+        Returns
+        -------
+        breakdown: dict
+            Bytes used by each component, see Memory.sequence_usage(), the auxiliary stacks as "extrema", and their "total".
+        """
+
+        breakdown = super().memory_usage(deep)
+        breakdown.pop("total")
+        breakdown["extrema"] = sum(
+            sys.getsizeof(aux) + sum(sys.getsizeof(entry) for entry in aux)
+            for aux in (self._mins, self._maxs)
+        )
+        return with_total(breakdown)
+
+
+class StackCirc(Stack):
+    """List-based Stack on a ring buffer of fixed capacity, pushing to a full stack drops its bottom element instead of failing.
+
+    The buffer is preallocated like the one of QueueCirc, so pushing, popping and evicting only move the index of the bottom element and never resize the list. It suits histories where only the latest entries matter, like undo stacks or recent errors.
+
+    Parameters
+    ----------
+    capacity: int
+        Determine the maximum amount of elements the Stack keeps.
+
+    vals: iterable
+        a group of elements that are pushed to the Stack during its construction. If it holds more than `capacity` elements, only the last ones are kept.
+        default = None
+
+    on_evict: callable
+        Called with every element dropped from the bottom of the stack by push(). If unspecified, elements are dropped silently.
+        default = None
+
+    Methods
+    -------
+    empty() -> bool:
+        Check if the stack is empty.
+
+    full() -> bool:
+        Check if the stack is full, the next push() will evict the bottom element.
+
+    push(element) -> self:
+        Add an element to the top of the stack, evicting the bottom element if the stack is full.
+
+    pop() -> Any:
+        Remove the top element in the stack.
+
+    peek(n=None) -> Any:
+        Access the top element of the stack, or a list of the n topmost elements.
+
+    delete() -> None:
+        Remove all elements from the stack.
+
+    to_list() -> list:
+        Return the elements, from the bottom to the top.
+
+    segments() -> list:
+        Return the elements as at most two lists copied from the ring buffer, from the bottom to the top.
+
+    drain(n=None) -> list:
+        Remove the n top elements, or all of them, and return them.
+
+    to_array(typecode="d") -> array:
+        Export numeric elements to a typed array, for memoryview() and NumPy.
+
+    memory_usage(deep=False) -> dict:
+        Report the memory held by the stack, in bytes.
+
+    enable_filter(fp_rate=0.01, counting=True) -> BloomFilter:
+        Answer most `in` misses without scanning the stack.
+
+    disable_filter() -> BloomFilter:
+        Remove the Bloom filter of the stack.
+    """
+
+    def __init__(self, capacity: int, vals: list = None, on_evict: Callable[[Any], Any] = None) -> None:
+        self._assert_params(capacity, None)
+        if capacity is None:
+            raise TypeError("capacity must be of type 'int'.")
+        if vals is not None and not hasattr(vals, "__iter__"):
+            raise TypeError("vals is not iterable")
+        if on_evict is not None and not callable(on_evict):
+            raise TypeError("on_evict must be callable.")
+
+        self._capacity = capacity
+        self._elements = capacity * [None]
+        self._bottom = 0
+        self._size = 0
+        self._on_evict = on_evict
+        self.evicted = 0
+        if vals is not None:
+            for element in vals:
+                self.push(element)
+
+    def __repr__(self) -> str:
+        return f"StackCirc({list(self._values())})"
+
+    def __iter__(self):
+        return self._values()
+
+    def __contains__(self, element) -> bool:
+        return element in self._values()
+
+    def push(self, element: Any):
+        """Add an element to the top of the stack, evicting the bottom element if the stack is full.
+
+        Parameters
+        ----------
+        element: Any
+            The element that is added to the stack.
+
+        Returns
+        -------
+        self
+        """
+
+        top = self._bottom + self._size
+        if top >= self._capacity:
+            top -= self._capacity
+
+        if self._size == self._capacity:
+            # The new top takes the slot of the bottom element.
+            evicted = self._elements[top]
+            self._elements[top] = element
+            self._bottom = top + 1 if top + 1 < self._capacity else 0
+            self.evicted += 1
+            if self._on_evict is not None:
+                self._on_evict(evicted)
+        else:
+            self._elements[top] = element
+            self._size += 1
+        return self
+
+    def pop(self) -> Any:
+        """Remove the top element in the stack.
+
+        Returns
+        -------
+        Element: Any
+            The top element in the stack.
+        """
+
+        assert not self.empty(), EMPTY_STACK_ERROR_MSG
+
+        self._size -= 1
+        top = (self._bottom + self._size) % self._capacity
+        element = self._elements[top]
+        self._elements[top] = None
+        return element
+
+    def peek(self, n: int = None) -> Any:
+        """Access the top element of the stack, or the n topmost elements.
+
+        Parameters
+        ----------
+        n: int
+            If specified, return a list of the n topmost elements, from the top down, or all of them if the stack holds fewer.
+            default = None
+
+        Returns
+        -------
+        Element: Any
+            The top element in the stack, or a list of elements if n is specified.
+        """
+
+        if n is None:
+            assert not self.empty(), EMPTY_STACK_ERROR_MSG
+            return self._elements[(self._bottom + self._size - 1) % self._capacity]
+
+        if not isinstance(n, int):
+            raise TypeError("n must be of type 'int'.")
+        if n < 0:
+            raise ValueError("n must be a non-negative int.")
+
+        n = min(n, self._size)
+        if not n:
+            return []
+        # The n topmost elements span at most two runs of the buffer: the end of the list and its beginning.
+        elements, start = self._elements, (self._bottom + self._size - n) % self._capacity
+        if start + n <= self._capacity:
+            top = elements[start : start + n]
+        else:
+            top = elements[start:] + elements[: start + n - self._capacity]
+        top.reverse()
+        return top
+
+    def delete(self) -> None:
+        """Remove all elements from the stack."""
+        self._elements = self._capacity * [None]
+        self._bottom = 0
+        self._size = 0
+
+    def _values(self) -> Iterator[Any]:
+        """Iterate over the elements from the bottom to the top of the stack."""
+        elements, capacity, bottom = self._elements, self._capacity, self._bottom
+        return (elements[(bottom + i) % capacity] for i in range(self._size))
+
+    def segments(self) -> list:
+        """Return the elements as at most two lists, copied from the contiguous runs of the ring buffer from the bottom to the top.
+
+        Returns
+        -------
+        segments: list
+            The lists of elements, from the bottom one; empty if the stack is empty.
+        """
+
+        if not self._size:
+            return []
+        bottom, end = self._bottom, self._bottom + self._size
+        if end <= self._capacity:
+            return [self._elements[bottom:end]]
+        return [self._elements[bottom:], self._elements[: end - self._capacity]]
+
+    def to_list(self) -> list:
+        """Return a list of the elements, from the bottom to the top of the stack."""
+        segments = self.segments()
+        return segments[0] + segments[1] if len(segments) == 2 else (segments[0] if segments else [])
+
+    def drain(self, n: int = None) -> list:
+        """Remove the n top elements of the stack and return them in a list.
+
+        Parameters
+        ----------
+        n: int
+            The maximum amount of elements to remove. If unspecified, the stack is emptied.
+            default = None
+
+        Returns
+        -------
+        elements: list
+            The removed elements, from the top one, in the order pop() returns them.
+        """
+
+        if type(self).pop is not StackCirc.pop:
+            return super().drain(n)
+
+        count = self._drain_count(n)
+        if not count:
+            return []
+        # The count topmost elements span at most two runs of the buffer, like in peek().
+        start = (self._bottom + self._size - count) % self._capacity
+        if start + count <= self._capacity:
+            runs = [(start, start + count)]
+        else:
+            runs = [(start, self._capacity), (0, start + count - self._capacity)]
+        elements = []
+        for begin, stop in runs:
+            elements += self._elements[begin:stop]
+            self._elements[begin:stop] = [None] * (stop - begin)
+        self._size -= count
+        elements.reverse()
+        return elements
+
+    def _empty_like(self) -> "StackCirc":
+        """Create an empty stack with the same capacity and eviction callback."""
+        return plain_class(type(self))(self._capacity, on_evict=self._on_evict)
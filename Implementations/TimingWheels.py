@@ -0,0 +1,242 @@
+"""
+Created on Mon Oct 19 20:31:14 2026
+
+Hierarchical timing wheel: constant time scheduling and cancellation of a large amount of timers.
+
+"""
+import math
+from typing import Any, List
+
+from .LinkedLists import DoublyLL
+
+
+class Timer:
+    """Handle of a timer scheduled on a TimingWheel, pass it to TimingWheel.cancel() to stop it.
+
+    Attributes
+    ----------
+    deadline: float
+        The time at which the timer expires.
+
+    item: Any
+        The item returned by TimingWheel.advance() once the timer expired.
+    """
+
+    def __init__(self, deadline: float, tick: int, item: Any) -> None:
+        self.deadline = deadline
+        self.item = item
+        # The tick at which the timer expires, and its node in the slot holding it.
+        self._tick = tick
+        self._node = None
+
+    def __repr__(self) -> str:
+        return f"Timer({self.deadline}, {self.item!r})"
+
+    @property
+    def active(self) -> bool:
+        """Whether the timer is still scheduled, it's neither expired nor cancelled."""
+        return self._node is not None
+
+
+class TimingWheel:
+    """Hierarchical timing wheel, schedules and cancels timers in constant time.
+
+    Time is split in ticks of `tick` seconds. Each level is a ring of `slots` slots, and a slot of level `l` spans `slots ** l` ticks, so the wheel covers `slots ** levels` ticks ahead.
+    A timer is stored in the slot of the lowest level whose range reaches its deadline. Whenever the first level completes a rotation, the next slot of the level above is cascaded: its timers are redistributed to the lower levels, closer to their deadline.
+    Each slot is a DoublyLL and each timer keeps its node, so cancelling a timer removes it from its slot in constant time. Timers beyond the range of the wheel wait in an overflow list that is redistributed after every rotation of the last level.
+
+    Timers expire on the first tick at or after their deadline, never before it.
+
+    Parameters
+    ----------
+    tick: float
+        The resolution of the wheel, in seconds.
+        default = 0.001
+
+    slots: int
+        The amount of slots of every level.
+        default = 256
+
+    levels: int
+        The amount of levels.
+        default = 4
+
+    start: float
+        The current time, in seconds.
+        default = 0.0
+
+    Methods
+    -------
+    schedule(delay, item) -> Timer:
+        Schedule item to expire after delay seconds.
+
+    cancel(timer) -> bool:
+        Stop a scheduled timer.
+
+    advance(now) -> list:
+        Move the wheel to time `now` and return the items of the expired timers.
+    """
+
+    def __init__(
+        self, tick: float = 0.001, slots: int = 256, levels: int = 4, start: float = 0.0
+    ) -> None:
+        if not isinstance(tick, (int, float)) or tick <= 0:
+            raise ValueError("tick must be a positive number.")
+        if not isinstance(slots, int) or slots < 2:
+            raise ValueError("slots must be an int greater than one.")
+        if not isinstance(levels, int) or levels < 1:
+            raise ValueError("levels must be a positive int.")
+        if not isinstance(start, (int, float)):
+            raise TypeError("start must be a number.")
+
+        self._tick = tick
+        self._slots = slots
+        self._levels = levels
+        # The amount of ticks spanned by a slot of each level, and by the whole wheel.
+        self._spans = [slots ** level for level in range(levels + 1)]
+        self._wheels = [[DoublyLL() for _ in range(slots)] for _ in range(levels)]
+        self._overflow = DoublyLL()
+        # Timers whose tick is already reached, returned by the next advance().
+        self._due = DoublyLL()
+        self._time = start
+        self._current = math.floor(start / tick)
+        self._count = 0
+
+    def __repr__(self) -> str:
+        return f"TimingWheel(tick={self._tick}, slots={self._slots}, levels={self._levels}, timers={self._count})"
+
+    def __len__(self) -> int:
+        return self._count
+
+    def schedule(self, delay: float, item: Any) -> Timer:
+        """Schedule item to expire after delay seconds.
+
+        Parameters
+        ----------
+        delay: float
+            The amount of seconds from the current time of the wheel, the `now` of the last advance().
+
+        item: Any
+            The item returned by advance() once the timer expired.
+
+        Returns
+        -------
+        timer: Timer
+            The handle of the timer.
+        """
+
+        if not isinstance(delay, (int, float)):
+            raise TypeError("delay must be a number.")
+        if delay < 0:
+            raise ValueError("delay must not be negative.")
+
+        deadline = self._time + delay
+        timer = Timer(deadline, math.ceil(deadline / self._tick), item)
+        self._place(timer)
+        self._count += 1
+        return timer
+
+    def cancel(self, timer: Timer) -> bool:
+        """Stop a scheduled timer.
+
+        Parameters
+        ----------
+        timer: Timer
+            The handle returned by schedule().
+
+        Returns
+        -------
+        cancelled: bool
+            False if the timer already expired or was already cancelled.
+        """
+
+        node = timer._node
+        if node is None:
+            return False
+
+        node.owner.remove_node(node)
+        timer._node = None
+        self._count -= 1
+        return True
+
+    def advance(self, now: float) -> List[Any]:
+        """Move the wheel to time `now` and return the items of the expired timers.
+
+        Parameters
+        ----------
+        now: float
+            The current time, it must not be before the time of the previous call.
+
+        Returns
+        -------
+        items: list
+            The items of the timers that expired since the previous call, ordered by tick.
+        """
+
+        if not isinstance(now, (int, float)):
+            raise TypeError("now must be a number.")
+        if now < self._time:
+            raise ValueError("now must not be before the current time of the wheel.")
+
+        self._time = now
+        target = math.floor(now / self._tick)
+        expired = []
+        self._collect(self._due, expired)
+
+        spans, slots, wheels = self._spans, self._slots, self._wheels
+        while self._current < target:
+            if not self._count:
+                # Nothing to cascade or expire in the remaining ticks.
+                self._current = target
+                break
+
+            self._current += 1
+            current = self._current
+            if current % spans[-1] == 0:
+                self._cascade(self._overflow)
+
+            # Cascade the levels whose slot boundary is reached, starting from the highest one, so the timers move down to the first level in one go.
+            level = 0
+            while level + 1 < self._levels and current % spans[level + 1] == 0:
+                level += 1
+            for level in range(level, 0, -1):
+                self._cascade(wheels[level][(current // spans[level]) % slots])
+
+            self._collect(self._due, expired)
+            self._collect(wheels[0][current % slots], expired)
+
+        return expired
+
+    def _place(self, timer: Timer) -> None:
+        """Store a timer in the slot that matches its distance from the current tick."""
+        distance = timer._tick - self._current
+        if distance <= 0:
+            slot = self._due
+        elif distance >= self._spans[-1]:
+            slot = self._overflow
+        else:
+            level = 0
+            while distance >= self._spans[level + 1]:
+                level += 1
+            slot = self._wheels[level][(timer._tick // self._spans[level]) % self._slots]
+        timer._node = slot.insert_node(timer)
+
+    def _cascade(self, slot: DoublyLL) -> None:
+        """Redistribute the timers of a slot."""
+        if slot.head is None:
+            return
+        timers = [node.data for node in slot._nodes()]
+        slot.delete()
+        for timer in timers:
+            self._place(timer)
+
+    def _collect(self, slot: DoublyLL, expired: List[Any]) -> None:
+        """Expire the timers of a slot, adding their items to expired."""
+        if slot.head is None:
+            return
+        for node in slot._nodes():
+            timer = node.data
+            timer._node = None
+            expired.append(timer.item)
+        self._count -= len(slot)
+        slot.delete()
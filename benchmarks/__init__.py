@@ -0,0 +1,12 @@
+"""
+Created on Mon Oct 19 11:02:18 2026
+
+Throughput and memory benchmarks for the data structures in `Implementations`.
+
+Run the whole suite and save the results:
+    python -m benchmarks run --output results.json
+
+Fail when an operation slowed down compared to saved results:
+    python -m benchmarks compare baseline.json results.json --threshold 1.5
+
+"""
@@ -0,0 +1,108 @@
+"""
+Created on Mon Oct 19 11:02:18 2026
+
+Command line entry point of the benchmark suite, see `python -m benchmarks --help`.
+
+"""
+import argparse
+import json
+import sys
+
+from .cases import BASELINES, CASES
+from .complexity import COMPLEXITY, check_complexity
+from .suite import DEFAULT_SIZES, compare, run_suite
+
+
+def _run(args) -> int:
+    cases = dict(CASES, **BASELINES)
+    if args.structures:
+        unknown = set(args.structures) - set(cases)
+        if unknown:
+            print(f"Unknown structures: {', '.join(sorted(unknown))}", file=sys.stderr)
+            return 2
+        cases = {name: cases[name] for name in args.structures}
+
+    results = run_suite(
+        args.sizes,
+        cases,
+        calls=args.calls,
+        budget=args.budget,
+        repeat=args.repeat,
+        memory=not args.no_memory,
+        verbose=True,
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+def _compare(args) -> int:
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    regressions = compare(baseline, current, args.threshold)
+    for r in regressions:
+        print(
+            f"{r['structure']:<10} {r['operation']:<15} {r['size']:>8} "
+            f"{r['baseline'] * 1e9:>12.1f} -> {r['current'] * 1e9:>12.1f} ns/op (x{r['ratio']:.2f})"
+        )
+
+    if regressions:
+        print(f"{len(regressions)} operation(s) slowed down beyond x{args.threshold}.")
+        return 1
+
+    print("No regressions found.")
+    return 0
+
+
+def _complexity(args) -> int:
+    failures = 0
+    for structure, operation in COMPLEXITY:
+        if args.structures and structure not in args.structures:
+            continue
+
+        ok, exponent, declared = check_complexity(structure, operation)
+        failures += not ok
+        status = "ok" if ok else "MISMATCH"
+        print(f"{structure:<12} {operation:<15} {declared:<9} n^{exponent:<6.2f} {status}")
+
+    return 1 if failures else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    run = commands.add_parser("run", help="run the benchmarks")
+    run.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    run.add_argument("--structures", nargs="+", help="only run these structures")
+    run.add_argument("--calls", type=int, default=1000, help="maximum calls per measurement")
+    run.add_argument("--budget", type=float, default=0.25, help="seconds per measurement")
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--no-memory", action="store_true", help="skip memory measurements")
+    run.add_argument("--output", help="save the results to this JSON file")
+    run.set_defaults(func=_run)
+
+    cmp = commands.add_parser("compare", help="fail if results slowed down")
+    cmp.add_argument("baseline", help="JSON results of the reference run")
+    cmp.add_argument("current", help="JSON results of the new run")
+    cmp.add_argument("--threshold", type=float, default=1.5, help="allowed slowdown ratio")
+    cmp.set_defaults(func=_compare)
+
+    complexity = commands.add_parser(
+        "complexity", help="check the growth of each operation against its declared complexity"
+    )
+    complexity.add_argument("--structures", nargs="+", help="only check these structures")
+    complexity.set_defaults(func=_complexity)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
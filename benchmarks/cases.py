@@ -0,0 +1,118 @@
+"""
+Created on Mon Oct 19 11:02:18 2026
+
+Benchmark cases: how to build each structure and which operations to time on it.
+
+Every case maps an operation name to a tuple of (operation, mutates). An operation receives the structure and the call number, and performs a single call.
+Operations that don't modify the structure share one prebuilt instance per size.
+
+"""
+from collections import deque
+
+from Implementations.LinkedLists import DoublyLL, SinglyLL
+from Implementations.Queues import MinMaxQueue, Queue, QueueCirc, QueueLL
+from Implementations.Stacks import MinMaxStack, Stack, StackCirc, StackLL
+
+# Value that is never stored in a benchmarked structure.
+MISSING = -1
+
+
+def _iterate(struct, _):
+    for _ in struct:
+        pass
+
+
+def _linked_list_ops():
+    return {
+        "insert_tail": (lambda lst, i: lst.insert(i), True),
+        "insert_head": (lambda lst, i: lst.insert(i, 0), True),
+        "insert_middle": (lambda lst, i: lst.insert(i, len(lst) // 2), True),
+        "pop_head": (lambda lst, _: lst.pop(0), True),
+        "pop_tail": (lambda lst, _: lst.pop(), True),
+        "remove_head": (lambda lst, _: lst.remove(lst.head.data), True),
+        "remove_tail": (lambda lst, _: lst.remove(lst.tail.data), True),
+        "getitem_middle": (lambda lst, _: lst[len(lst) // 2], False),
+        "contains_miss": (lambda lst, _: MISSING in lst, False),
+        "iterate": (_iterate, False),
+        "rotate_left": (lambda lst, _: lst.rotate(-1), True),
+        "rotate_right": (lambda lst, _: lst.rotate(1), True),
+        "reverse": (lambda lst, _: lst.reverse(), True),
+    }
+
+
+def _queue_ops():
+    return {
+        "enqueue": (lambda queue, i: queue.enqueue(i), True),
+        "dequeue": (lambda queue, _: queue.dequeue(), True),
+        "peek": (lambda queue, _: queue.peek(), False),
+        "contains_miss": (lambda queue, _: MISSING in queue, False),
+        "iterate": (_iterate, False),
+    }
+
+
+def _stack_ops():
+    return {
+        "push": (lambda stack, i: stack.push(i), True),
+        "pop": (lambda stack, _: stack.pop(), True),
+        "peek": (lambda stack, _: stack.peek(), False),
+        "contains_miss": (lambda stack, _: MISSING in stack, False),
+        "iterate": (_iterate, False),
+    }
+
+
+def _extrema_ops(ops):
+    return dict(
+        ops,
+        min=(lambda struct, _: struct.min(), False),
+        max=(lambda struct, _: struct.max(), False),
+    )
+
+
+def _queue_circ(n):
+    # Leave room for the enqueue benchmark.
+    queue = QueueCirc(2 * n)
+    for i in range(n):
+        queue.enqueue(i)
+    return queue
+
+
+CASES = {
+    "SinglyLL": (lambda n: SinglyLL(range(n)), _linked_list_ops()),
+    "DoublyLL": (lambda n: DoublyLL(range(n)), _linked_list_ops()),
+    "Queue": (lambda n: Queue(vals=range(n)), _queue_ops()),
+    "QueueLL": (lambda n: QueueLL(vals=range(n)), _queue_ops()),
+    "QueueCirc": (_queue_circ, _queue_ops()),
+    "Stack": (lambda n: Stack(vals=range(n)), _stack_ops()),
+    "StackLL": (lambda n: StackLL(vals=range(n)), _stack_ops()),
+    "MinMaxQueue": (lambda n: MinMaxQueue(vals=range(n)), _extrema_ops(_queue_ops())),
+    "MinMaxStack": (lambda n: MinMaxStack(vals=range(n)), _extrema_ops(_stack_ops())),
+    # Full, so every push evicts the bottom element.
+    "StackCirc": (lambda n: StackCirc(n, vals=range(n)), _stack_ops()),
+}
+
+BASELINES = {
+    "list": (
+        lambda n: list(range(n)),
+        {
+            "append": (lambda lst, i: lst.append(i), True),
+            "insert_head": (lambda lst, i: lst.insert(0, i), True),
+            "pop_head": (lambda lst, _: lst.pop(0), True),
+            "pop_tail": (lambda lst, _: lst.pop(), True),
+            "getitem_middle": (lambda lst, _: lst[len(lst) // 2], False),
+            "contains_miss": (lambda lst, _: MISSING in lst, False),
+            "iterate": (_iterate, False),
+        },
+    ),
+    "deque": (
+        lambda n: deque(range(n)),
+        {
+            "append": (lambda dq, i: dq.append(i), True),
+            "appendleft": (lambda dq, i: dq.appendleft(i), True),
+            "popleft": (lambda dq, _: dq.popleft(), True),
+            "pop": (lambda dq, _: dq.pop(), True),
+            "getitem_middle": (lambda dq, _: dq[len(dq) // 2], False),
+            "contains_miss": (lambda dq, _: MISSING in dq, False),
+            "iterate": (_iterate, False),
+        },
+    ),
+}
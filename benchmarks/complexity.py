@@ -0,0 +1,172 @@
+"""
+Created on Mon Oct 19 12:20:45 2026
+
+Empirical complexity checks: time operations at geometrically growing sizes and fit the growth exponent.
+
+The exponent is the slope of a least squares fit of log(time per call) against log(size), so a constant time operation fits close to 0 and a linear one close to 1.
+Only the growth is compared against the declared complexity, never the raw speed, which keeps the check stable across machines.
+
+"""
+import math
+import statistics
+import time
+from typing import Dict, Iterable, Sequence, Tuple
+
+from .cases import CASES
+from .timing import time_per_op
+
+DEFAULT_SIZES = (2048, 8192, 32768)
+
+# Growth exponent of each complexity class.
+EXPONENTS = {"O(1)": 0.0, "O(log n)": 0.0, "O(n)": 1.0}
+
+# Maximum distance between the fitted and the declared exponent.
+DEFAULT_TOLERANCE = 0.4
+
+# Declared complexity of every benchmarked operation.
+COMPLEXITY: Dict[Tuple[str, str], str] = {
+    ("SinglyLL", "insert_tail"): "O(1)",
+    ("SinglyLL", "insert_head"): "O(1)",
+    ("SinglyLL", "insert_middle"): "O(n)",
+    ("SinglyLL", "pop_head"): "O(1)",
+    # A singly linked list has to walk to the node before the tail.
+    ("SinglyLL", "pop_tail"): "O(n)",
+    ("SinglyLL", "remove_head"): "O(1)",
+    ("SinglyLL", "remove_tail"): "O(n)",
+    ("SinglyLL", "getitem_middle"): "O(n)",
+    ("SinglyLL", "contains_miss"): "O(n)",
+    ("SinglyLL", "iterate"): "O(n)",
+    ("SinglyLL", "rotate_left"): "O(1)",
+    # The node before the new head can only be reached from the head.
+    ("SinglyLL", "rotate_right"): "O(n)",
+    ("SinglyLL", "reverse"): "O(n)",
+    ("DoublyLL", "insert_tail"): "O(1)",
+    ("DoublyLL", "insert_head"): "O(1)",
+    ("DoublyLL", "insert_middle"): "O(n)",
+    ("DoublyLL", "pop_head"): "O(1)",
+    ("DoublyLL", "pop_tail"): "O(1)",
+    ("DoublyLL", "remove_head"): "O(1)",
+    # remove() removes the first matching node, so it walks from the head.
+    ("DoublyLL", "remove_tail"): "O(n)",
+    ("DoublyLL", "getitem_middle"): "O(n)",
+    ("DoublyLL", "contains_miss"): "O(n)",
+    ("DoublyLL", "iterate"): "O(n)",
+    ("DoublyLL", "rotate_left"): "O(1)",
+    ("DoublyLL", "rotate_right"): "O(1)",
+    ("DoublyLL", "reverse"): "O(n)",
+    ("Queue", "enqueue"): "O(1)",
+    ("Queue", "dequeue"): "O(1)",
+    ("Queue", "peek"): "O(1)",
+    ("Queue", "contains_miss"): "O(n)",
+    ("Queue", "iterate"): "O(n)",
+    ("QueueLL", "enqueue"): "O(1)",
+    ("QueueLL", "dequeue"): "O(1)",
+    ("QueueLL", "peek"): "O(1)",
+    ("QueueLL", "contains_miss"): "O(n)",
+    ("QueueLL", "iterate"): "O(n)",
+    ("QueueCirc", "enqueue"): "O(1)",
+    ("QueueCirc", "dequeue"): "O(1)",
+    ("QueueCirc", "peek"): "O(1)",
+    ("QueueCirc", "contains_miss"): "O(n)",
+    ("QueueCirc", "iterate"): "O(n)",
+    ("Stack", "push"): "O(1)",
+    ("Stack", "pop"): "O(1)",
+    ("Stack", "peek"): "O(1)",
+    ("Stack", "contains_miss"): "O(n)",
+    ("Stack", "iterate"): "O(n)",
+    ("StackLL", "push"): "O(1)",
+    ("StackLL", "pop"): "O(1)",
+    ("StackLL", "peek"): "O(1)",
+    ("StackLL", "contains_miss"): "O(n)",
+    ("StackLL", "iterate"): "O(n)",
+    ("MinMaxQueue", "enqueue"): "O(1)",
+    ("MinMaxQueue", "dequeue"): "O(1)",
+    ("MinMaxQueue", "min"): "O(1)",
+    ("MinMaxQueue", "max"): "O(1)",
+    ("MinMaxStack", "push"): "O(1)",
+    ("MinMaxStack", "pop"): "O(1)",
+    ("MinMaxStack", "min"): "O(1)",
+    ("MinMaxStack", "max"): "O(1)",
+    ("StackCirc", "push"): "O(1)",
+    ("StackCirc", "pop"): "O(1)",
+    ("StackCirc", "peek"): "O(1)",
+    ("StackCirc", "contains_miss"): "O(n)",
+    ("StackCirc", "iterate"): "O(n)",
+}
+
+
+# Operations documented as constant time that are linear in the current implementation.
+KNOWN_VIOLATIONS = {
+    # list.pop(0) shifts every remaining element.
+    ("Queue", "dequeue"),
+    # The top of the stack is the tail of a SinglyLL, so popping it walks the whole list.
+    ("StackLL", "pop"),
+}
+
+
+def fit_exponent(sizes: Sequence[int], seconds: Sequence[float]) -> float:
+    """Return the slope of the least squares line through (log(size), log(seconds))."""
+    if len(sizes) != len(seconds) or len(sizes) < 2:
+        raise ValueError("at least two (size, seconds) pairs are needed.")
+
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(t, 1e-12)) for t in seconds]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    covariance = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+    variance = sum((x - x_mean) ** 2 for x in xs)
+    return covariance / variance
+
+
+def measure_exponent(
+    structure: str,
+    operation: str,
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    calls: int = 200,
+    repeat: int = 5,
+) -> float:
+    """Time an operation of `cases.CASES` at each size and return its fitted growth exponent.
+
+    Each size is timed `repeat` times and the median is fitted, the sizes take turns so a burst of load on the machine spreads over all of them instead of bending the curve.
+    Calls are timed in CPU time of the process, so other processes competing for the CPU don't inflate them.
+    A single structure is built per size and reused by all repetitions. Calls are capped so that modifying operations change the size by less than an eighth.
+    """
+    build, ops = CASES[structure]
+    op, _ = ops[operation]
+
+    sizes = list(sizes)
+    structs = [build(size) for size in sizes]
+    samples = [[] for _ in sizes]
+    for _ in range(repeat):
+        for size, struct, timings in zip(sizes, structs, samples):
+            timings.append(
+                time_per_op(
+                    None,
+                    op,
+                    calls=min(calls, max(1, size // (8 * repeat))),
+                    budget=0.02,
+                    repeat=1,
+                    struct=struct,
+                    timer=time.process_time,
+                )
+            )
+    return fit_exponent(sizes, [statistics.median(timings) for timings in samples])
+
+
+def check_complexity(
+    structure: str,
+    operation: str,
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> Tuple[bool, float, str]:
+    """Compare the fitted exponent of an operation with its declared complexity.
+
+    Returns
+    -------
+    (ok, exponent, declared): tuple
+        Whether the fit is within `tolerance` of the declared exponent, the fitted exponent, and the declared complexity.
+    """
+
+    declared = COMPLEXITY[(structure, operation)]
+    exponent = measure_exponent(structure, operation, sizes)
+    return abs(exponent - EXPONENTS[declared]) <= tolerance, exponent, declared
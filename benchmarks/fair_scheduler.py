@@ -0,0 +1,72 @@
+"""
+Created on Mon Oct 19 23:37:12 2026
+
+Dispatch cost of the FairScheduler at a growing amount of tenants, against a loop scanning every tenant QueueLL for the next non-empty one:
+    python -m benchmarks.fair_scheduler --tenants 10 100 1000 10000 100000 --active 100
+
+Only `active` tenants have pending jobs at a time, like a job router where most tenants are idle.
+
+"""
+import argparse
+import random
+import timeit
+
+from Implementations.Queues import QueueLL
+from Implementations.Schedulers import FairScheduler
+
+
+class ScanningRouter:
+    """Round robin over per-tenant queues that scans past the empty ones."""
+
+    def __init__(self, tenants: int) -> None:
+        self._queues = [QueueLL() for _ in range(tenants)]
+        self._next = 0
+
+    def submit(self, tenant: int, job) -> None:
+        self._queues[tenant].enqueue(job)
+
+    def dispatch(self):
+        queues, count = self._queues, len(self._queues)
+        for offset in range(count):
+            index = (self._next + offset) % count
+            if not queues[index].empty():
+                self._next = index + 1
+                return index, queues[index].dequeue()
+        raise AssertionError("no pending jobs")
+
+
+def run(router, tenants: int, active: int, dispatches: int, seed: int) -> float:
+    """Keep `active` random tenants busy and return the nanoseconds per dispatch."""
+    rng = random.Random(seed)
+    busy = rng.sample(range(tenants), active)
+    for tenant in busy:
+        router.submit(tenant, 0)
+
+    start = timeit.default_timer()
+    for i in range(dispatches):
+        tenant, _ = router.dispatch()
+        # Every dispatched job is replaced by a job of one of the busy tenants.
+        router.submit(busy[i % active], i)
+    return (timeit.default_timer() - start) / dispatches * 1e9
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.fair_scheduler")
+    parser.add_argument("--tenants", type=int, nargs="+", default=[10, 100, 1000, 10000, 100000])
+    parser.add_argument("--active", type=int, default=100, help="tenants with pending jobs")
+    parser.add_argument("--dispatches", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for tenants in args.tenants:
+        active = min(args.active, tenants)
+        scanning = run(ScanningRouter(tenants), tenants, active, args.dispatches, args.seed)
+        scheduler = FairScheduler()
+        for tenant in range(tenants):
+            scheduler.add_tenant(tenant)
+        fair = run(scheduler, tenants, active, args.dispatches, args.seed)
+        print(f"tenants={tenants:<8} scan {scanning:>10.0f} ns/dispatch   FairScheduler {fair:>8.0f} ns/dispatch")
+
+
+if __name__ == "__main__":
+    main()
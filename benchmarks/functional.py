@@ -0,0 +1,77 @@
+"""
+Created on Mon Oct 19 17:20:09 2026
+
+Single-pass functional operators against the manual "iterate and insert into a new list" pattern:
+    python -m benchmarks.functional --size 100000
+
+"""
+import argparse
+
+from Implementations.LinkedLists import DoublyLL, SinglyLL
+
+from .timing import time_per_op
+
+
+def _manual_map(lst, func):
+    result = type(lst)()
+    for node in lst:
+        result.insert(func(node.data))
+    return result
+
+
+def _manual_filter(lst, pred):
+    result = type(lst)()
+    for node in lst:
+        if pred(node.data):
+            result.insert(node.data)
+    return result
+
+
+def _manual_filter_inplace(lst, pred):
+    # Removing by index re-walks the list from the head for every rejected node.
+    index = 0
+    while index < len(lst):
+        if pred(lst[index].data):
+            index += 1
+        else:
+            lst.pop(index)
+    return lst
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.functional")
+    parser.add_argument("--size", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    def double(val):
+        return 2 * val
+
+    def even(val):
+        return val % 2 == 0
+
+    # Filtering in place with pop(index) is quadratic, keep its list smaller.
+    inplace_size = min(args.size, 5000)
+
+    for cls in (SinglyLL, DoublyLL):
+        cases = [
+            ("map", args.size, lambda lst, _: _manual_map(lst, double), lambda lst, _: lst.map(double)),
+            ("filter", args.size, lambda lst, _: _manual_filter(lst, even), lambda lst, _: lst.filter(even)),
+            (
+                "filter_inplace",
+                inplace_size,
+                lambda lst, _: _manual_filter_inplace(lst, even),
+                lambda lst, _: lst.filter_inplace(even),
+            ),
+        ]
+        for name, size, manual, builtin in cases:
+            build = lambda: cls(range(size))
+            before = time_per_op(build, manual, calls=1, budget=0, repeat=3)
+            after = time_per_op(build, builtin, calls=1, budget=0, repeat=3)
+            print(
+                f"{cls.__name__:<9} {name:<15} n={size:<8} manual {before * 1e3:>9.2f} ms"
+                f"   single pass {after * 1e3:>9.2f} ms   x{before / after:.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Created on Mon Oct 19 16:02:44 2026
+
+Sustained enqueue/dequeue churn on QueueLL, with and without a NodePool.
+
+Reports the wall time, the amount of Node objects allocated, and the garbage collections and total pause time observed during the run:
+    python -m benchmarks.node_pool --operations 1000000 --size 1000
+
+"""
+import argparse
+import gc
+import json
+import timeit
+
+from Implementations.LinkedLists import Node, NodePool
+from Implementations.Queues import QueueLL
+
+
+class _GCMonitor:
+    """Count garbage collections and their total pause time through gc.callbacks."""
+
+    def __init__(self) -> None:
+        self.collections = 0
+        self.pause = 0.0
+        self._start = None
+
+    def __call__(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._start = timeit.default_timer()
+        elif self._start is not None:
+            self.pause += timeit.default_timer() - self._start
+            self.collections += 1
+            self._start = None
+
+    def __enter__(self) -> "_GCMonitor":
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        gc.callbacks.remove(self)
+
+
+def churn(operations: int, size: int, pool_size: int = None) -> dict:
+    """Keep a QueueLL at `size` elements while enqueuing and dequeuing `operations` elements.
+
+    Parameters
+    ----------
+    pool_size: int
+        The max_size of the NodePool used by the queue. If unspecified, no pool is used.
+        default = None
+    """
+
+    pool = NodePool(pool_size) if pool_size is not None else None
+    queue = QueueLL(vals=range(size), pool=pool)
+    # Keep some garbage around so that collections have realistic work to do.
+    live = [Node(i) for i in range(10000)]
+
+    gc.collect()
+    with _GCMonitor() as monitor:
+        start = timeit.default_timer()
+        for i in range(operations):
+            queue.enqueue(i)
+            queue.dequeue()
+        elapsed = timeit.default_timer() - start
+
+    del live
+    return {
+        "pool_size": pool_size,
+        "seconds": elapsed,
+        "node_allocations": pool.misses if pool is not None else operations,
+        "gc_collections": monitor.collections,
+        "gc_pause_seconds": monitor.pause,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.node_pool")
+    parser.add_argument("--operations", type=int, default=1000000)
+    parser.add_argument("--size", type=int, default=1000, help="steady queue length")
+    parser.add_argument("--pool-size", type=int, default=1024)
+    args = parser.parse_args(argv)
+
+    results = [
+        churn(args.operations, args.size),
+        churn(args.operations, args.size, args.pool_size),
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
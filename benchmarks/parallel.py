@@ -0,0 +1,53 @@
+"""
+Created on Mon Oct 19 18:01:37 2026
+
+Scaling of parallel_map across worker counts on a CPU-heavy transform:
+    python -m benchmarks.parallel --size 200000 --workers 1 2 4 8
+
+"""
+import argparse
+import os
+import timeit
+
+from Implementations.LinkedLists import SinglyLL
+from Implementations.Queues import Queue
+
+
+def cpu_heavy(val: int) -> int:
+    """Deliberately slow transform, about a few microseconds per call."""
+    total = 0
+    for i in range(200):
+        total = (total + val * i) % 1000003
+    return total
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.parallel")
+    parser.add_argument("--size", type=int, default=200000)
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1]
+    )
+    args = parser.parse_args(argv)
+
+    for struct in (SinglyLL(range(args.size)), Queue(vals=range(args.size))):
+        name = type(struct).__name__
+        if hasattr(struct, "_values"):
+            values = struct._values
+        else:
+            values = lambda: (node.data for node in struct._nodes())
+
+        start = timeit.default_timer()
+        [cpu_heavy(val) for val in values()]
+        serial = timeit.default_timer() - start
+        print(f"{name:<9} serial            {serial:>8.2f} s")
+
+        for workers in args.workers:
+            start = timeit.default_timer()
+            struct.parallel_map(cpu_heavy, workers=workers, chunk_size=args.chunk_size)
+            elapsed = timeit.default_timer() - start
+            print(f"{name:<9} workers={workers:<8} {elapsed:>8.2f} s   speedup x{serial / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Created on Mon Oct 19 22:14:37 2026
+
+Linked list lookups and removals on heavy values, where every == compares about a megabyte:
+    python -m benchmarks.payloads --size 64 --payload 1048576
+
+Values are (blob, id) tuples whose blobs only differ in their last bytes, so comparing two values reads both blobs entirely.
+Lookups of the last value compare by value, by identity and by a key returning the id. pop() of the middle node only does structural checks, so its time must not depend on the payload size.
+
+"""
+import argparse
+import json
+import timeit
+from operator import itemgetter
+
+from Implementations.LinkedLists import DoublyLL, SinglyLL
+
+
+def make_values(size: int, payload: int) -> list:
+    return [(bytes(payload - 8) + i.to_bytes(8, "big"), i) for i in range(size)]
+
+
+def run(cls: type, size: int, payload: int, repeat: int) -> dict:
+    values = make_values(size, payload)
+    lst = cls(values)
+    target = values[-1]
+    # Equal to the target, but a different object.
+    twin = (bytes(target[0]), target[1])
+    key = itemgetter(1)
+
+    def timed(func) -> float:
+        return min(timeit.repeat(func, number=1, repeat=repeat)) * 1e6
+
+    def remove_and_restore(**kwargs) -> None:
+        lst.remove(target if "key" not in kwargs else target[1], **kwargs)
+        lst.insert(target)
+
+    middle = size // 2
+
+    def pop_and_restore() -> None:
+        val = lst[middle].data
+        lst.pop(middle)
+        lst.insert(val, middle)
+
+    return {
+        "list": cls.__name__,
+        "payload_bytes": payload,
+        "contains_eq_us": timed(lambda: twin in lst),
+        "contains_identity_us": timed(lambda: lst.__contains__(target, identity=True)),
+        "contains_key_us": timed(lambda: lst.__contains__(target[1], key=key)),
+        "index_key_us": timed(lambda: lst.index(target[1], key=key)),
+        "remove_eq_us": timed(remove_and_restore),
+        "remove_identity_us": timed(lambda: remove_and_restore(identity=True)),
+        "remove_key_us": timed(lambda: remove_and_restore(key=key)),
+        "pop_middle_us": timed(pop_and_restore),
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.payloads")
+    parser.add_argument("--size", type=int, default=64, help="amount of values in the list")
+    parser.add_argument("--payload", type=int, default=1 << 20, help="bytes per value")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    results = []
+    for cls in (SinglyLL, DoublyLL):
+        for payload in (16, args.payload):
+            results.append(run(cls, args.size, payload, args.repeat))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
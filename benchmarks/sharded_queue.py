@@ -0,0 +1,80 @@
+"""
+Created on Mon Oct 19 23:02:51 2026
+
+Throughput of concurrent producers on a ShardedQueue, against a single QueueLL behind one lock:
+    python -m benchmarks.sharded_queue --items 200000 --threads 1 2 4 8 16
+
+Every producer enqueues its share of `items` while one consumer drains in batches of `batch` elements.
+On interpreters with a global interpreter lock the threads don't run Python code in parallel, so the numbers mostly show the lock contention; the scaling shows on free-threaded builds.
+
+"""
+import argparse
+import threading
+import timeit
+
+from Implementations.Queues import QueueLL
+from Implementations.ShardedQueues import ShardedQueue
+
+
+class LockedQueue:
+    """A single QueueLL shared by all the threads behind one lock."""
+
+    def __init__(self) -> None:
+        self._queue = QueueLL()
+        self._lock = threading.Lock()
+
+    def enqueue(self, element) -> None:
+        with self._lock:
+            self._queue.enqueue(element)
+
+    def dequeue_many(self, n: int) -> list:
+        with self._lock:
+            return [self._queue.dequeue() for _ in range(min(n, len(self._queue)))]
+
+
+def run(queue, items: int, threads: int, batch: int) -> float:
+    """Push items through the queue with `threads` producers and one consumer, return the elapsed seconds."""
+    share = items // threads
+    total = share * threads
+
+    def produce() -> None:
+        enqueue = queue.enqueue
+        for i in range(share):
+            enqueue(i)
+
+    def consume() -> None:
+        taken = 0
+        while taken < total:
+            taken += len(queue.dequeue_many(batch))
+
+    workers = [threading.Thread(target=produce) for _ in range(threads)]
+    consumer = threading.Thread(target=consume)
+    start = timeit.default_timer()
+    consumer.start()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    consumer.join()
+    return timeit.default_timer() - start
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.sharded_queue")
+    parser.add_argument("--items", type=int, default=200000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--batch", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    queues = (
+        ("locked QueueLL", lambda threads: LockedQueue()),
+        ("ShardedQueue", lambda threads: ShardedQueue(lanes=threads, batch=args.batch)),
+    )
+    for name, make in queues:
+        for threads in args.threads:
+            elapsed = run(make(threads), args.items, threads, args.batch)
+            print(f"{name:<14} threads={threads:<4} {args.items / elapsed:>12.0f} items/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Created on Mon Oct 19 11:02:18 2026
+
+Run the benchmark cases over a range of sizes and compare results between runs.
+
+"""
+import platform
+from typing import Dict, Iterable, List
+
+from .cases import BASELINES, CASES
+from .timing import peak_memory, time_per_op
+
+DEFAULT_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+
+
+def run_suite(
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    cases: dict = None,
+    calls: int = 1000,
+    budget: float = 0.25,
+    repeat: int = 3,
+    memory: bool = True,
+    verbose: bool = False,
+) -> dict:
+    """Time every operation of every case at each size.
+
+    Parameters
+    ----------
+    sizes: iterable of int
+        The amount of elements in the structure before timing an operation.
+        default = (1000, 10000, 100000, 1000000)
+
+    cases: dict
+        Cases to run, in the format of `cases.CASES`. If unspecified, all structures and baselines are run.
+        default = None
+
+    calls, budget, repeat:
+        Passed to `timing.time_per_op`.
+
+    memory: bool
+        Whether to measure the peak memory used while building each structure.
+        default = True
+
+    verbose: bool
+        Whether to print every result once it's measured.
+        default = False
+
+    Returns
+    -------
+    results: dict
+        JSON serializable results, containing a "timings" list of {structure, operation, size, seconds} records and a "memory" list of {structure, size, bytes} records.
+    """
+
+    if cases is None:
+        cases = dict(CASES, **BASELINES)
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "sizes": list(sizes),
+        },
+        "timings": [],
+        "memory": [],
+    }
+
+    for name, (build, ops) in cases.items():
+        for size in sizes:
+            shared = build(size)
+            for op_name, (op, mutates) in ops.items():
+                seconds = time_per_op(
+                    lambda: build(size),
+                    op,
+                    # Keep the structure at roughly the same size while timing.
+                    calls=min(calls, max(1, size // 2)) if mutates else calls,
+                    budget=budget,
+                    repeat=repeat,
+                    struct=None if mutates else shared,
+                )
+                results["timings"].append(
+                    {"structure": name, "operation": op_name, "size": size, "seconds": seconds}
+                )
+                if verbose:
+                    print(f"{name:<10} {op_name:<15} {size:>8} {seconds * 1e9:>14.1f} ns/op")
+            del shared
+
+            if memory:
+                nbytes = peak_memory(lambda: build(size))
+                results["memory"].append({"structure": name, "size": size, "bytes": nbytes})
+                if verbose:
+                    print(f"{name:<10} {'memory':<15} {size:>8} {nbytes / size:>14.1f} B/elem")
+
+    return results
+
+
+def compare(baseline: dict, current: dict, threshold: float = 1.5) -> List[Dict]:
+    """Find operations that got slower than `threshold` times their baseline timing.
+
+    Only operations present in both results are compared.
+
+    Returns
+    -------
+    regressions: list of dict
+        {structure, operation, size, baseline, current, ratio} records, sorted by decreasing ratio.
+    """
+
+    if threshold <= 0:
+        raise ValueError("threshold must be greater than zero.")
+
+    def key(record):
+        return record["structure"], record["operation"], record["size"]
+
+    old = {key(record): record["seconds"] for record in baseline["timings"]}
+    regressions = []
+    for record in current["timings"]:
+        before = old.get(key(record))
+        if not before:
+            continue
+
+        ratio = record["seconds"] / before
+        if ratio > threshold:
+            structure, operation, size = key(record)
+            regressions.append(
+                {
+                    "structure": structure,
+                    "operation": operation,
+                    "size": size,
+                    "baseline": before,
+                    "current": record["seconds"],
+                    "ratio": ratio,
+                }
+            )
+
+    return sorted(regressions, key=lambda record: record["ratio"], reverse=True)
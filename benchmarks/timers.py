@@ -0,0 +1,94 @@
+"""
+Created on Mon Oct 19 20:58:40 2026
+
+TimingWheel against a heapq-based timer queue with lazy cancellation, at a large amount of outstanding timers:
+    python -m benchmarks.timers --timers 1000000 --cancel 0.5
+
+Timers get random delays of up to `--horizon` seconds, a fraction of them is cancelled, then time advances one millisecond at a time until all of them expired.
+
+"""
+import argparse
+import heapq
+import json
+import random
+import timeit
+
+from Implementations.TimingWheels import TimingWheel
+
+
+class HeapTimers:
+    """Timer queue on a binary heap, cancelled timers are skipped when they reach the top."""
+
+    def __init__(self) -> None:
+        self._heap = []
+        self._sequence = 0
+        self._now = 0.0
+
+    def schedule(self, delay: float, item) -> list:
+        entry = [self._now + delay, self._sequence, item, True]
+        self._sequence += 1
+        heapq.heappush(self._heap, entry)
+        return entry
+
+    def cancel(self, entry: list) -> bool:
+        active, entry[3] = entry[3], False
+        return active
+
+    def advance(self, now: float) -> list:
+        self._now = now
+        heap, expired = self._heap, []
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if entry[3]:
+                expired.append(entry[2])
+        return expired
+
+
+def run(timers, delays, cancelled, horizon: float, step: float) -> dict:
+    start = timeit.default_timer()
+    handles = [timers.schedule(delay, i) for i, delay in enumerate(delays)]
+    schedule = timeit.default_timer() - start
+
+    start = timeit.default_timer()
+    for i in cancelled:
+        timers.cancel(handles[i])
+    cancel = timeit.default_timer() - start
+
+    del handles
+    expired = 0
+    start = timeit.default_timer()
+    for tick in range(1, int(horizon / step) + 2):
+        expired += len(timers.advance(tick * step))
+    advance = timeit.default_timer() - start
+
+    return {
+        "timers": type(timers).__name__,
+        "schedule_ns": schedule / len(delays) * 1e9,
+        "cancel_ns": cancel / max(len(cancelled), 1) * 1e9,
+        "advance_seconds": advance,
+        "expired": expired,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.timers")
+    parser.add_argument("--timers", type=int, default=1000000)
+    parser.add_argument("--horizon", type=float, default=60.0, help="maximum delay in seconds")
+    parser.add_argument("--cancel", type=float, default=0.5, help="fraction of cancelled timers")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    delays = [rng.uniform(0, args.horizon) for _ in range(args.timers)]
+    cancelled = rng.sample(range(args.timers), int(args.cancel * args.timers))
+
+    step = 0.001
+    results = [
+        run(HeapTimers(), delays, cancelled, args.horizon, step),
+        run(TimingWheel(tick=step), delays, cancelled, args.horizon, step),
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Created on Mon Oct 19 11:02:18 2026
+
+Timing and memory measurement helpers shared by the benchmarks.
+
+"""
+import gc
+import timeit
+import tracemalloc
+from typing import Any, Callable
+
+# How often (in calls) the time budget is checked, must be a power of two minus one.
+_CHECK_MASK = 63
+
+
+def time_per_op(
+    build: Callable[[], Any],
+    op: Callable[[Any, int], Any],
+    calls: int = 1000,
+    budget: float = 0.25,
+    repeat: int = 3,
+    struct: Any = None,
+    timer: Callable[[], float] = timeit.default_timer,
+) -> float:
+    """Measure the average time of a single call of `op`, in seconds.
+
+    Parameters
+    ----------
+    build: callable
+        Return a fresh structure for each repetition. Unused if `struct` is given.
+
+    op: callable
+        Perform a single operation on the structure, receives the structure and the call number.
+
+    calls: int
+        The maximum amount of calls per repetition.
+        default = 1000
+
+    budget: float
+        The maximum time in seconds spent on a single repetition. Slow operations are stopped early and averaged over the calls that completed.
+        default = 0.25
+
+    repeat: int
+        The amount of repetitions, the fastest one is reported.
+        default = 3
+
+    struct: Any
+        A prebuilt structure shared by all repetitions. Modifying operations see the changes made by earlier repetitions.
+        default = None
+
+    timer: callable
+        The clock, e.g. time.process_time to leave out the time the process spends waiting for the CPU. The budget is measured with the same clock.
+        default = timeit.default_timer
+
+    Returns
+    -------
+    seconds: float
+    """
+
+    best = float("inf")
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            target = build() if struct is None else struct
+            done = 0
+            start = timer()
+            deadline = start + budget
+            while done < calls:
+                op(target, done)
+                done += 1
+                if not done & _CHECK_MASK and timer() > deadline:
+                    break
+            best = min(best, (timer() - start) / done)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return best
+
+
+def peak_memory(build: Callable[[], Any]) -> int:
+    """Return the peak amount of bytes allocated while building a structure."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        struct = build()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del struct
+    return peak
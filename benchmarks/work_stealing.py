@@ -0,0 +1,95 @@
+"""
+Created on Mon Oct 19 19:40:26 2026
+
+Throughput of fine-grained recursive tasks on the WorkStealingScheduler, against worker threads sharing a single locked Stack:
+    python -m benchmarks.work_stealing --depth 16 --workers 1 2 4 8
+
+Each task splits into two subtasks until `depth` levels are reached, and leaves do `work` iterations of arithmetic.
+On interpreters with a global interpreter lock the threads don't run Python code in parallel, so the numbers mostly show the scheduling overhead and contention; the scaling shows on free-threaded builds.
+
+"""
+import argparse
+import os
+import threading
+import timeit
+
+from Implementations.Schedulers import WorkStealingScheduler
+from Implementations.Stacks import Stack
+
+
+def leaf(work: int) -> int:
+    total = 0
+    for i in range(work):
+        total = (total + i * i) % 1000003
+    return total
+
+
+def work_stealing(depth: int, work: int, workers: int) -> float:
+    """Run the task tree on a WorkStealingScheduler, return the elapsed seconds."""
+
+    def task(level: int) -> None:
+        if level < depth:
+            scheduler.spawn(task, level + 1)
+            scheduler.spawn(task, level + 1)
+        else:
+            leaf(work)
+
+    with WorkStealingScheduler(workers) as scheduler:
+        start = timeit.default_timer()
+        scheduler.spawn(task, 0)
+        scheduler.wait()
+        return timeit.default_timer() - start
+
+
+def locked_stack(depth: int, work: int, workers: int) -> float:
+    """Run the task tree on threads sharing one Stack behind a lock, return the elapsed seconds."""
+    stack = Stack(vals=[0])
+    lock = threading.Lock()
+    pending = [1]
+
+    def worker() -> None:
+        while True:
+            with lock:
+                if not pending[0]:
+                    return
+                level = stack.pop() if not stack.empty() else None
+            if level is None:
+                continue
+
+            if level < depth:
+                with lock:
+                    stack.push(level + 1)
+                    stack.push(level + 1)
+                    pending[0] += 1
+            else:
+                leaf(work)
+                with lock:
+                    pending[0] -= 1
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    start = timeit.default_timer()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return timeit.default_timer() - start
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.work_stealing")
+    parser.add_argument("--depth", type=int, default=16, help="levels of the task tree")
+    parser.add_argument("--work", type=int, default=20, help="iterations done by each leaf")
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1]
+    )
+    args = parser.parse_args(argv)
+
+    tasks = 2 ** (args.depth + 1) - 1
+    for name, run in (("locked Stack", locked_stack), ("work stealing", work_stealing)):
+        for workers in args.workers:
+            elapsed = run(args.depth, args.work, workers)
+            print(f"{name:<14} workers={workers:<4} {tasks / elapsed:>12.0f} tasks/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import random
+
+import pytest
+from Implementations.Filters import BloomFilter, CountingBloomFilter
+from Implementations.LinkedLists import DoublyLL, SinglyLL
+from Implementations.Queues import QueueCirc, QueueLL
+from Implementations.Stacks import Stack, StackLL
+
+
+class TestBloomFilter:
+    @pytest.mark.parametrize("cls", [BloomFilter, CountingBloomFilter])
+    def test_false_positive_rate(self, cls) -> None:
+        bloom = cls(10000, fp_rate=0.01)
+        for i in range(10000):
+            bloom.add(f"key{i}")
+
+        assert all(bloom.might_contain(f"key{i}") for i in range(10000))
+        false_positives = sum(bloom.might_contain(f"miss{i}") for i in range(20000))
+        assert false_positives / 20000 < 0.02
+        assert bloom.stats()["rejected"] == 20000 - false_positives
+
+    def test_counting_removals(self) -> None:
+        bloom = CountingBloomFilter(100)
+        for i in range(100):
+            bloom.add(i)
+        for i in range(100):
+            bloom.discard(i)
+        assert len(bloom) == 0
+        assert not any(bloom.might_contain(i) for i in range(100))
+        assert bloom.stats()["bytes"] > BloomFilter(100).stats()["bytes"]
+
+    def test_unhashable(self) -> None:
+        bloom = BloomFilter(10)
+        bloom.add(1)
+        assert bloom.might_contain([2]) and not bloom.might_contain(2)
+        bloom.add([2])
+        assert bloom.might_contain(3), "unhashable elements can't be located"
+        bloom.discard([2])
+        assert not bloom.might_contain(3)
+
+    def test_params(self) -> None:
+        with pytest.raises(ValueError):
+            BloomFilter(0)
+        with pytest.raises(ValueError):
+            BloomFilter(10, fp_rate=1)
+
+
+class TestFilteredStructures:
+    @pytest.mark.parametrize("counting", [True, False])
+    @pytest.mark.parametrize("cls", [SinglyLL, DoublyLL])
+    def test_linked_lists(self, cls, counting) -> None:
+        rng = random.Random(5)
+        lst = cls(range(50))
+        lst.enable_filter(counting=counting)
+        assert type(lst).__name__ == f"Filtered{cls.__name__}"
+
+        expected = list(range(50))
+        for step in range(3000):
+            action = rng.random()
+            if action < 0.4:
+                # Repeated values, removals must take out the first occurrence.
+                val = rng.randrange(200)
+                lst.insert(val)
+                expected.append(val)
+            elif action < 0.55 and expected:
+                index = rng.randrange(len(expected))
+                lst.pop(index)
+                expected.pop(index)
+            elif action < 0.7 and expected:
+                val = rng.choice(expected)
+                lst.remove(val)
+                expected.remove(val)
+            else:
+                val = rng.randint(0, 3100)
+                assert (val in lst) == (val in expected)
+
+        def name(val):
+            return val[0] if isinstance(val, tuple) else None
+
+        lst.insert(("a", 1))
+        assert lst.__contains__("a", key=name) and ("a", 1) in lst
+        lst.remove("a", key=name)
+        assert ("a", 1) not in lst and not lst.__contains__("a", key=name)
+
+        cursor = lst.cursor()
+        cursor.insert_before(-1).replace(-2)
+        assert -1 in lst and -2 in lst
+        lst.filter_inplace(lambda val: val % 2 == 0)
+        assert -2 in lst and 3101 not in lst and -1 not in lst
+
+        assert type(lst.map(abs)) is cls
+        lst.delete()
+        assert 0 not in lst
+        assert lst.disable_filter() is not None and type(lst) is cls
+
+    @pytest.mark.parametrize("struct", [QueueLL(vals=range(10)), QueueCirc(20)])
+    def test_queues(self, struct) -> None:
+        struct.enable_filter()
+        struct.enqueue(100)
+        assert 100 in struct and 101 not in struct
+        while not struct.empty():
+            struct.dequeue()
+        assert 100 not in struct and struct._filter.count == 0
+        assert type(struct._empty_like()) is type(struct).__bases__[0]
+
+    @pytest.mark.parametrize("cls", [Stack, StackLL])
+    def test_stacks(self, cls) -> None:
+        stack = cls(vals=range(10))
+        bloom = stack.enable_filter()
+        for i in range(10, 500):
+            stack.push(i)
+        assert stack._filter is not bloom, "the filter grows with the stack"
+        assert 499 in stack and 500 not in stack
+        assert stack.pop() == 499 and 499 not in stack
+
+    def test_batched_edits(self) -> None:
+        lst = DoublyLL(range(10))
+        lst.enable_filter()
+        lst.insert_many([(0, -5), (10, 50)])
+        assert -5 in lst and 50 in lst
+        assert lst.pop_many([0, -1]) == [-5, 50]
+        assert lst._filter.count == 10 and not lst._filter.might_contain(50)
+
+    @pytest.mark.parametrize("first", ["filter", "instrumentation"])
+    def test_features_disabled_out_of_order(self, first) -> None:
+        lst = SinglyLL(range(10))
+        switches = {
+            "filter": (lst.enable_filter, lst.disable_filter),
+            "instrumentation": (lst.instrument, lst.uninstrument),
+        }
+        second = "instrumentation" if first == "filter" else "filter"
+        switches[first][0]()
+        switches[second][0]()
+        switches[first][1]()
+
+        lst.insert(10)
+        assert 10 in lst and 11 not in lst
+        assert hasattr(lst, "_filter") == (second == "filter")
+        assert hasattr(lst, "_instrumentation") == (second == "instrumentation")
+        switches[second][1]()
+        assert type(lst) is SinglyLL
+
+    def test_queue_features_disabled_out_of_order(self) -> None:
+        queue = QueueLL.from_iter(range(10), capacity=3, on_overflow="block")
+        queue.enable_metrics()
+        queue.enable_filter()
+        queue.disable_metrics()
+        assert queue.dequeue() == 0 and 3 in queue
+        assert type(queue._empty_like()) is QueueLL
+        queue.disable_filter()
+        assert [queue.dequeue() for _ in range(9)] == list(range(1, 10))
+        assert type(queue) is QueueLL
@@ -1,5 +1,7 @@
+from collections import deque
+
 import pytest
-from Implementations.LinkedLists import Node, SinglyLL
+from Implementations.LinkedLists import DoublyLL, Node, NodePool, SinglyLL
 
 
 class TestNode:
@@ -263,3 +265,390 @@ class TestSinglyLL:
             for i in [-1, -2, "a", "b", "c"]:
                 assert i not in l
 
+
+
+class TestInstrumentation:
+    def test_snapshot(self) -> None:
+        lst = SinglyLL([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
+        instrumentation = lst.instrument()
+        assert isinstance(lst, SinglyLL)
+
+        lst.insert("a", 5)
+        lst.pop()
+        assert 3 in lst
+        lst[7]
+
+        stats = instrumentation.snapshot()
+        assert stats["insert"]["calls"] == 1
+        assert stats["insert"]["nodes_walked"] == 4
+        assert stats["pop"]["nodes_walked"] == 9
+        assert stats["__getitem__"]["calls"] == 1, "nested lookups must not be counted"
+        assert stats["__getitem__"]["walk_histogram"] == {"4-7": 1}
+        assert stats["__contains__"]["nodes_walked"] == 4
+        assert stats["remove"]["calls"] == 0
+
+        instrumentation.reset()
+        assert instrumentation.snapshot()["insert"]["calls"] == 0
+
+    def test_callback(self) -> None:
+        calls = []
+        lst = DoublyLL([1, 2, 3])
+        lst.instrument(lambda op, walked, seconds: calls.append((op, walked)))
+        lst.remove(2)
+        assert calls == [("remove", 2)]
+
+    def test_uninstrument(self) -> None:
+        lst = SinglyLL([1, 2, 3])
+        lst.instrument()
+        lst.pop(0)
+        assert lst.uninstrument().snapshot()["pop"]["calls"] == 1
+        assert type(lst) is SinglyLL
+        assert lst.uninstrument() is None
+        assert repr(lst) == "2->3"
+
+
+class TestMemoryUsage:
+    def test_breakdown(self) -> None:
+        payload = list(range(1000))
+        lst = DoublyLL([payload, payload, payload])
+
+        shallow = lst.memory_usage()
+        assert set(shallow) == {"container", "nodes", "total"}
+        assert shallow["total"] == shallow["container"] + shallow["nodes"]
+
+        deep = lst.memory_usage(deep=True)
+        single = SinglyLL([payload]).memory_usage(deep=True)
+        assert deep["payload"] == single["payload"], "shared payloads must be counted once"
+        assert deep["total"] == deep["container"] + deep["nodes"] + deep["payload"]
+
+        assert SinglyLL().memory_usage()["nodes"] == 0
+
+    def test_estimate(self) -> None:
+        from Implementations.Memory import estimate_memory
+
+        actual = SinglyLL(range(5000)).memory_usage()
+        estimate = estimate_memory(SinglyLL, 5000)
+        assert estimate["nodes"] == actual["nodes"]
+        assert estimate_memory(SinglyLL, 5000, payload_bytes=10)["payload"] == 50000
+
+
+class TestNodePool:
+    def test_recycling(self) -> None:
+        pool = NodePool(max_size=2)
+        payload = object()
+        singly = SinglyLL([payload, 1, 2], pool=pool)
+        doubly = DoublyLL([3, 4], pool=pool)
+
+        singly.pop(0)
+        singly.remove(2)
+        doubly.pop()
+        assert len(pool) == 2
+        assert all(node.data is None for node in pool._nodes), "payloads must be released"
+
+        doubly.insert(5)
+        assert pool.stats()["hits"] == 1
+        assert repr(doubly) == "3<->5"
+        assert pool.stats() == {
+            "size": 1,
+            "max_size": 2,
+            "hits": 1,
+            "misses": 5,
+            "released": 2,
+            "dropped": 1,
+        }
+
+    def test_single_node_pop(self) -> None:
+        lst = DoublyLL([1], pool=NodePool())
+        lst.pop()
+        assert lst.head is lst.tail is None and len(lst) == 0
+
+        lst.insert(1).remove(1)
+        assert lst.head is lst.tail is None and len(lst) == 0
+
+
+class TestCursor:
+    def test_filter_in_place(self) -> None:
+        for lst in [SinglyLL(range(10)), DoublyLL(range(10), circular=True)]:
+            cursor = lst.cursor()
+            for _ in range(len(lst)):
+                if cursor.value % 2:
+                    cursor.remove_current()
+                else:
+                    cursor.advance()
+
+            assert [node.data for node in lst] == [0, 2, 4, 6, 8]
+            assert len(lst) == 5
+            assert lst.tail.data == 8
+            if lst.circular:
+                assert lst.tail.next is lst.head and lst.head.prev is lst.tail
+            else:
+                assert lst.tail.next is None
+
+    def test_insert_and_replace(self) -> None:
+        lst = SinglyLL([1, 3])
+        cursor = lst.cursor(1)
+        cursor.insert_before(2).insert_after(4).replace(30)
+        assert repr(lst) == "1->2->30->4"
+        assert cursor.index == 2 and cursor.value == 30
+
+        cursor = lst.cursor(len(lst))
+        assert cursor.node is None
+        cursor.insert_before(5)
+        assert lst.tail.data == 5 and len(lst) == 5
+
+        with pytest.raises(IndexError):
+            cursor.advance()
+        with pytest.raises(IndexError):
+            lst.cursor(6)
+
+    def test_retreat(self) -> None:
+        lst = DoublyLL([1, 2, 3])
+        cursor = lst.cursor(3)
+        assert [cursor.retreat().value for _ in range(3)] == [3, 2, 1]
+        with pytest.raises(IndexError):
+            cursor.retreat()
+
+        cursor.advance().remove_current()
+        assert repr(lst) == "1<->3"
+        assert lst.tail.prev is lst.head
+
+
+class TestNodeHandles:
+    def test_remove_node(self) -> None:
+        lst = DoublyLL()
+        handles = [lst.insert_node(val) for val in [1, 2, 1, 3]]
+
+        assert lst.remove_node(handles[2]) == 1
+        assert repr(lst) == "1<->2<->3", "the handle's node must be removed, not the first equal value"
+        assert lst.remove_node(handles[3]) == 3
+        assert lst.tail is handles[1] and lst.tail.next is None
+        assert len(lst) == 2
+
+        for node in [handles[2], Node(1), DoublyLL([1]).insert_node(1)]:
+            with pytest.raises(ValueError):
+                lst.remove_node(node)
+
+        lst.pop(0)
+        with pytest.raises(ValueError):
+            lst.remove_node(handles[0])
+
+    def test_move(self) -> None:
+        lst = DoublyLL(circular=True)
+        a, b, c = [lst.insert_node(val) for val in "abc"]
+
+        lst.move_to_front(c)
+        assert repr(lst) == "c<->a<->b"
+        lst.move_to_back(c).move_to_back(a)
+        assert repr(lst) == "b<->c<->a"
+        assert lst.head is b and lst.tail is a
+        assert lst.tail.next is lst.head and lst.head.prev is lst.tail
+
+        lst.delete()
+        with pytest.raises(ValueError):
+            lst.move_to_front(a)
+
+    def test_pooled_handles(self) -> None:
+        pool = NodePool()
+        lst = DoublyLL(pool=pool)
+        stale = lst.insert_node("a")
+        lst.remove_node(stale)
+        assert len(pool) == 0, "a node handed out as a handle must not be recycled"
+
+        fresh = lst.insert_node("b")
+        assert fresh is not stale
+        for operation in (lst.remove_node, lst.move_to_front, lst.move_to_back):
+            with pytest.raises(ValueError):
+                operation(stale)
+        assert repr(lst) == "b"
+
+        lst.insert(1).pop()
+        assert len(pool) == 1, "nodes added by insert() are still recycled"
+
+
+class TestFunctional:
+    @pytest.mark.parametrize("cls", [SinglyLL, DoublyLL])
+    @pytest.mark.parametrize("circular", [False, True])
+    def test_operators(self, cls, circular) -> None:
+        lst = cls(range(10), circular=circular)
+
+        doubled = lst.map(lambda val: 2 * val)
+        assert type(doubled) is cls and doubled.circular == circular
+        assert [node.data for node in doubled] == [2 * i for i in range(10)]
+        assert doubled.tail.next is (doubled.head if circular else None)
+
+        assert [node.data for node in lst.filter(lambda val: val % 3 == 0)] == [0, 3, 6, 9]
+        assert lst.reduce(lambda acc, val: acc + val) == 45
+        assert lst.reduce(lambda acc, val: acc + val, 10) == 55
+        assert len(lst.take_while(lambda val: val < 4)) == 4
+        assert [len(part) for part in lst.chunk(4)] == [4, 4, 2]
+
+        odd, even = lst.partition(lambda val: val % 2)
+        assert [node.data for node in odd] == [1, 3, 5, 7, 9]
+        assert [node.data for node in even] == [0, 2, 4, 6, 8]
+        assert len(lst) == 10
+
+        with pytest.raises(TypeError):
+            cls().reduce(lambda acc, val: acc + val)
+        with pytest.raises(ValueError):
+            next(lst.chunk(0))
+
+    @pytest.mark.parametrize("cls", [SinglyLL, DoublyLL])
+    def test_filter_inplace(self, cls) -> None:
+        lst = cls(range(10), circular=True)
+        head = lst.head
+        lst.filter_inplace(lambda val: val % 2 == 0)
+
+        assert [node.data for node in lst] == [0, 2, 4, 6, 8]
+        assert lst.head is head and len(lst) == 5
+        assert lst.tail.next is lst.head
+
+        def failing(val):
+            if val == 6:
+                raise KeyError(val)
+            return val != 2
+
+        with pytest.raises(KeyError):
+            lst.filter_inplace(failing)
+        assert [node.data for node in lst] == [0, 4, 6, 8]
+        assert len(lst) == 4 and lst.tail.data == 8
+
+        lst.filter_inplace(lambda val: False)
+        assert lst.head is lst.tail is None and len(lst) == 0
+
+
+class TestRotateReverse:
+    @pytest.mark.parametrize("cls", [SinglyLL, DoublyLL])
+    @pytest.mark.parametrize("circular", [False, True])
+    def test_rotate(self, cls, circular) -> None:
+        for k in range(-6, 7):
+            lst = cls(range(5), circular=circular)
+            nodes = list(lst._nodes())
+            expected = deque(range(5))
+            expected.rotate(k)
+
+            assert lst.rotate(k) is lst
+            assert [node.data for node in lst._nodes()] == list(expected)
+            assert set(map(id, lst._nodes())) == set(map(id, nodes)), "nodes should be relinked, not created"
+            assert lst.tail.next is (lst.head if circular else None)
+            if cls is DoublyLL:
+                assert lst.head.prev is (lst.tail if circular else None)
+                assert [node.data for node in reversed(lst)] == list(expected)[::-1]
+
+        assert len(cls().rotate(3)) == 0
+        with pytest.raises(TypeError):
+            cls(range(3)).rotate(1.5)
+
+    @pytest.mark.parametrize("cls", [SinglyLL, DoublyLL])
+    @pytest.mark.parametrize("circular", [False, True])
+    def test_reverse(self, cls, circular) -> None:
+        lst = cls(range(6), circular=circular)
+        assert lst.reverse() is lst
+        assert [node.data for node in lst._nodes()] == [5, 4, 3, 2, 1, 0]
+        assert lst.tail.next is (lst.head if circular else None)
+        if cls is DoublyLL:
+            assert [node.data for node in reversed(lst)] == list(range(6))
+            assert lst.head.prev is (lst.tail if circular else None)
+
+        lst.insert(-1)
+        assert lst.tail.data == -1
+        assert len(cls().reverse()) == 0 and [node.data for node in cls([1]).reverse()] == [1]
+
+
+class TestBatchedEdits:
+    @pytest.mark.parametrize("cls", [SinglyLL, DoublyLL])
+    @pytest.mark.parametrize("circular", [False, True])
+    def test_insert_many(self, cls, circular) -> None:
+        lst = cls(range(5), circular=circular)
+        assert lst.insert_many([(5, "end"), (0, "a"), (2, "b"), (0, "c"), (5, "last")]) is lst
+        assert [node.data for node in lst._nodes()] == ["a", "c", 0, 1, "b", 2, 3, 4, "end", "last"]
+        assert len(lst) == 10 and lst.tail.data == "last"
+        assert lst.tail.next is (lst.head if circular else None)
+        if cls is DoublyLL:
+            assert [node.data for node in reversed(lst)][0] == "last"
+
+        empty = cls(circular=circular).insert_many([(0, 1), (0, 2)])
+        assert [node.data for node in empty._nodes()] == [1, 2] and empty.tail.data == 2
+
+    @pytest.mark.parametrize("cls", [SinglyLL, DoublyLL])
+    @pytest.mark.parametrize("circular", [False, True])
+    def test_pop_many(self, cls, circular) -> None:
+        pool = NodePool()
+        lst = cls(range(8), circular=circular, pool=pool)
+        assert lst.pop_many([6, 0, -1, 3]) == [6, 0, 7, 3]
+        assert [node.data for node in lst._nodes()] == [1, 2, 4, 5]
+        assert lst.head.data == 1 and lst.tail.data == 5
+        assert lst.tail.next is (lst.head if circular else None)
+        assert pool.stats()["released"] == 4
+        if cls is DoublyLL:
+            assert [node.data for node in reversed(lst)] == [5, 4, 2, 1]
+
+        assert lst.pop_many([]) == []
+        assert lst.pop_many(range(4)) == [1, 2, 4, 5]
+        assert lst.head is None and lst.tail is None and len(lst) == 0
+
+    @pytest.mark.parametrize("cls", [SinglyLL, DoublyLL])
+    def test_atomic(self, cls) -> None:
+        lst = cls(range(5))
+        with pytest.raises(IndexError):
+            lst.insert_many([(1, "a"), (6, "b")])
+        with pytest.raises(TypeError):
+            lst.insert_many([(1, "a"), "b"])
+        with pytest.raises(IndexError):
+            lst.pop_many([0, 5])
+        with pytest.raises(ValueError):
+            lst.pop_many([1, -4])
+        with pytest.raises(TypeError):
+            lst.pop_many([0, None])
+        assert [node.data for node in lst._nodes()] == [0, 1, 2, 3, 4]
+
+
+class TestLookups:
+    @pytest.mark.parametrize("cls", [SinglyLL, DoublyLL])
+    @pytest.mark.parametrize("circular", [False, True])
+    def test_repeated_values(self, cls, circular) -> None:
+        # The node after the popped one holds the same value as the head, it must not become the tail.
+        lst = cls([1, 2, 1], circular=circular)
+        lst.pop(1)
+        assert lst.tail is lst.head.next and len(lst) == 2
+        lst.insert(3)
+        assert [node.data for node in lst._nodes()] == [1, 1, 3]
+
+        lst = cls([1, 2, 3, 2], circular=circular)
+        lst.remove(2)
+        assert [node.data for node in lst._nodes()] == [1, 3, 2]
+        assert lst.tail.data == 2 and lst.tail.next is (lst.head if circular else None)
+        if cls is DoublyLL:
+            assert [node.data for node in reversed(lst)] == [2, 3, 1]
+
+    @pytest.mark.parametrize("cls", [SinglyLL, DoublyLL])
+    def test_key_and_identity(self, cls) -> None:
+        payloads = [{"id": i % 3, "blob": [0] * 10} for i in range(6)]
+        lst = cls(payloads)
+
+        assert lst.index(2, key=lambda val: val["id"]) == 2
+        assert lst.count(1, key=lambda val: val["id"]) == 2
+        assert lst.__contains__(0, key=lambda val: val["id"])
+        assert not lst.__contains__(3, key=lambda val: val["id"])
+
+        # Equal but distinct payloads only match by value.
+        twin = {"id": 0, "blob": [0] * 10}
+        assert twin in lst and lst.count(twin) == 2
+        assert not lst.__contains__(twin, identity=True)
+        assert lst.index(payloads[3], identity=True) == 3
+        assert lst.index(twin) == 0
+
+        lst.remove(payloads[3], identity=True)
+        assert [node.data for node in lst._nodes()] == payloads[:3] + payloads[4:]
+        assert lst.head.data is payloads[0]
+        lst.remove(2, key=lambda val: val["id"])
+        assert lst.count(2, key=lambda val: val["id"]) == 1
+        assert lst.tail.data is payloads[5]
+
+        with pytest.raises(ValueError):
+            lst.index(7, key=lambda val: val["id"])
+        with pytest.raises(ValueError):
+            lst.remove(twin, identity=True)
+        with pytest.raises(ValueError):
+            lst.count(twin, key=len, identity=True)
+        with pytest.raises(TypeError):
+            lst.index(twin, key="id")
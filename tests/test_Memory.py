@@ -0,0 +1,31 @@
+import inspect
+
+import pytest
+from Implementations import LinkedLists, Queues, Stacks
+from Implementations.Memory import estimate_memory
+from Implementations.Queues import QueueTTL
+from Implementations.ShardedQueues import ShardedQueue
+
+STRUCTURES = [
+    cls
+    for module in (LinkedLists, Queues, Stacks)
+    for _, cls in inspect.getmembers(module, inspect.isclass)
+    if cls.__module__ == module.__name__ and hasattr(cls, "memory_usage") and not inspect.isabstract(cls)
+]
+
+
+@pytest.mark.parametrize("cls", STRUCTURES, ids=lambda cls: cls.__name__)
+def test_estimate_every_structure(cls) -> None:
+    estimate = estimate_memory(cls, 10000, sample=64)
+    assert estimate["total"] > estimate_memory(cls, 100, sample=64)["total"]
+
+
+def test_estimate_params() -> None:
+    assert len(STRUCTURES) >= 14
+    assert estimate_memory(QueueTTL, 1000, sample=64, ttl=5)["total"] > 0
+    with pytest.raises(ValueError):
+        estimate_memory(QueueTTL, 1000, sample=64, clock=1, speed=2)
+    with pytest.raises(ValueError):
+        estimate_memory(ShardedQueue, 1000)
+    with pytest.raises(ValueError):
+        estimate_memory(QueueTTL, -1)
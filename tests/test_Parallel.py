@@ -0,0 +1,33 @@
+import math
+
+import pytest
+from Implementations.LinkedLists import DoublyLL
+from Implementations.Parallel import parallel_imap
+from Implementations.Queues import QueueCirc
+
+
+def test_parallel_imap() -> None:
+    assert list(parallel_imap(range(10), math.sqrt, workers=2, chunk_size=3)) == [
+        math.sqrt(i) for i in range(10)
+    ]
+    assert list(parallel_imap([], math.sqrt, workers=1)) == []
+
+    with pytest.raises(ValueError):
+        list(parallel_imap(range(10), math.sqrt, workers=0))
+
+
+def test_parallel_map() -> None:
+    lst = DoublyLL(range(10), circular=True)
+    result = lst.parallel_map(abs, workers=2, chunk_size=4)
+    assert type(result) is DoublyLL and result.circular
+    assert [node.data for node in result] == list(range(10))
+
+    queue = QueueCirc(4)
+    for i in range(6):
+        if queue.full():
+            queue.dequeue()
+        queue.enqueue(-i)
+
+    result = queue.parallel_map(abs, workers=2, chunk_size=3)
+    assert type(result) is QueueCirc and result.full()
+    assert [result.dequeue() for _ in range(4)] == [2, 3, 4, 5]
@@ -0,0 +1,423 @@
+import math
+import random
+import statistics
+from collections import deque
+
+import pytest
+from Implementations.Metrics import StreamingQuantiles, TimestampRing
+from Implementations.Queues import (
+    MinMaxQueue,
+    Queue,
+    QueueCirc,
+    QueueLL,
+    QueueSpill,
+    QueueTTL,
+    QueueWindow,
+)
+
+
+class TestQueueSpill:
+    def test_enqueue_dequeue(self) -> None:
+        queue = QueueSpill(memory_limit=8, block_size=2)
+        for i in range(100):
+            queue.enqueue(i)
+
+        assert len(queue) == 100, f"queue length should be 100, not {len(queue)}"
+        assert (
+            queue._in_memory() <= 8
+        ), f"at most 8 elements should be in memory, not {queue._in_memory()}"
+        assert list(queue) == list(range(100))
+        assert 0 in queue and 99 in queue and 100 not in queue
+
+        for i in range(100):
+            assert queue.peek() == i
+            assert queue.dequeue() == i
+            assert queue._in_memory() <= 8
+            if i % 3 == 0:
+                queue.enqueue(100 + i)
+
+        assert list(queue) == [100 + i for i in range(0, 100, 3)]
+
+    @pytest.mark.parametrize("memory_limit, block_size", [(1000, 250), (1000, 500), (100, 25), (2, 1)])
+    def test_memory_limit(self, memory_limit, block_size) -> None:
+        queue = QueueSpill(memory_limit=memory_limit, block_size=block_size)
+        rng = random.Random(memory_limit + block_size)
+        expected = deque()
+        for i in range(20 * memory_limit):
+            if queue.empty() or rng.random() < 0.55:
+                queue.enqueue(i)
+                expected.append(i)
+            else:
+                assert queue.dequeue() == expected.popleft()
+            assert queue._in_memory() <= memory_limit
+        while not queue.empty():
+            assert queue.dequeue() == expected.popleft()
+            assert queue._in_memory() <= memory_limit
+
+        with pytest.raises(ValueError):
+            QueueSpill(memory_limit=1000, block_size=501)
+
+    def test_capacity(self) -> None:
+        queue = QueueSpill(capacity=5, vals=range(5), memory_limit=2, block_size=1)
+        assert queue.full()
+        with pytest.raises(AssertionError):
+            queue.enqueue(5)
+
+        queue.delete()
+        assert queue.empty() and list(queue) == []
+
+
+class TestQueueMetrics:
+    @pytest.mark.parametrize("queue", [Queue(3, [1]), QueueLL(3, [1]), QueueCirc(3)])
+    def test_stats(self, queue) -> None:
+        queue.enable_metrics()
+        while not queue.full():
+            queue.enqueue(0)
+        with pytest.raises(AssertionError):
+            queue.enqueue(0)
+        while not queue.empty():
+            queue.dequeue()
+        with pytest.raises(AssertionError):
+            queue.dequeue()
+
+        stats = queue.stats()
+        assert stats["full_rejections"] == 1
+        assert stats["empty_rejections"] == 1
+        assert stats["high_water_mark"] == stats["capacity"] == 3
+        assert stats["dequeued"] == stats["sojourn"]["count"] == 3
+        assert stats["size"] == 0
+        assert 0 < stats["sojourn"]["p50"] <= stats["sojourn"]["max"]
+
+        assert queue.disable_metrics() is not None
+        assert not type(queue).__name__.startswith("Metered")
+        with pytest.raises(AssertionError):
+            queue.stats()
+
+    def test_timestamp_ring(self) -> None:
+        ring = TimestampRing(2)
+        for i in range(5):
+            ring.append(float(i))
+        assert ring.popleft() == 0.0
+        ring.append(5.0)
+        assert [ring.popleft() for _ in range(len(ring))] == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+    def test_streaming_quantiles(self) -> None:
+        quantiles = StreamingQuantiles()
+        for i in range(1, 1001):
+            quantiles.add(i / 1000)
+
+        assert quantiles.quantile(0.5) == pytest.approx(0.5, rel=0.05)
+        assert quantiles.quantile(0.99) == pytest.approx(0.99, rel=0.05)
+        assert quantiles.quantile(1) == pytest.approx(1.0, rel=0.05)
+
+
+class TestQueueMemoryUsage:
+    def test_breakdown(self) -> None:
+        queue = Queue(vals=range(100))
+        assert set(queue.memory_usage()) == {"container", "storage", "total"}
+
+        queue_ll = QueueLL(vals=range(100))
+        assert set(queue_ll.memory_usage(deep=True)) == {"container", "nodes", "payload", "total"}
+
+        spilled = QueueSpill(vals=range(100), memory_limit=8, block_size=2).memory_usage()
+        assert spilled["disk"] > 0
+        assert spilled["total"] == spilled["container"] + spilled["storage"]
+
+
+def test_queue_ll_pool() -> None:
+    from Implementations.LinkedLists import NodePool
+
+    pool = NodePool()
+    queue = QueueLL(vals=[1, 2], pool=pool)
+    assert queue.dequeue() == 1
+    queue.enqueue(3)
+    assert pool.stats()["hits"] == 1
+    assert [queue.dequeue(), queue.dequeue()] == [2, 3]
+
+
+class TestFromIter:
+    def test_generator_capacity(self) -> None:
+        queue = QueueLL(3, (i for i in range(3)))
+        assert list(queue._values()) == [0, 1, 2]
+        with pytest.raises(AssertionError):
+            Queue(3, (i for i in range(4)))
+
+    @pytest.mark.parametrize("cls", [Queue, QueueLL, QueueCirc, QueueSpill])
+    def test_overflow(self, cls) -> None:
+        with pytest.raises(AssertionError):
+            cls.from_iter(iter(range(5)), 3)
+
+        source = iter(range(5))
+        queue = cls.from_iter(source, 3, on_overflow="truncate")
+        assert list(queue._values()) == [0, 1, 2]
+        assert next(source) == 3, "truncate shouldn't consume the remaining elements"
+
+    @pytest.mark.parametrize("cls", [Queue, QueueLL, QueueCirc])
+    def test_block(self, cls) -> None:
+        queue = cls.from_iter((i for i in range(10)), 3, on_overflow="block")
+        assert len(queue) == 3
+        assert [queue.dequeue() for _ in range(10)] == list(range(10))
+        assert queue.empty() and type(queue) is cls
+
+        queue = cls.from_iter(range(10), 3, on_overflow="block")
+        queue.delete()
+        assert queue.empty() and type(queue) is cls
+
+    def test_params(self) -> None:
+        with pytest.raises(ValueError):
+            Queue.from_iter(range(3), 2, on_overflow="drop")
+        with pytest.raises(TypeError):
+            Queue.from_iter(3)
+        for cls in (QueueCirc, QueueWindow):
+            with pytest.raises(TypeError, match="capacity"):
+                cls.from_iter(i for i in range(3))
+
+
+class TestQueueTTL:
+    def test_expiry(self) -> None:
+        now = [0.0]
+        queue = QueueTTL(4, 10, clock=lambda: now[0])
+        for i in range(4):
+            queue.enqueue(i)
+            now[0] += 1
+
+        assert queue.full() and len(queue) == 4
+        now[0] = 11.5
+        assert len(queue) == 2 and queue.peek() == 2, "elements 10 seconds old should expire"
+
+        # Wrap around the end of the ring.
+        queue.enqueue(4).enqueue(5)
+        assert list(queue._values()) == [2, 3, 4, 5]
+        assert queue.expire(now[0] + 10) == 4
+        assert queue.empty()
+
+        queue.enqueue(6).enqueue(7)
+        assert queue.dequeue() == 6
+        now[0] = 100
+        assert queue.empty()
+        with pytest.raises(AssertionError):
+            queue.dequeue()
+
+    def test_reads_after_expiry(self) -> None:
+        now = [0.0]
+        queue = QueueTTL(4, 1, clock=lambda: now[0])
+        queue.enqueue("a")
+        now[0] = 0.5
+        queue.enqueue("b")
+        now[0] = 1.2
+
+        # No len() call first: membership and iteration must expire on their own.
+        assert "a" not in queue and None not in queue and "b" in queue
+        now[0] = 1.3
+        assert list(queue) == queue.to_list() == ["b"]
+        now[0] = 2
+        assert list(queue) == [] and "b" not in queue
+
+    def test_batch_expire(self) -> None:
+        now = [0.0]
+        queue = QueueTTL(1000, 1000, clock=lambda: now[0])
+        for i in range(1500):
+            queue.enqueue(i)
+            now[0] += 1
+
+        assert queue.expire(now[0]) == 1
+        assert queue.expire(now[0] + 500) == 500
+        assert list(queue._values()) == list(range(1001, 1500))
+        assert queue._elements.count(None) == 501, "expired elements should be released"
+
+    def test_metrics(self) -> None:
+        now = [0.0]
+        queue = QueueTTL(3, 1, clock=lambda: now[0])
+        queue.enable_metrics()
+        queue.enqueue(1).enqueue(2)
+        now[0] = 5
+        queue.enqueue(3)
+        assert queue.dequeue() == 3
+        stats = queue.stats()
+        assert stats["expired"] == 2 and stats["dequeued"] == 1 and stats["size"] == 0
+
+    def test_params(self) -> None:
+        with pytest.raises(ValueError):
+            QueueTTL(3, 0)
+        with pytest.raises(TypeError):
+            QueueTTL(3, "1")
+        with pytest.raises(TypeError):
+            QueueTTL(None, 1)
+
+        now = [5.0]
+        queue = QueueTTL(3, 1, clock=lambda: now[0]).enqueue(1)
+        now[0] = 4.5
+        with pytest.raises(ValueError):
+            queue.enqueue(2)
+
+
+class TestMinMaxQueue:
+    @pytest.mark.parametrize("key", [None, abs])
+    def test_extrema(self, key) -> None:
+        rng = random.Random(7)
+        queue = MinMaxQueue(vals=[3, -3, 1], key=key)
+        expected = [3, -3, 1]
+        for _ in range(2000):
+            if expected and rng.random() < 0.45:
+                assert queue.dequeue() == expected.pop(0)
+            else:
+                element = rng.randint(-5, 5)
+                queue.enqueue(element)
+                expected.append(element)
+
+            if expected:
+                assert queue.min() == min(expected, key=key)
+                assert queue.max() == max(expected, key=key)
+                assert queue.min() is min(expected, key=key), "the first of equal elements is returned"
+
+        queue.delete()
+        with pytest.raises(AssertionError):
+            queue.min()
+        assert queue.enqueue(2).max() == 2
+
+    def test_from_iter(self) -> None:
+        queue = MinMaxQueue.from_iter(iter([5, 1, 4, 2, 3]), 2, on_overflow="block", key=lambda x: -x)
+        assert queue.min() == 5 and queue.max() == 1
+        queue.dequeue()
+        assert list(queue._values()) == [1, 4] and queue.min() == 4
+        assert "extrema" in queue.memory_usage()
+
+
+class TestQueueWindow:
+    def test_aggregates(self) -> None:
+        rng = random.Random(3)
+        queue = QueueWindow(50)
+        window = []
+        for _ in range(5000):
+            if queue.full():
+                assert queue.dequeue() == window.pop(0)
+            value = rng.choice([rng.uniform(-1e3, 1e3), rng.randint(0, 5)])
+            queue.enqueue(value)
+            window.append(value)
+
+        n = len(window)
+        mean = sum(window) / n
+        assert queue.sum() == pytest.approx(math.fsum(window), abs=1e-9)
+        assert queue.mean() == pytest.approx(mean)
+        assert queue.variance() == pytest.approx(sum((x - mean) ** 2 for x in window) / n)
+        assert queue.variance(ddof=1) == pytest.approx(statistics.variance(window))
+        assert queue.quantile(0) == min(window) and queue.quantile(1) == max(window)
+        assert queue.quantile(0.5) == pytest.approx(statistics.median(window))
+
+    def test_empty(self) -> None:
+        queue = QueueWindow(3).enqueue(1).enqueue(2)
+        assert queue.quantile(0.25) == 1.25
+        queue.dequeue()
+        queue.dequeue()
+        assert queue.sum() == 0
+        with pytest.raises(AssertionError):
+            queue.mean()
+        with pytest.raises(AssertionError):
+            queue.quantile(0.5)
+
+        queue.enqueue(4)
+        assert queue.mean() == 4 and queue.variance() == 0
+        with pytest.raises(AssertionError):
+            queue.variance(ddof=1)
+        queue.delete()
+        assert queue.sum() == 0 and queue.empty()
+
+    def test_reads(self) -> None:
+        queue = QueueWindow(3).enqueue(1).enqueue(2)
+        assert list(queue) == [1, 2] and None not in queue and 2 in queue
+        queue.dequeue()
+        queue.enqueue(3).enqueue(4)
+        assert list(queue) == queue.to_list() == [2, 3, 4]
+
+    def test_params(self) -> None:
+        queue = QueueWindow(3)
+        with pytest.raises(TypeError):
+            queue.enqueue("1")
+        with pytest.raises(ValueError):
+            queue.enqueue(float("nan"))
+        with pytest.raises(ValueError):
+            queue.enqueue(1).quantile(2)
+        with pytest.raises(ValueError):
+            QueueWindow(0)
+
+
+class TestBulkExport:
+    def test_ring_reads(self) -> None:
+        queue = QueueCirc(4)
+        for i in range(4):
+            queue.enqueue(i)
+        queue.dequeue(), queue.dequeue()
+        queue.enqueue(9)
+        assert list(queue) == queue.to_list() == [2, 3, 9]
+        assert None not in queue and 0 not in queue and 9 in queue
+
+    @pytest.mark.parametrize("make", [lambda: Queue(), lambda: QueueLL(), lambda: QueueCirc(6)])
+    def test_drain(self, make) -> None:
+        queue = make()
+        for i in range(6):
+            queue.enqueue(i)
+        # Wrap around the end of the ring.
+        queue.dequeue()
+        queue.dequeue()
+        queue.enqueue(6).enqueue(7)
+
+        assert queue.to_list() == [2, 3, 4, 5, 6, 7]
+        assert queue.to_array("l").tolist() == [2, 3, 4, 5, 6, 7]
+        assert memoryview(queue.to_array("d")).nbytes == 6 * 8
+        assert queue.drain(0) == [] and queue.drain(5) == [2, 3, 4, 5, 6]
+        assert queue.to_list() == [7] and len(queue) == 1
+        queue.enqueue(8)
+        assert queue.drain(10) == [7, 8] and queue.empty() and queue.drain() == []
+        queue.enqueue(9)
+        assert queue.peek() == 9 and queue.to_list() == [9]
+
+        with pytest.raises(TypeError):
+            queue.drain("1")
+        with pytest.raises(ValueError):
+            queue.drain(-1)
+        with pytest.raises(TypeError):
+            queue.enqueue("a").to_array()
+
+    def test_segments(self) -> None:
+        queue = QueueCirc(5)
+        assert queue.segments() == [] and queue.to_list() == []
+        for i in range(5):
+            queue.enqueue(i)
+        assert queue.segments() == [[0, 1, 2, 3, 4]]
+        queue.drain(3)
+        queue.enqueue(5).enqueue(6)
+        assert queue.segments() == [[3, 4], [5, 6]]
+        assert queue.drain() == [3, 4, 5, 6] and queue._elements == [None] * 5
+
+        now = [0]
+        ttl = QueueTTL(4, 10, clock=lambda: now[0])
+        for i in range(4):
+            ttl.enqueue(i)
+            now[0] += 4
+        assert ttl.segments() == [[2, 3]] and ttl.drain() == [2, 3]
+
+    def test_wrappers(self) -> None:
+        queue = QueueCirc(8)
+        metrics = queue.enable_metrics()
+        for i in range(5):
+            queue.enqueue(i)
+        assert queue.drain(3) == [0, 1, 2]
+        assert metrics.dequeued == 3
+
+        window = QueueWindow(4)
+        for i in range(4):
+            window.enqueue(i)
+        assert window.drain(2) == [0, 1] and window.sum() == 5
+
+        fed = QueueLL.from_iter(range(10), capacity=3, on_overflow="block")
+        assert fed.drain(5) == [0, 1, 2, 3, 4] and fed.to_list() == [5, 6, 7]
+
+    def test_numpy(self) -> None:
+        numpy = pytest.importorskip("numpy")
+        queue = QueueCirc(4)
+        for i in range(6):
+            if queue.full():
+                queue.dequeue()
+            queue.enqueue(float(i))
+        assert numpy.asarray(queue).tolist() == [2.0, 3.0, 4.0, 5.0]
+        assert numpy.frombuffer(queue.to_array("d")).tolist() == [2.0, 3.0, 4.0, 5.0]
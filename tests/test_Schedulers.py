@@ -0,0 +1,167 @@
+import threading
+
+import pytest
+from Implementations.Schedulers import FairScheduler, WorkStealingDeque, WorkStealingScheduler
+
+
+class TestWorkStealingDeque:
+    def test_ends(self) -> None:
+        tasks = WorkStealingDeque([1, 2])
+        tasks.push(3).push(4)
+        assert len(tasks) == 4
+        assert tasks.pop() == 4, "the owner should pop the newest task"
+        assert tasks.steal() == 1, "thieves should steal the oldest task"
+        assert tasks.pop() == 3 and tasks.steal() == 2
+        assert tasks.empty()
+
+        with pytest.raises(AssertionError):
+            tasks.pop()
+        with pytest.raises(AssertionError):
+            tasks.steal()
+        with pytest.raises(TypeError):
+            WorkStealingDeque(5)
+
+    def test_concurrent_steal(self) -> None:
+        tasks = WorkStealingDeque(range(20000))
+        taken = [[] for _ in range(4)]
+
+        def thief(index: int) -> None:
+            while True:
+                try:
+                    taken[index].append(tasks.steal())
+                except AssertionError:
+                    return
+
+        thieves = [threading.Thread(target=thief, args=(i,)) for i in range(1, 4)]
+        for thread in thieves:
+            thread.start()
+        thief(0)
+        for thread in thieves:
+            thread.join()
+
+        values = sorted(val for part in taken for val in part)
+        assert values == list(range(20000)), "every task should be taken exactly once"
+
+
+class TestWorkStealingScheduler:
+    def test_recursive_tasks(self) -> None:
+        leaves = []
+
+        def task(level: int) -> None:
+            if level < 10:
+                scheduler.spawn(task, level + 1)
+                scheduler.spawn(task, level=level + 1)
+            else:
+                leaves.append(level)
+
+        with WorkStealingScheduler(4) as scheduler:
+            assert len(scheduler) == 4
+            for _ in range(3):
+                scheduler.spawn(task, 0)
+            scheduler.wait()
+            assert len(leaves) == 3 * 2 ** 10
+
+            scheduler.spawn(task, 5)
+        assert len(leaves) == 3 * 2 ** 10 + 2 ** 5, "shutdown should wait for the tasks"
+
+        with pytest.raises(AssertionError):
+            scheduler.spawn(task, 0)
+
+    def test_errors(self) -> None:
+        with WorkStealingScheduler(2) as scheduler:
+            scheduler.spawn(lambda: 1 / 0)
+            with pytest.raises(ZeroDivisionError):
+                scheduler.wait()
+            scheduler.wait()
+
+        with pytest.raises(ValueError):
+            WorkStealingScheduler(0)
+
+
+class TestFairScheduler:
+    def test_weighted_shares(self) -> None:
+        scheduler = FairScheduler(quantum=2)
+        scheduler.add_tenant("heavy", weight=3)
+        for i in range(300):
+            scheduler.submit("light", i).submit("heavy", i)
+            scheduler.submit("big", i, cost=4)
+        assert len(scheduler) == 900 and scheduler.pending("big") == 300
+
+        served = {"light": 0, "heavy": 0, "big": 0}
+        order = {"light": [], "heavy": [], "big": []}
+        for _ in range(400):
+            tenant, job = scheduler.dispatch()
+            served[tenant] += 4 if tenant == "big" else 1
+            order[tenant].append(job)
+
+        # Cost shares follow the weights 1:3:1.
+        assert abs(served["heavy"] - 3 * served["light"]) <= 6
+        assert abs(served["big"] - served["light"]) <= 4
+        assert all(jobs == sorted(jobs) for jobs in order.values()), "jobs of a tenant should stay in FIFO order"
+
+    def test_idle_tenants(self) -> None:
+        scheduler = FairScheduler()
+        for tenant in range(1000):
+            scheduler.add_tenant(tenant)
+        scheduler.submit(500, "a").submit(7, "b").submit(500, "c")
+        assert [scheduler.dispatch() for _ in range(3)] == [(500, "a"), (7, "b"), (500, "c")]
+        assert scheduler.empty()
+        with pytest.raises(AssertionError):
+            scheduler.dispatch()
+
+    def test_feedback(self) -> None:
+        scheduler = FairScheduler(levels=3, allotment=3, boost_interval=20)
+        for i in range(30):
+            scheduler.submit("batch", i)
+        first = [scheduler.dispatch() for _ in range(4)]
+        assert first == [("batch", i) for i in range(4)]
+
+        # The batch tenant used its allotment, a new tenant goes first.
+        scheduler.submit("interactive", "x")
+        assert scheduler.dispatch() == ("interactive", "x")
+        assert scheduler._tenants["batch"].level == 1
+
+        for _ in range(15):
+            scheduler.dispatch()
+        assert scheduler._tenants["batch"].level == 2
+        scheduler.dispatch()
+        assert scheduler._tenants["batch"].level == 0, "every tenant should be boosted after boost_interval dispatches"
+        assert len(scheduler) == 10
+
+    def test_lazy_boost(self) -> None:
+        scheduler = FairScheduler(levels=2, allotment=2)
+        for i in range(10):
+            scheduler.submit("low", i)
+        scheduler.submit("idle", "x").submit("idle", "y").submit("idle", "z")
+        for _ in range(6):
+            scheduler.dispatch()
+        assert scheduler._tenants["low"].level == 1 and scheduler._tenants["idle"].level == 1
+
+        scheduler.submit("top", "a").submit("top", "b")
+        scheduler.boost()
+        scheduler.submit("low", 10)
+        assert scheduler.dispatch() == ("top", "a")
+        assert scheduler._tenants["low"].level == 0, "active tenants should move up on the next dispatch"
+        assert scheduler.dispatch() == ("low", 3)
+        scheduler.submit("idle", "w")
+        assert scheduler._tenants["idle"].level == 0, "idle tenants should be reset when they're touched"
+
+    def test_tenants(self) -> None:
+        scheduler = FairScheduler(capacity=2)
+        scheduler.add_tenant("a", capacity=3)
+        scheduler.submit("a", 1).submit("a", 2).submit("a", 3).submit("b", 1).submit("b", 2)
+        with pytest.raises(AssertionError):
+            scheduler.submit("a", 4)
+        with pytest.raises(AssertionError):
+            scheduler.submit("b", 3)
+
+        assert scheduler.remove_tenant("a") == [1, 2, 3]
+        assert len(scheduler) == 2 and scheduler.dispatch() == ("b", 1)
+        with pytest.raises(KeyError):
+            scheduler.pending("a")
+        with pytest.raises(ValueError):
+            scheduler.add_tenant("b")
+        with pytest.raises(ValueError):
+            scheduler.submit("b", 1, cost=0)
+        with pytest.raises(ValueError):
+            FairScheduler(levels=0)
@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+from Implementations.Queues import QueueCirc, QueueLL
+from Implementations.ShardedQueues import ShardedQueue
+
+
+class TestShardedQueue:
+    @pytest.mark.parametrize("lane", [QueueLL, QueueCirc])
+    def test_lane_order(self, lane) -> None:
+        queue = ShardedQueue(lanes=4, capacity=100, lane=lane, batch=3)
+        for i in range(40):
+            queue.enqueue(i, key=i % 5)
+        assert len(queue) == 40 and not queue.empty() and not queue.full()
+
+        taken = queue.dequeue_many(25) + [queue.dequeue()] + queue.dequeue_many(100)
+        assert sorted(taken) == list(range(40)) and queue.empty()
+        for key in range(5):
+            same_key = [val for val in taken if val % 5 == key]
+            assert same_key == sorted(same_key), "elements of a key should stay in FIFO order"
+
+        with pytest.raises(AssertionError):
+            queue.dequeue()
+        assert queue.dequeue_many(10) == []
+
+    def test_global_order(self) -> None:
+        queue = ShardedQueue(lanes=8, ordering="global")
+        for i in range(100):
+            queue.enqueue(i, key=i * 7)
+        assert queue.dequeue() == 0
+        assert queue.dequeue_many(60) == list(range(1, 61))
+        assert queue.dequeue_many(100) == list(range(61, 100))
+
+    def test_capacity(self) -> None:
+        queue = ShardedQueue(lanes=2, capacity=2, lane=QueueCirc)
+        for key in (0, 0, 1, 1):
+            queue.enqueue(key, key=key)
+        assert queue.full() and len(queue) == 4
+        with pytest.raises(AssertionError):
+            queue.enqueue(2, key=0)
+        queue.delete()
+        assert queue.empty() and not queue.full()
+
+    @pytest.mark.parametrize("ordering", ["lane", "global"])
+    def test_concurrent_producers(self, ordering) -> None:
+        queue = ShardedQueue(lanes=4, ordering=ordering)
+        taken = []
+        done = threading.Event()
+
+        def produce(start: int) -> None:
+            for i in range(start, start + 5000):
+                queue.enqueue(i)
+
+        def consume() -> None:
+            while not (done.is_set() and queue.empty()):
+                taken.extend(queue.dequeue_many(100))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        producers = [threading.Thread(target=produce, args=(i * 5000,)) for i in range(8)]
+        for thread in producers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+        done.set()
+        consumer.join()
+
+        assert sorted(taken) == list(range(40000)), "every element should be dequeued exactly once"
+        for start in range(0, 40000, 5000):
+            produced = [val for val in taken if start <= val < start + 5000]
+            assert produced == sorted(produced), "elements of a producer should stay in FIFO order"
+
+    def test_params(self) -> None:
+        with pytest.raises(ValueError):
+            ShardedQueue(lanes=0)
+        with pytest.raises(ValueError):
+            ShardedQueue(lane=QueueCirc)
+        with pytest.raises(TypeError):
+            ShardedQueue(lane=list)
+        with pytest.raises(ValueError):
+            ShardedQueue(ordering="random")
+        with pytest.raises(ValueError):
+            ShardedQueue(batch=0)
+        with pytest.raises(TypeError):
+            ShardedQueue().dequeue_many(None)
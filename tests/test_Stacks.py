@@ -0,0 +1,169 @@
+import random
+
+import pytest
+from Implementations.Stacks import MinMaxStack, Stack, StackCirc, StackLL, StackSpill
+
+
+class TestStackSpill:
+    def test_push_pop(self) -> None:
+        stack = StackSpill(memory_limit=8, block_size=2)
+        for i in range(100):
+            stack.push(i)
+
+        assert len(stack) == 100, f"stack length should be 100, not {len(stack)}"
+        assert (
+            len(stack._elements) <= 8
+        ), f"at most 8 elements should be in memory, not {len(stack._elements)}"
+        assert list(stack) == list(range(100))
+        assert 0 in stack and 99 in stack and 100 not in stack
+
+        for i in reversed(range(100)):
+            assert stack.peek() == i
+            assert stack.pop() == i
+            assert len(stack._elements) <= 8
+
+        assert stack.empty()
+
+    def test_capacity(self) -> None:
+        stack = StackSpill(capacity=5, vals=range(5), memory_limit=2, block_size=1)
+        assert stack.full()
+        with pytest.raises(AssertionError):
+            stack.push(5)
+
+        stack.delete()
+        assert len(stack) == 0 and list(stack) == []
+
+    def test_params(self) -> None:
+        with pytest.raises(ValueError):
+            StackSpill(memory_limit=0)
+        with pytest.raises(ValueError):
+            StackSpill(memory_limit=4, block_size=5)
+        with pytest.raises(TypeError):
+            StackSpill(memory_limit=4.5)
+
+
+class TestFromIter:
+    def test_generator_capacity(self) -> None:
+        stack = StackLL(3, (i for i in range(3)))
+        assert stack.peek() == 2
+        with pytest.raises(AssertionError):
+            Stack(3, (i for i in range(4)))
+
+    @pytest.mark.parametrize("cls", [Stack, StackLL])
+    def test_block(self, cls) -> None:
+        stack = cls.from_iter(iter(range(5)), 3, on_overflow="block")
+        assert stack.pop() == 2
+        assert stack.peek() == 3, "the next element should be pulled from the source"
+        assert [stack.pop() for _ in range(4)] == [3, 4, 1, 0]
+        assert type(stack) is cls
+
+
+class TestMinMaxStack:
+    @pytest.mark.parametrize("key", [None, abs])
+    def test_extrema(self, key) -> None:
+        rng = random.Random(7)
+        stack = MinMaxStack(vals=(i for i in [3, -3, 1]), key=key)
+        expected = [3, -3, 1]
+        for _ in range(2000):
+            if expected and rng.random() < 0.45:
+                assert stack.pop() == expected.pop()
+            else:
+                element = rng.randint(-5, 5)
+                stack.push(element)
+                expected.append(element)
+
+            if expected:
+                k = key or (lambda x: x)
+                assert k(stack.min()) == k(min(expected, key=key))
+                assert k(stack.max()) == k(max(expected, key=key))
+
+        stack.delete()
+        with pytest.raises(AssertionError):
+            stack.max()
+        assert stack.push(2).min() == 2
+        with pytest.raises(TypeError):
+            MinMaxStack(key=1)
+
+
+class TestStackCirc:
+    def test_drop_oldest(self) -> None:
+        evicted = []
+        stack = StackCirc(4, vals=range(3), on_evict=evicted.append)
+        assert not stack.full() and stack.peek() == 2
+
+        for i in range(3, 10):
+            stack.push(i)
+        assert evicted == [0, 1, 2, 3, 4, 5] and stack.evicted == 6
+        assert stack.full() and len(stack) == 4
+        assert list(stack) == [6, 7, 8, 9] and 6 in stack and 5 not in stack
+        assert stack.peek(3) == [9, 8, 7] and stack.peek(10) == [9, 8, 7, 6]
+
+        assert stack.pop() == 9 and stack.pop() == 8
+        stack.push("a").push("b").push("c")
+        assert evicted[-1] == 6 and list(stack) == [7, "a", "b", "c"]
+        assert [stack.pop() for _ in range(4)] == ["c", "b", "a", 7]
+        assert stack.empty() and stack.peek(2) == []
+
+        with pytest.raises(AssertionError):
+            stack.pop()
+        with pytest.raises(AssertionError):
+            stack.peek()
+
+    def test_against_list(self) -> None:
+        rng = random.Random(3)
+        stack = StackCirc(5)
+        expected = []
+        for i in range(2000):
+            if expected and rng.random() < 0.4:
+                assert stack.pop() == expected.pop()
+            else:
+                stack.push(i)
+                expected = (expected + [i])[-5:]
+            assert list(stack) == expected
+            assert stack.peek(3) == expected[::-1][:3]
+
+        stack.delete()
+        assert len(stack) == 0 and list(stack) == []
+
+    def test_params(self) -> None:
+        with pytest.raises(TypeError):
+            StackCirc(None)
+        with pytest.raises(ValueError):
+            StackCirc(0)
+        with pytest.raises(TypeError):
+            StackCirc(3, on_evict=1)
+        with pytest.raises(TypeError):
+            StackCirc(3).peek("2")
+        with pytest.raises(ValueError):
+            StackCirc(3).peek(-1)
+
+
+class TestBulkExport:
+    @pytest.mark.parametrize("make", [lambda: Stack(), lambda: StackLL(), lambda: StackCirc(4)])
+    def test_drain(self, make) -> None:
+        stack = make()
+        for i in range(6):
+            if stack.full():
+                stack.pop()
+            stack.push(i)
+        values = stack.to_list()
+        assert values == list(stack._values())
+        assert stack.to_array("l").tolist() == values
+        assert stack.drain(0) == [] and stack.drain(2) == values[::-1][:2]
+        assert stack.to_list() == values[:-2]
+        assert stack.drain() == values[:-2][::-1] and stack.empty()
+
+        with pytest.raises(TypeError):
+            stack.drain(1.5)
+        with pytest.raises(ValueError):
+            stack.drain(-2)
+
+    def test_ring_segments(self) -> None:
+        stack = StackCirc(4, vals=range(6))
+        assert stack.segments() == [[2, 3], [4, 5]] and stack.to_list() == [2, 3, 4, 5]
+        assert stack.drain(3) == [5, 4, 3] and stack.segments() == [[2]]
+        assert stack._elements.count(None) == 3, "drained slots shouldn't keep their elements alive"
+        assert StackCirc(2).segments() == []
+
+        fed = Stack.from_iter(range(10), capacity=3, on_overflow="block")
+        assert fed.drain(4) == [2, 3, 4, 5] and fed.to_list() == [0, 1, 6]
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+from Implementations.TimingWheels import TimingWheel
+
+
+class TestTimingWheel:
+    @pytest.mark.parametrize("levels", [1, 2, 3])
+    def test_expiry(self, levels) -> None:
+        rng = random.Random(levels)
+        wheel = TimingWheel(tick=1, slots=4, levels=levels)
+        deadlines, timers = {}, {}
+        fired, cancelled = {}, set()
+        for now in range(300):
+            # Keep scheduling while the wheel turns, some far beyond its range.
+            for _ in range(5):
+                item = len(deadlines)
+                delay = rng.choice([0, 1, rng.randint(0, 20), rng.randint(0, 200)])
+                # Expires on the first advance() at or after its deadline.
+                deadlines[item] = max(now + delay, now + 1)
+                timers[item] = wheel.schedule(delay, item)
+            for item in rng.sample(list(timers), 2):
+                if wheel.cancel(timers[item]):
+                    cancelled.add(item)
+
+            for item in wheel.advance(now + 1):
+                fired[item] = now + 1
+
+        for item in range(len(deadlines)):
+            if item in cancelled:
+                assert item not in fired, "cancelled timers should never expire"
+            elif deadlines[item] <= 300:
+                assert fired[item] == deadlines[item]
+            else:
+                assert item not in fired and timers[item].active
+        assert len(wheel) == sum(timer.active for timer in timers.values()) > 0
+
+    def test_cancel(self) -> None:
+        wheel = TimingWheel(tick=0.5, start=10)
+        timer = wheel.schedule(1, "a")
+        wheel.schedule(1.2, "b")
+        assert len(wheel) == 2 and timer.deadline == 11
+        assert wheel.cancel(timer) and not wheel.cancel(timer)
+        assert not timer.active
+
+        assert wheel.advance(11) == []
+        assert wheel.advance(11.4) == []
+        assert wheel.advance(11.5) == ["b"], "timers expire at tick resolution, never early"
+        assert len(wheel) == 0
+        assert wheel.advance(1000) == []
+
+    def test_params(self) -> None:
+        with pytest.raises(ValueError):
+            TimingWheel(tick=0)
+        with pytest.raises(ValueError):
+            TimingWheel(slots=1)
+        with pytest.raises(ValueError):
+            TimingWheel(levels=0)
+
+        wheel = TimingWheel()
+        with pytest.raises(ValueError):
+            wheel.schedule(-1, "a")
+        wheel.advance(5)
+        with pytest.raises(ValueError):
+            wheel.advance(4)
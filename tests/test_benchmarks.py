@@ -0,0 +1,28 @@
+import pytest
+from benchmarks.cases import CASES
+from benchmarks.suite import compare, run_suite
+
+
+def test_run_suite() -> None:
+    cases = {"QueueCirc": CASES["QueueCirc"]}
+    results = run_suite([10], cases, calls=4, budget=0.01, repeat=1)
+
+    operations = {record["operation"] for record in results["timings"]}
+    assert operations == set(CASES["QueueCirc"][1])
+    assert all(record["seconds"] > 0 for record in results["timings"])
+    assert results["memory"][0]["size"] == 10
+
+
+def test_compare() -> None:
+    def timings(seconds):
+        return {
+            "timings": [
+                {"structure": "Stack", "operation": "pop", "size": 10, "seconds": seconds}
+            ]
+        }
+
+    assert compare(timings(1.0), timings(1.4), threshold=1.5) == []
+
+    regressions = compare(timings(1.0), timings(2.0), threshold=1.5)
+    assert len(regressions) == 1
+    assert regressions[0]["ratio"] == pytest.approx(2.0)
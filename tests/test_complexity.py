@@ -0,0 +1,40 @@
+import os
+
+import pytest
+from benchmarks.complexity import (
+    COMPLEXITY,
+    KNOWN_VIOLATIONS,
+    check_complexity,
+    fit_exponent,
+)
+
+
+def test_fit_exponent() -> None:
+    sizes = [10, 100, 1000]
+    assert fit_exponent(sizes, [1.0, 1.0, 1.0]) == pytest.approx(0.0)
+    assert fit_exponent(sizes, [1.0, 10.0, 100.0]) == pytest.approx(1.0)
+    assert fit_exponent(sizes, [1.0, 100.0, 10000.0]) == pytest.approx(2.0)
+
+    with pytest.raises(ValueError):
+        fit_exponent([10], [1.0])
+
+
+# The timing fits are slow and sensitive to the load of the machine, so they only run when asked for.
+@pytest.mark.skipif(
+    not os.environ.get("COMPLEXITY_CHECKS"), reason="set COMPLEXITY_CHECKS=1 to run the timing fits"
+)
+@pytest.mark.parametrize(
+    "structure, operation",
+    [
+        pytest.param(
+            *key,
+            marks=pytest.mark.xfail(reason="known linear operation", strict=True),
+        )
+        if key in KNOWN_VIOLATIONS
+        else key
+        for key in COMPLEXITY
+    ],
+)
+def test_complexity(structure, operation) -> None:
+    ok, exponent, declared = check_complexity(structure, operation)
+    assert ok, f"{structure}.{operation} is declared {declared} but grows as n^{exponent:.2f}"